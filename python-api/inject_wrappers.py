@@ -33,7 +33,7 @@ from pathlib import Path
 from typing import Callable, Dict, Iterable, List, Text
 
 import mds
-from mds import MDSTypeInfo, MDSPrimitiveTypeInfo, MDSArrayTypeInfo
+from mds import MDSTypeInfo, MDSPrimitiveTypeInfo, MDSIntegralTypeInfo, MDSArrayTypeInfo
 
 TYPE_GROUPINGS = {
     'Primitives': mds.typing.primitives,
@@ -267,7 +267,7 @@ def tmpl_api_namespaces_arrays(t: MDSArrayTypeInfo) -> str:
     return compiled
 
 def tmpl_namespace_mapping(t: MDSTypeInfo) -> str:
-    compiled = f"            {t.dtype}: {t.title_name_binding},\n"
+    compiled = f"    {t.dtype}.kind_id: {t.title_name_binding},\n"
     return compiled
 
 def tmpl_namespace_typed_primitive_bindings(t: MDSPrimitiveTypeInfo) -> str:
@@ -290,7 +290,40 @@ cdef class {t.title_name_binding}(MDSTypedNameBinding):
             h_istring_t nhandle = self._name._ish
             h_namespace_t ns = self._namespace._handle
 
+        self._namespace._forget_child(self._name)
         ns.{t.f_bind}(nhandle, <{t.c_type}> val.python_type)
+
+    cdef list _checked(self, list values):
+        # Converting goes through the usual bounds checks
+        return [v if isinstance(v, {t.title}) else {t.title}(v) for v in values]
+
+    cdef _bind_all(self, list names, list values):
+        cdef:
+            h_namespace_t ns = self._namespace._handle
+            {t.title} val
+            String name
+            Py_ssize_t i
+
+        for i in range(len(names)):
+            name = names[i]
+            val = values[i]
+            self._namespace._forget_child(name)
+            ns.{t.f_bind}(name._ish, {t.f_to_core_val}(val._type))
+
+    cdef list _lookup_all(self, list names):
+        cdef:
+            h_namespace_t ns = self._namespace._handle
+            {t.primitive} thandle = self._type
+            list retval = []
+            String name
+
+        for name in names:
+            try:
+                retval.append({t.title}(ns.{t.f_lookup}(name._ish, thandle)))
+            except:  # unbound_name_ex
+                retval.append(None)
+
+        return retval
 """
     return compiled
 
@@ -317,7 +350,46 @@ cdef class {t.title_name_binding}(MDSTypedNameBinding):
             h_istring_t nhandle = self._name._ish
             h_namespace_t ns = self._namespace._handle
 
+        self._namespace._forget_child(self._name)
         ns.{t.f_bind}(nhandle, val._handle)
+
+    cdef list _checked(self, list values):
+        for value in values:
+            if not isinstance(value, {t.title}):
+                raise TypeError(f"Can't bind `{{type(value).__name__}}` as {t.title}")
+
+        return values
+
+    cdef _bind_all(self, list names, list values):
+        cdef:
+            h_namespace_t ns = self._namespace._handle
+            {t.title} val
+            String name
+            Py_ssize_t i
+
+        for i in range(len(names)):
+            name = names[i]
+            val = values[i]
+            self._namespace._forget_child(name)
+            ns.{t.f_bind}(name._ish, val._handle)
+
+    cdef list _lookup_all(self, list names):
+        cdef:
+            h_namespace_t ns = self._namespace._handle
+            {t.array} thandle
+            {t.title} found
+            list retval = []
+            String name
+
+        for name in names:
+            try:
+                found = {t.title}()
+                found._handle = ns.{t.f_lookup_array}(name._ish, thandle)
+                retval.append(found)
+            except:  # unbound_name_ex
+                retval.append(None)
+
+        return retval
 """
     return compiled
 
@@ -373,15 +445,81 @@ cdef class {t.title_record_field}(MDSRecordFieldBase):
     @staticmethod
     def get_reference_type() -> type:
         return {t.title_record_field_reference}
+
+    @staticmethod
+    def get_array_type() -> type:
+        return {t.title_array}
+
+    cdef object _read(self, h_mrecord_t& record):
+        cdef {t.c_type} retval = self._handle.frozen_read(record)
+        return retval
+
+    cdef object _peek(self, h_mrecord_t& record):
+        cdef {t.c_type} retval = self._handle.free_read(record)
+        return retval
+
+    cdef _write(self, h_mrecord_t& record, value):
+        self._handle.write(record, <{t.c_type}> value)
+
+    cdef MDSArrayBuffer _gather(self, vector[h_mrecord_t]& records):
+        cdef:
+            {t.record_field} handle = self._handle
+            size_t i, n = records.size()
+            MDSArrayBuffer retval = MDSArrayBuffer(n, sizeof({t.c_type}), b"{t.buffer_format}", {t.dtype})
+            {t.c_type}* data = <{t.c_type}*> retval._data
+
+        with nogil:
+            for i in range(n):
+                data[i] = handle.frozen_read(records[i])
+
+        return retval
+"""
+
+    # vector<bool> has no data(), so bool columns keep the generic path
+    if t.is_arithmetic:
+        compiled += f"""
+    cdef _scatter(self, vector[h_mrecord_t]& records, values):
+        cdef:
+            {t.record_field} handle = self._handle
+            const {t.c_type}[::1] src
+            const {t.c_type}* data
+            vector[{t.c_type}] staged
+            size_t i, n = records.size()
+
+        if not n:
+            return
+
+        try:
+            src = values
+            data = &src[0]
+        except (BufferError, TypeError, ValueError):
+            # Conversion range checks each value against {t.c_type}
+            staged = values.tolist() if hasattr(values, "tolist") else list(values)
+            data = staged.data()
+
+        with nogil:
+            for i in range(n):
+                handle.write(records[i], data[i])
 """
     return compiled
 
 def tmpl_record_field_arrays(t: MDSArrayTypeInfo) -> str:
+    ctor_args = attrs = cinit = ""
+
+    if t.elt.is_record:
+        # Arrays of records carry the Record subclass of their elements
+        ctor_args = "record_type=self._record_type"
+        attrs = "\n        type _record_type"
+        cinit = """
+    def __cinit__(self, type record_type=None):
+        self._record_type = record_type
+"""
+
     compiled = f"""
 cdef class {t.title_record_field}(MDSRecordFieldBase):
     cdef:
-        {t.record_field} _handle
-
+        {t.record_field} _handle{attrs}
+{cinit}
     def declare(self, String name, MDSRecordTypeDeclaration rt):
         assert self._handle.is_null()
         print("?> Attempting to get a handle from {t.const_primitive}.field_in")
@@ -390,6 +528,20 @@ cdef class {t.title_record_field}(MDSRecordFieldBase):
     @staticmethod
     def get_reference_type() -> type:
         return {t.title_record_field_reference}
+
+    cdef object _read(self, h_mrecord_t& record):
+        cdef {t.title} retval = {t.title}({ctor_args})
+        retval._handle = {t.f_downcast_marray}(self._handle.frozen_read(record))
+        return retval
+
+    cdef object _peek(self, h_mrecord_t& record):
+        cdef {t.title} retval = {t.title}({ctor_args})
+        retval._handle = {t.f_downcast_marray}(self._handle.free_read(record))
+        return retval
+
+    cdef _write(self, h_mrecord_t& record, value):
+        cdef {t.title} array = value
+        self._handle.write(record, array._handle)
 """
     return compiled
 
@@ -415,6 +567,7 @@ cdef class {t.title_record_field_reference}(MDSRecordFieldReferenceBase):
         return retval
 
     def write(self, value):
+        self._check_writable()
         self._field_handle.write(self._record_handle, <{t.c_type}> (value))
 """
 
@@ -422,15 +575,19 @@ cdef class {t.title_record_field_reference}(MDSRecordFieldReferenceBase):
         compiled += f"""
 
     def __iadd__(self, other):
+        self._check_writable()
         self._field_handle.add(self._record_handle, <{t.c_type}> (other))
 
     def __isub__(self, other):
+        self._check_writable()
         self._field_handle.sub(self._record_handle, <{t.c_type}> (other))
 
     def __imul__(self, other):
+        self._check_writable()
         self._field_handle.mul(self._record_handle, <{t.c_type}> (other))
 
     def __itruediv__(self, other):
+        self._check_writable()
         self._field_handle.div(self._record_handle, <{t.c_type}> (other))
 """
 
@@ -441,33 +598,24 @@ def tmpl_record_field_reference_arrays(t: MDSArrayTypeInfo) -> str:
 cdef class {t.title_record_field_reference}(MDSRecordFieldReferenceBase):
     cdef:
         {t.record_field} _field_handle
+        {t.title_record_field} _field
         Record _record
 
     def __cinit__(self, {t.title_record_field} field, Record record):
         self._record = record
+        self._field = field
         self._field_handle = {t.record_field}(field._handle)
         self._record_handle = h_mrecord_t(record._handle)
 
     def read(self):
-        cdef:
-            h_marray_base_t mbah = self._field_handle.frozen_read(self._record_handle)
-            {t.managed_array} handle = {t.f_downcast_marray}(mbah)
-            {t.title} retval = {t.title}()
-
-        retval._handle = handle
-        return retval
+        return self._field._read(self._record_handle)
 
     def peek(self):
-        cdef:
-            h_marray_base_t mbah = self._field_handle.free_read(self._record_handle)
-            {t.managed_array} handle = {t.f_downcast_marray}(mbah)
-            {t.title} retval = {t.title}()
-
-        retval._handle = handle
-        return retval
+        return self._field._peek(self._record_handle)
 
     def write(self, {t.title} value):
         cdef {t.managed_array} handle = value._handle
+        self._check_writable()
         self._field_handle.write(self._record_handle, handle)
 """
 
@@ -477,72 +625,53 @@ cdef class {t.title_record_field_reference}(MDSRecordFieldReferenceBase):
 def tmpl_record_member_primitives(t: MDSPrimitiveTypeInfo) -> str:
     compiled = f"""
 cdef class {t.title_record_member}(MDSRecordMemberBase):
-
-    def _field_ref(self) -> MDSRecordFieldReferenceBase:
-        return {t.title_record_field}()[self]
-
-    def read(self):
-        return self._field_ref().read()
-
-    def write(self, value) -> None:
-        self._field_ref().write(<{t.c_type}> value);
 """
 
     if t.is_arithmetic:
-        compiled += f"""
-    def __iadd__(self, other):
-        ref = self._field_ref()
-        ref += other
-
-    def __isub__(self, other):
-        ref = self._field_ref()
-        ref -= other
-
-    def __imul__(self, other):
-        ref = self._field_ref()
-        ref *= other
-
-    def __itruediv__(self, other):
-        ref = self._field_ref()
-        ref /= other
-"""
+        compiled += tmpl_record_member_inplace_ops(t)
+    else:
+        compiled += "    pass\n"
 
     return compiled
 
 def tmpl_record_member_arrays(t: MDSArrayTypeInfo) -> str:
     compiled = f"""
 cdef class {t.title_record_member}(MDSRecordMemberBase):
+    pass
+"""
 
-    def _field_ref(self) -> MDSRecordFieldReferenceBase:
-        return {t.title_record_field}()[self]
-
-    def read(self):
-        return self._field_ref().read()
-
-    def peek(self):
-        return self._field_ref().peek()
+    return compiled
 
-    def write(self, value) -> None:
-        self._field_ref().write(value);
-"""
+def tmpl_record_field_registry(t: MDSTypeInfo) -> str:
+    compiled = f"    {t.dtype}: ({t.title_record_field}, {t.title_record_member}),\n"
+    return compiled
 
-    if t.is_arithmetic:
-        compiled += f"""
+def tmpl_record_member_inplace_ops(t: MDSPrimitiveTypeInfo) -> str:
+    # These return self, so `record.field += x` leaves the member in place
+    compiled = f"""
     def __iadd__(self, other):
+        self._check_writable()
         ref = self._field_ref()
         ref += other
+        return self
 
     def __isub__(self, other):
+        self._check_writable()
         ref = self._field_ref()
         ref -= other
+        return self
 
     def __imul__(self, other):
+        self._check_writable()
         ref = self._field_ref()
         ref *= other
+        return self
 
     def __itruediv__(self, other):
+        self._check_writable()
         ref = self._field_ref()
         ref /= other
+        return self
 """
 
     return compiled
@@ -590,33 +719,115 @@ cdef class {t.title_array}({t.ARRAY}):
 
     def bind_to_namespace(self, Namespace namespace):
         pass  # TODO: See how these properly bind
+
+    def __iter__(self):
+        return {t.title_array_iterator}(self)
+
+    def iterate(self, size_t chunk=0):
+        return {t.title_array_iterator}(self, chunk)
+
+    def to_buffer(self) -> MDSArrayBuffer:
+        cdef:
+            {t.managed_array} handle = self._handle
+            size_t i, n = handle.size()
+            MDSArrayBuffer retval = MDSArrayBuffer(n, sizeof({t.c_type}), b"{t.buffer_format}", {t.dtype})
+            {t.c_type}* data = <{t.c_type}*> retval._data
+
+        with nogil:
+            for i in range(n):
+                data[i] = {t.f_to_core_val}(handle.frozen_read(i))
+
+        return retval
+
+    def copy(self):
+        cdef:
+            {t.managed_array} handle = self._handle
+            size_t i, n = handle.size()
+            {t.title_array} retval = {t.title_array}(length=n)
+            {t.managed_array} dest = retval._handle
+
+        with nogil:
+            for i in range(n):
+                dest.write(i, handle.frozen_read(i))
+
+        return retval
 """
 
-    if t.is_arithmetic:
+    if t.is_integral:
+        compiled += tmpl_array_bounds(t)
+    elif t.is_floating:
         compiled += f"""
     def _numeric_bounds_check(self, value):
         prim = {t.title}(value)
         return prim.python_value
 
-    def _to_python(self, index):
-        return {t.f_to_core_val}(self._handle.frozen_read(index))
-
     def _to_mds(self, index, value):
         # Delegate bounds checking etc. to the primitive wrapper
         wrapped = self._primitive(value)
         self._handle.write(index, {t.managed_value}(value))
+"""
 
-    def copy(self):
+    if t.is_arithmetic:
+        compiled += f"""
+    def _to_python(self, index):
+        return {t.f_to_core_val}(self._handle.frozen_read(index))
+
+    def read_range(self, start: int, stop: int, out=None):
         cdef:
-            size_t i = 0
-            size_t n = len(self)
+            {t.managed_array} handle = self._handle
+            {t.c_type}[::1] dest
+            {t.c_type}* data
+            size_t i, lo, hi, n
 
-        retval = {t.title_array}(length=len(self))
+        lo, hi = self._range_bounds_check(start, stop)
+        n = hi - lo
 
-        for i in range(n):
-            retval[i] = self[i]
+        if out is None:
+            out = MDSArrayBuffer(n, sizeof({t.c_type}), b"{t.buffer_format}", {t.dtype})
+            data = <{t.c_type}*> (<MDSArrayBuffer> out)._data
+        else:
+            dest = out
 
-        return retval
+            if <size_t> dest.shape[0] < n:
+                raise ValueError(f"`out` holds {{dest.shape[0]}} elements, {{n}} required")
+            if not n:
+                return out
+
+            data = &dest[0]
+
+        with nogil:
+            for i in range(n):
+                data[i] = {t.f_to_core_val}(handle.frozen_read(lo + i))
+
+        return out
+
+    def write_range(self, start: int, values) -> None:
+        cdef:
+            {t.managed_array} handle = self._handle
+            const {t.c_type}[::1] src
+            const {t.c_type}* data
+            size_t i, lo, hi, n
+
+        try:
+            src = values
+        except (BufferError, TypeError, ValueError):
+            # Not a buffer of exactly this element type, so take the slow path
+            self._write_elements(start, values)
+            return
+
+        lo, hi = self._range_bounds_check(start)
+        n = src.shape[0]
+
+        if n > hi - lo:
+            raise IndexError('list range out of range')
+        if not n:
+            return
+
+        data = &src[0]
+
+        with nogil:
+            for i in range(n):
+                handle.write(lo + i, {t.managed_value}(data[i]))
 
     def __iadd__(self, other):
         return self._handle.add(self._last_index, <{t.c_type}> other)
@@ -630,6 +841,408 @@ cdef class {t.title_array}({t.ARRAY}):
     def __itruediv__(self, other):
         return self._handle.div(self._last_index, <{t.c_type}> other)
 """
+        compiled += tmpl_array_aggregates(t)
+        compiled += tmpl_array_elementwise(t)
+    else:
+        # Bools have no C buffer type of their own, so `out` and bulk sources
+        # are bytes, as NumPy and array("B") hold them
+        compiled += f"""
+    def read_range(self, start: int, stop: int, out=None):
+        cdef:
+            {t.managed_array} handle = self._handle
+            uint8_t[::1] dest
+            uint8_t* data
+            size_t i, lo, hi, n
+
+        lo, hi = self._range_bounds_check(start, stop)
+        n = hi - lo
+
+        if out is None:
+            out = MDSArrayBuffer(n, sizeof({t.c_type}), b"{t.buffer_format}", {t.dtype})
+            data = <uint8_t*> (<MDSArrayBuffer> out)._data
+        else:
+            dest = out
+
+            if <size_t> dest.shape[0] < n:
+                raise ValueError(f"`out` holds {{dest.shape[0]}} elements, {{n}} required")
+            if not n:
+                return out
+
+            data = &dest[0]
+
+        with nogil:
+            for i in range(n):
+                data[i] = {t.f_to_core_val}(handle.frozen_read(lo + i))
+
+        return out
+
+    def write_range(self, start: int, values) -> None:
+        cdef:
+            {t.managed_array} handle = self._handle
+            const uint8_t[::1] src
+            const uint8_t* data
+            size_t i, lo, hi, n
+
+        try:
+            src = values
+        except (BufferError, TypeError, ValueError):
+            self._write_elements(start, values)
+            return
+
+        lo, hi = self._range_bounds_check(start)
+        n = src.shape[0]
+
+        if n > hi - lo:
+            raise IndexError('list range out of range')
+        if not n:
+            return
+
+        data = &src[0]
+
+        with nogil:
+            for i in range(n):
+                handle.write(lo + i, {t.managed_value}(data[i] != 0))
+"""
+
+    compiled += f"""
+
+cdef class {t.title_array_iterator}(object):
+    cdef:
+        {t.title_array} _array
+        {t.managed_array} _handle
+        size_t _index
+        size_t _size
+        size_t _chunk
+        size_t _chunk_start
+        vector[{t.c_type}] _prefetched
+
+    def __cinit__(self, {t.title_array} array, size_t chunk=0):
+        self._array = array
+        self._handle = array._handle
+        self._index = 0
+        self._size = self._handle.size()
+        self._chunk = chunk
+        self._chunk_start = 0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        cdef:
+            size_t i, n
+            {t.c_type} retval
+
+        if self._index >= self._size:
+            raise StopIteration
+
+        if not self._chunk:
+            retval = {t.f_to_core_val}(self._handle.frozen_read(self._index))
+        else:
+            if self._index >= self._chunk_start + self._prefetched.size():
+                n = min(self._chunk, self._size - self._index)
+                self._chunk_start = self._index
+                self._prefetched.resize(n)
+
+                with nogil:
+                    for i in range(n):
+                        self._prefetched[i] = {t.f_to_core_val}(self._handle.frozen_read(self._chunk_start + i))
+
+            retval = self._prefetched[self._index - self._chunk_start]
+
+        self._index += 1
+        return retval
+"""
+
+    return compiled
+
+def tmpl_array_bounds(t: MDSIntegralTypeInfo) -> str:
+    """
+    Integral arrays validate against C limits of the element type, so writes
+    never need to build a primitive wrapper.
+    """
+    limit = t.c_type[:-2].upper()
+    lo = f"{limit}_MIN" if t.bounds.min < 0 else "0"
+    hi = f"{limit}_MAX"
+
+    compiled = f"""
+    def _numeric_bounds_check(self, value):
+        return _check_integral(value, {lo}, {hi}, {t.dtype})
+
+    def _to_mds(self, index, value):
+        self._handle.write(index, {t.managed_value}(<{t.c_type}> value))
+
+    def validate(self, values) -> None:
+        cdef:
+            const {t.c_type}[::1] src
+            Py_ssize_t i
+
+        try:
+            src = values
+            return  # Every element of a buffer of this type is in bounds
+        except (BufferError, TypeError, ValueError):
+            pass
+
+        if _validate_wide(values, {lo}, {hi}, {t.dtype}):
+            return
+
+        # Other buffers (NumPy especially) hand back native Python values this way
+        values = values.tolist() if hasattr(values, "tolist") else values
+
+        for i, value in enumerate(values):
+            _check_integral(value, {lo}, {hi}, {t.dtype}, i)
+
+    def _write_elements(self, start: int, values) -> None:
+        cdef:
+            {t.managed_array} handle = self._handle
+            size_t i, lo, hi, n
+            vector[{t.c_type}] staged
+
+        values = values.tolist() if hasattr(values, "tolist") else list(values)
+        lo, hi = self._range_bounds_check(start)
+        n = len(values)
+
+        if n > hi - lo:
+            raise IndexError('list range out of range')
+
+        # Everything is validated before the first write
+        staged.resize(n)
+
+        for i in range(n):
+            staged[i] = _check_integral(values[i], {lo}, {hi}, {t.dtype}, i)
+
+        with nogil:
+            for i in range(n):
+                handle.write(lo + i, {t.managed_value}(staged[i]))
+"""
+
+    return compiled
+
+def tmpl_array_aggregates(t: MDSPrimitiveTypeInfo) -> str:
+    """
+    The native kernels behind MDSNumericArrayBase. Integral sums accumulate in
+    64 bits of matching signedness and only spill into a Python int when that
+    would overflow; floating sums accumulate in a double.
+    """
+    spill = """
+                if {}:
+                    with gil:
+                        total += acc
+
+                    acc = 0
+"""
+
+    # Targets are compared in double for floating arrays, as Python would
+    # compare the widened elements
+    cmp_type = t.c_type
+
+    if t.is_floating:
+        acc_type = "double"
+        cmp_type = "double"
+        spill = ""
+    elif t.bounds.min < 0:
+        acc_type = "int64_t"
+        spill = spill.format("(v > 0 and acc > INT64_MAX - v) or (v < 0 and acc < INT64_MIN - v)")
+    else:
+        acc_type = "uint64_t"
+        spill = spill.format("acc > UINT64_MAX - v")
+
+    compiled = f"""
+    def _sum(self):
+        cdef:
+            {t.managed_array} handle = self._handle
+            size_t i, n = handle.size()
+            {acc_type} acc = 0, v
+
+        total = 0
+
+        with nogil:
+            for i in range(n):
+                v = {t.f_to_core_val}(handle.frozen_read(i))
+{spill}
+                acc += v
+
+        return total + acc
+
+    def _arg_extreme(self, bint largest):
+        cdef:
+            {t.managed_array} handle = self._handle
+            size_t i, best = 0, n = handle.size()
+            {t.c_type} v, current = {t.f_to_core_val}(handle.frozen_read(0))
+
+        with nogil:
+            for i in range(1, n):
+                v = {t.f_to_core_val}(handle.frozen_read(i))
+
+                if (v > current) if largest else (v < current):
+                    best = i
+                    current = v
+
+        return best, current
+
+    def _count(self, value):
+        cdef:
+            {t.managed_array} handle = self._handle
+            size_t i, c = 0, n = handle.size()
+            {cmp_type} target
+
+        try:
+            target = self._comparable(value)
+        except OverflowError:
+            return 0  # Out of range for this array, so can't be in it
+        except TypeError:
+            return sum(1 for v in self if v == value)
+
+        with nogil:
+            for i in range(n):
+                if {t.f_to_core_val}(handle.frozen_read(i)) == target:
+                    c += 1
+
+        return c
+
+    def _find(self, value, size_t start, size_t stop):
+        cdef:
+            {t.managed_array} handle = self._handle
+            size_t i
+            Py_ssize_t found = -1
+            {cmp_type} target
+
+        try:
+            target = self._comparable(value)
+        except OverflowError:
+            return found
+        except TypeError:
+            for i in range(start, stop):
+                if self[i] == value:
+                    return i
+
+            return found
+
+        with nogil:
+            for i in range(start, stop):
+                if {t.f_to_core_val}(handle.frozen_read(i)) == target:
+                    found = i
+                    break
+
+        return found
+
+    def _where(self, value):
+        cdef:
+            {t.managed_array} handle = self._handle
+            size_t i, n = handle.size()
+            vector[uint64_t] found
+            {cmp_type} target
+            MDSArrayBuffer retval
+            uint64_t* data
+
+        try:
+            target = self._comparable(value)
+        except OverflowError:
+            n = 0
+        except TypeError:
+            for i in range(n):
+                if self[i] == value:
+                    found.push_back(i)
+
+            n = 0
+
+        with nogil:
+            for i in range(n):
+                if {t.f_to_core_val}(handle.frozen_read(i)) == target:
+                    found.push_back(i)
+
+        n = found.size()
+        retval = MDSArrayBuffer(n, sizeof(uint64_t), b"Q", mds.typing.primitives.ulong)
+        data = <uint64_t*> retval._data
+
+        for i in range(n):
+            data[i] = found[i]
+
+        return retval
+"""
+
+    return compiled
+
+def tmpl_array_elementwise(t: MDSPrimitiveTypeInfo) -> str:
+    """
+    Array-wide arithmetic for MDSNumericArrayBase. Scalars go through the
+    same checks as assigning a single element would.
+    """
+    to_operand = "self._numeric_bounds_check({})" if t.is_integral else "{}"
+    lower, upper = "lower", "upper"
+
+    if t.is_integral:
+        # A clip bound beyond the element type's range holds for every element
+        # already, so it's saturated rather than range checked
+        lower = f"max(lower, {t.bounds.min})"
+        upper = f"min(upper, {t.bounds.max})"
+
+    compiled = f"""
+    def _elementwise(self, int op, other):
+        cdef:
+            {t.managed_array} handle = self._handle
+            {t.managed_array} rhs
+            size_t i, n = handle.size()
+            bint from_array = isinstance(other, {t.title_array})
+            int status = 0
+            {t.c_type} b
+            vector[{t.c_type}] results
+
+        if from_array:
+            self._check_operand(other)
+            rhs = (<{t.title_array}> other)._handle
+        else:
+            b = {to_operand.format("other")}
+
+        results.resize(n)
+
+        with nogil:
+            for i in range(n):
+                if from_array:
+                    b = {t.f_to_core_val}(rhs.frozen_read(i))
+
+                status = apply_elementwise[{t.c_type}](op, {t.f_to_core_val}(handle.frozen_read(i)), b, &results[i])
+
+                if status:
+                    break
+
+        if status:
+            self._elementwise_failed(status, i)
+
+        with nogil:
+            for i in range(n):
+                handle.write(i, {t.managed_value}(results[i]))
+
+    def _fill(self, value):
+        cdef:
+            {t.managed_array} handle = self._handle
+            size_t i, n = handle.size()
+            {t.c_type} v = {to_operand.format("value")}
+
+        with nogil:
+            for i in range(n):
+                handle.write(i, {t.managed_value}(v))
+
+    def _clip(self, lower, upper):
+        cdef:
+            {t.managed_array} handle = self._handle
+            size_t i, n = handle.size()
+            bint has_lower = lower is not None, has_upper = upper is not None
+            {t.c_type} lo = 0, hi = 0, v
+
+        if has_lower:
+            lo = {to_operand.format(lower)}
+        if has_upper:
+            hi = {to_operand.format(upper)}
+
+        with nogil:
+            for i in range(n):
+                v = {t.f_to_core_val}(handle.frozen_read(i))
+
+                if has_lower and v < lo:
+                    handle.write(i, {t.managed_value}(lo))
+                elif has_upper and v > hi:
+                    handle.write(i, {t.managed_value}(hi))
+"""
 
     return compiled
 
@@ -29,6 +29,14 @@ from typing import Dict, Text
 Bounds = namedtuple("Bounds", ["min", "max"])
 MDS_PREFIX = "MDS"
 
+# Each type gets a small integer id (its position here, offset by the number
+# of kinds for arrays), so generated code can dispatch on type by indexing
+KINDS = (
+    "bool", "byte", "ubyte", "short", "ushort", "int", "uint", "long", "ulong",
+    "float", "double", "string", "record"
+)
+KIND_COUNT = 2 * len(KINDS)
+
 
 class MDSTypeInfo():
     """
@@ -41,10 +49,12 @@ class MDSTypeInfo():
         # api is the MDS name, the typename you'd use in C++ etc.
         self.api = api
         self.kind = "mds::api::kind::{}".format(api.upper())
+        self.kind_id = KINDS.index(api)
         self.title = self._format_title(api.title())
 
         # Python object names
         self.title_array = f"{self.title}Array"
+        self.title_array_iterator = f"{MDS_PREFIX}{self.title}ArrayIterator"
         self.title_name_binding = f"{MDS_PREFIX}{self.title}NameBinding"
         self.title_record_field = f"{MDS_PREFIX}{self.title}RecordField"
         self.title_record_field_reference = f"{MDS_PREFIX}{self.title}RecordFieldReference"
@@ -134,11 +144,27 @@ class MDSPrimitiveTypeInfo(MDSTypeInfo):
     ARRAY = f"{MDS_PREFIX}ArrayBase"
     PRIMITIVE = f"{MDS_PREFIX}PrimitiveBase"
 
+    # struct-module format characters, used when exporting the buffer protocol
+    BUFFER_FORMATS = {
+        "bool": "?",
+        "int8_t": "b",
+        "uint8_t": "B",
+        "int16_t": "h",
+        "uint16_t": "H",
+        "int32_t": "i",
+        "uint32_t": "I",
+        "int64_t": "q",
+        "uint64_t": "Q",
+        "float": "f",
+        "double": "d"
+    }
+
     def __init__(self, c_type: Text, py_type: type, **kwargs):
         super().__init__(**kwargs)
         self.c_type = c_type
         self.py_type_t = py_type
         self.py_type = py_type.__name__
+        self.buffer_format = self.BUFFER_FORMATS[c_type]
 
 
 class MDSBoolTypeInfo(MDSPrimitiveTypeInfo):
@@ -182,7 +208,7 @@ class MDSCompositeTypeInfo(MDSTypeInfo):
 class MDSRecordTypeInfo(MDSCompositeTypeInfo):
 
     def __getitem__(self, item: type):
-        retval = MDSRecordTypeInfo()
+        retval = MDSRecordTypeInfo(self.api)
         retval._derived = item
         return retval
 
@@ -212,6 +238,7 @@ class MDSArrayTypeInfo(MDSCompositeTypeInfo):
         self.c_type = self.managed_array
         self.elt = primitive
         self.kind = "mds::api::kind::ARRAY"
+        self.kind_id += len(KINDS)
         self.f_bind = self.f_bind_array
         self.record_field = self.array_record_field
         self.const_record_field = self.const_array_record_field
@@ -228,7 +255,7 @@ class MDSRecordArrayTypeInfo(MDSArrayTypeInfo):
         self._derived = None
 
     def __getitem__(self, item: type):
-        retval = MDSRecordArrayTypeInfo()
+        retval = MDSRecordArrayTypeInfo(primitive=self.elt)
         retval._derived = item
         return retval
 
@@ -292,7 +319,8 @@ class _MDSArrayTypes(_MDSTypesBase):
         data = dict()
 
         for api, t_info in chain(_MDSPrimitiveTypes().items(), _MDSCompositeTypes().items()):
-            data[t_info.api] = MDSArrayTypeInfo(primitive=t_info)
+            array_t = MDSRecordArrayTypeInfo if t_info.is_record else MDSArrayTypeInfo
+            data[t_info.api] = array_t(primitive=t_info)
 
         super().__init__(data)
 
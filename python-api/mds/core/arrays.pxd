@@ -36,7 +36,16 @@ cdef extern from "helpers.h":  # This is managed_array_base_type, only works lik
     cdef cppclass h_marray_base_t:
         h_marray_base_t()
 
-cdef extern from "helpers.h" namespace "mds::python::types":
+cdef extern from "helpers.h" namespace "mds::python::types::arrays" nogil:
+    cdef enum elementwise_op:
+        OP_ADD
+        OP_SUB
+        OP_MUL
+        OP_DIV
+
+    int apply_elementwise[T](int, T, T, T*)
+
+cdef extern from "helpers.h" namespace "mds::python::types" nogil:
 # START INJECTION | tmpl_api_arrays(Primitives,Composites)
 
     cdef cppclass h_array_bool_t "mds::api::array_type_handle<mds::api::kind::BOOL>":
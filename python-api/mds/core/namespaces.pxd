@@ -41,6 +41,8 @@ cdef extern from "mds_core_api.h" namespace "mds::api" nogil:
         bool is_bound(const h_istring_t&)
         bool is_null()
         namespace_handle child_namespace(const h_istring_t&, bool)
+        # Nothing enumerates the names: core::name_space keeps them in a
+        # private map (include/core/core_naming.h) with no iterator exposed
 
         @staticmethod
         namespace_handle _global "global"()
@@ -27,20 +27,17 @@ from libc.stdint cimport *
 from libcpp cimport bool
 
 from mds.core.records cimport *
-from mds.core.strings cimport h_istring_t, h_istring_t
+from mds.core.strings cimport h_istring_t, h_mstring_t
+
+# For composites, api_type<K> is the managed handle itself
+ctypedef h_mstring_t mv_string
+ctypedef h_mrecord_t mv_record
 
 cdef extern from "mds_core_api.h" namespace "mds::api" nogil:
     # TODO Not sure these guys are correct, or are the same as below...
-    # NOTE string at least could just go into the injection
-    cdef cppclass mv_string "mv_wrapper<mds::api::kind::STRING>":
-        pass
-
     cdef cppclass mv_array "mv_wrapper<mds::api::kind::ARRAY>":
         pass
 
-    cdef cppclass mv_record "mv_wrapper<mds::api::kind::RECORD>":
-        pass
-
 # START INJECTION | tmpl_api_primitives(Primitives)
 
     # BEGIN bool
@@ -61,6 +61,9 @@ cdef extern from "mds_core_api.h" namespace "mds::api" nogil:
         h_record_type_t super_type()
         h_record_type_t ensure_created()
 
+        # The record type is the managed type for fields holding its records
+        h_rfield_record_t field_in(h_record_type_t&, h_istring_t&, bool) except+
+
         @staticmethod
         h_record_type_t find(const h_istring_t&)
 
@@ -1035,3 +1038,9 @@ cdef extern from "mds_core_api.h" namespace "mds::api" nogil:
         h_record_type_t rec_type()
         #h_record_type_t<K> field_type()
 # END INJECTION
+
+cdef extern from "mds_core_api.h" namespace "mds::api" nogil:
+    cdef cppclass h_string_type_t "mds::api::managed_type_handle<mds::api::kind::STRING>":
+        h_string_type_t()
+        h_rfield_string_t field_in(h_record_type_t&, h_istring_t&, bool) except+
+        uint64_t hash1()
@@ -26,6 +26,8 @@
 
 #include <Python.h>
 #include <functional>
+#include <limits>
+#include <type_traits>
 #include <utility>
 #include "mds_core_api.h"
 
@@ -126,6 +128,59 @@ namespace mds {
       _TYPE_WRAPPER_(kind::RECORD, record, _MRECORD_HANDLE_)
       _TYPE_WRAPPER_(kind::STRING, string, _MSTRING_HANDLE_)
 
+
+      namespace arrays {
+        enum elementwise_op { OP_ADD = 0, OP_SUB, OP_MUL, OP_DIV };
+
+        template <typename T>
+        static inline int _apply_elementwise(int op, T a, T b, T *out, std::true_type) {
+          bool wrapped = false;
+
+          switch (op) {
+            case OP_ADD: wrapped = __builtin_add_overflow(a, b, out); break;
+            case OP_SUB: wrapped = __builtin_sub_overflow(a, b, out); break;
+            case OP_MUL: wrapped = __builtin_mul_overflow(a, b, out); break;
+            default:
+              if (b == 0) return 2;
+              if (std::is_signed<T>::value && b == T(-1) && a == std::numeric_limits<T>::min()) return 1;
+              *out = a / b;
+          }
+
+          if (! wrapped) return 0;
+
+          // Which way it went follows from the sign of the exact result
+          switch (op) {
+            case OP_ADD: return b > 0 ? 1 : -1;
+            case OP_SUB: return b > 0 ? -1 : 1;
+            default: return ((a < 0) != (b < 0)) ? -1 : 1;
+          }
+        }
+
+        template <typename T>
+        static inline int _apply_elementwise(int op, T a, T b, T *out, std::false_type) {
+          switch (op) {
+            case OP_ADD: *out = a + b; break;
+            case OP_SUB: *out = a - b; break;
+            case OP_MUL: *out = a * b; break;
+            default:
+              if (b == 0) return 2;
+              *out = a / b;
+          }
+
+          return 0;
+        }
+
+        /**
+         * Stores `a op b` in out, returning 0 on success, 1 if the result
+         * overflows T, -1 if it underflows T and 2 for a division by zero.
+         * Floating point results are never range checked.
+         */
+        template <typename T>
+        static inline int apply_elementwise(int op, T a, T b, T *out) {
+          return _apply_elementwise(op, a, b, out, std::is_integral<T>());
+        }
+      } // End mds::python::types::arrays
+
     } // End mds::python::types
   } // End mds::python
 } // End mds
@@ -23,14 +23,21 @@ Application during this compilation process under terms of your choice,
 provided you also meet the terms and conditions of the Application license.
 """
 
+from cpython.buffer cimport PyBUF_FORMAT, PyBUF_WRITABLE
+from cpython.object cimport Py_EQ, Py_GE, Py_GT, Py_LE, Py_LT, Py_NE, PyObject_RichCompare
+from cpython.unicode cimport PyUnicode_DecodeLatin1, PyUnicode_DecodeUTF8
+from libc.stdint cimport INT64_MAX, INT64_MIN, UINT64_MAX, int64_t, uint64_t
+from libc.math cimport trunc
+from libc.stdlib cimport free, malloc
 from libcpp cimport bool
 from libcpp.string cimport string
 from libcpp.vector cimport vector
 
+import array
 import threading
-from collections import defaultdict
-from itertools import chain
-from typing import Dict, Iterable, List, Optional, Text, Union
+from collections import OrderedDict, defaultdict, namedtuple
+from itertools import chain, islice
+from typing import Callable, Dict, Iterable, List, Optional, Text, Union
 
 import mds
 from mds import MDSTypeInfo, MDSArrayTypeInfo
@@ -82,6 +89,128 @@ cdef class MDSProxyObject(object):
 cdef class UnderflowError(Exception):
     pass
 
+
+cdef extern from "Python.h":
+    long long PyLong_AsLongLongAndOverflow(object, int*) except? -1
+
+
+cdef object _check_integral(object value, long long lo, unsigned long long hi, object dtype, Py_ssize_t index=-1):
+    """
+    Validates value against [lo, hi] with C comparisons, rather than building
+    a primitive wrapper to do it. Follows MDSIntPrimitiveBase: floats are
+    truncated, and the error names the index when one is given.
+    """
+    cdef:
+        int overflow
+        long long v
+        bint under, over
+
+    if isinstance(value, float):
+        value = int(value)
+    elif not isinstance(value, int):
+        t = type(value)
+        raise TypeError(f'Unable to parse value of type `{t}`')
+
+    v = PyLong_AsLongLongAndOverflow(value, &overflow)
+    under = overflow < 0 or (not overflow and v < lo)
+    over = (overflow > 0 and value > hi) or (not overflow and v > 0 and <unsigned long long> v > hi)
+
+    if under or over:
+        at = f" at index {index}" if index >= 0 else ""
+        msg = f"Can't fit {value}{at} in container {dtype}"
+        raise UnderflowError(msg) if under else OverflowError(msg)
+
+    return value
+
+cdef Py_ssize_t _scan_int64(const int64_t[::1] src, long long lo, unsigned long long hi) nogil:
+    cdef Py_ssize_t i
+
+    for i in range(src.shape[0]):
+        if src[i] < lo or (src[i] > 0 and <unsigned long long> src[i] > hi):
+            return i
+
+    return -1
+
+cdef Py_ssize_t _scan_uint64(const uint64_t[::1] src, unsigned long long hi) nogil:
+    cdef Py_ssize_t i
+
+    for i in range(src.shape[0]):
+        if src[i] > hi:
+            return i
+
+    return -1
+
+cdef Py_ssize_t _scan_double(const double[::1] src, Py_ssize_t start, long long lo, unsigned long long hi) nogil:
+    """
+    Floats are truncated, as _check_integral does. A 64-bit hi rounds up
+    when made a double, so elements equal to it are flagged too, and left
+    for _check_integral to decide.
+    """
+    cdef:
+        Py_ssize_t i
+        double t, lo_d = lo, hi_d = hi
+
+    for i in range(start, src.shape[0]):
+        t = trunc(src[i])
+
+        # NaN fails every comparison, so is flagged by the first
+        if t != t or t < lo_d or t > hi_d or (t == hi_d and hi_d >= 9007199254740992.0):
+            return i
+
+    return -1
+
+cdef bint _validate_wide(object values, long long lo, unsigned long long hi, object dtype) except -1:
+    """
+    Validates a buffer of int64, uint64 or double, the NumPy defaults, in a
+    native pass without the GIL. False if values isn't one of those.
+    """
+    cdef:
+        const int64_t[::1] signed
+        const uint64_t[::1] unsigned
+        const double[::1] floating
+        Py_ssize_t i = 0
+
+    try:
+        signed = values
+    except (BufferError, TypeError, ValueError):
+        pass
+    else:
+        with nogil:
+            i = _scan_int64(signed, lo, hi)
+
+        if i >= 0:
+            _check_integral(signed[i], lo, hi, dtype, i)
+
+        return True
+
+    try:
+        unsigned = values
+    except (BufferError, TypeError, ValueError):
+        pass
+    else:
+        with nogil:
+            i = _scan_uint64(unsigned, hi)
+
+        if i >= 0:
+            _check_integral(unsigned[i], lo, hi, dtype, i)
+
+        return True
+
+    try:
+        floating = values
+    except (BufferError, TypeError, ValueError):
+        return False
+
+    while True:
+        with nogil:
+            i = _scan_double(floating, i, lo, hi)
+
+        if i < 0:
+            return True
+
+        _check_integral(floating[i], lo, hi, dtype, i)
+        i += 1
+
 # =========================================================================
 #  Managed Values
 # =========================================================================
@@ -209,33 +338,125 @@ cdef class MDSFloatPrimitiveBase(MDSPrimitiveBase):
 #  Arrays
 # =========================================================================
 
-cdef class MDSIndexedObject(MDSObject):
+cdef class MDSArrayBuffer(object):
+    """
+    A read-only, contiguous copy of the elements of a managed array, which
+    exposes the Python buffer protocol so it can be consumed by memoryview,
+    NumPy etc. without going through the elements one at a time.
+    """
     cdef:
-        int __iter_idx
+        char*       _data
+        Py_ssize_t  _length
+        Py_ssize_t  _itemsize
+        Py_ssize_t  _shape[1]
+        Py_ssize_t  _strides[1]
+        bytes       _format
+        object      _dtype
+
+    def __cinit__(self, size_t length, size_t itemsize, bytes fmt, dtype):
+        # malloc(0) may legitimately return NULL, so always ask for something
+        self._data = <char*> malloc(max(length * itemsize, 1))
+
+        if self._data is NULL:
+            raise MemoryError()
+
+        self._length = length
+        self._itemsize = itemsize
+        self._shape[0] = length
+        self._strides[0] = itemsize
+        self._format = fmt
+        self._dtype = dtype
+
+    def __dealloc__(self):
+        free(self._data)
 
-    def __getitem__(self, item):
-        return NotImplemented
+    def __len__(self):
+        return self._length
 
-    def __setitem__(self, item, value):
+    def __iter__(self):
+        return iter(self.tolist())
+
+    def tolist(self) -> list:
+        return memoryview(self).tolist()
+
+    def __getbuffer__(self, Py_buffer *buffer, int flags):
+        self._export(buffer, flags)
+
+    def __releasebuffer__(self, Py_buffer *buffer):
         pass
 
+    cdef _export(self, Py_buffer *buffer, int flags):
+        if flags & PyBUF_WRITABLE:
+            raise BufferError("MDSArrayBuffer is read-only")
+
+        buffer.buf = self._data
+        buffer.obj = self
+        buffer.len = self._length * self._itemsize
+        buffer.readonly = 1
+        buffer.itemsize = self._itemsize
+        buffer.format = <char*> self._format if flags & PyBUF_FORMAT else NULL
+        buffer.ndim = 1
+        buffer.shape = self._shape
+        buffer.strides = self._strides
+        buffer.suboffsets = NULL
+        buffer.internal = NULL
+
+    def to_numpy(self):
+        """
+        A NumPy array sharing this buffer's memory; NumPy is only imported
+        when this is called
+        """
+        import numpy
+        return numpy.asarray(self)
+
+    property dtype:
+        def __get__(self):
+            return self._dtype
+
+
+cdef class MDSIndexedIterator(object):
+    """
+    Each call to iter() gets one of these, so concurrent iterations over the
+    same object never share a cursor. The length is taken once, up front.
+    """
+    cdef:
+        object  _parent
+        size_t  _index
+        size_t  _size
+
+    def __cinit__(self, parent):
+        self._parent = parent
+        self._index = 0
+        self._size = len(parent)
+
     def __iter__(self):
-        self.__iter_idx = 0
         return self
 
     def __next__(self):
-        if self.__iter_idx < len(self):
-            retval = self[self.__iter_idx]
-            self.__iter_idx += 1
-            return retval
-        else:
+        if self._index >= self._size:
             raise StopIteration
 
+        retval = self._parent[self._index]
+        self._index += 1
+        return retval
+
+
+cdef class MDSIndexedObject(MDSObject):
+
+    def __getitem__(self, item):
+        return NotImplemented
+
+    def __setitem__(self, item, value):
+        pass
+
+    def __iter__(self):
+        return MDSIndexedIterator(self)
+
     def __len__(self):
         return NotImplemented
 
     def _index_bounds_check(self, index: int) -> int:
-         # TODO: Need to handle slices. Should this be a new array?
+        # Slices never get here, they're handed out as an MDSIndexedView
         cdef long l = <long> len(self)
 
         if index >= l or index < -l:
@@ -246,6 +467,26 @@ cdef class MDSIndexedObject(MDSObject):
 
         return index
 
+    def _range_bounds_check(self, start: int, stop: Optional[int]=None):
+        """
+        Validates a [start, stop) range once, for the bulk operations, rather
+        than bounds checking each element in turn. A missing stop is the end.
+        """
+        cdef long l = <long> len(self)
+
+        if stop is None:
+            stop = l
+
+        if start < 0:
+            start += l
+        if stop < 0:
+            stop += l
+
+        if start < 0 or stop > l or start > stop:
+            raise IndexError('list range out of range')
+
+        return start, stop
+
     def index(self, start=None, end=None) -> int:
         return NotImplemented # TODO Implement this
 
@@ -265,11 +506,94 @@ cdef class MDSIndexedObject(MDSObject):
         return c
 
 
+    def _materialize(self, MDSIndexedView view):
+        """
+        Builds a new, independent object of this type from a view onto it
+        """
+        raise NotImplementedError('Specialization of MDSIndexedObject required')
+
+
+cdef class MDSIndexedView(object):
+    """
+    A lazy window onto an MDSIndexedObject, as returned by slicing one. Only
+    the parent and the selected indices are held; no elements are read until
+    the view is indexed or iterated, so huge arrays can be paged through
+    without materializing them. Slicing a view gives another view.
+    """
+    cdef:
+        MDSIndexedObject    _parent
+        object              _indices  # range over the parent's indices
+
+    def __cinit__(self, MDSIndexedObject parent, indices):
+        if isinstance(indices, slice):
+            indices = range(*indices.indices(len(parent)))
+        elif not isinstance(indices, range):
+            raise TypeError("A view needs a `slice` or `range` of indices")
+
+        self._parent = parent
+        self._indices = indices
+
+    def __len__(self):
+        return len(self._indices)
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return MDSIndexedView(self._parent, self._indices[item])
+
+        return self._parent[self._indices[item]]
+
+    def __iter__(self):
+        for i in self._indices:
+            yield self._parent[i]
+
+    def __repr__(self):
+        return "<{} of {}[{}:{}:{}]>".format(
+            type(self).__name__, type(self._parent).__name__,
+            self.start, self.stop, self.step
+        )
+
+    def __getbuffer__(self, Py_buffer *buffer, int flags):
+        cdef MDSArrayBuffer snapshot = self.to_buffer()
+        snapshot._export(buffer, flags)
+
+    def to_buffer(self) -> MDSArrayBuffer:
+        """
+        Contiguous views onto arrays can be read in bulk, which is what lets
+        them act as the source of a bulk copy
+        """
+        if self.step != 1 or not isinstance(self._parent, MDSArrayBase):
+            raise BufferError("Only contiguous views onto arrays export a buffer")
+
+        return self._parent.read_range(self.start, self.start + len(self))
+
+    def copy(self):
+        return self._parent._materialize(self)
+
+    property parent:
+        def __get__(self):
+            return self._parent
+
+    property start:
+        def __get__(self):
+            return self._indices.start
+
+    property stop:
+        def __get__(self):
+            return self._indices.stop
+
+    property step:
+        def __get__(self):
+            return self._indices.step
+
+
 cdef class MDSArrayBase(MDSIndexedObject):
 
     cdef size_t _last_index
 
     def __getitem__(self, index):
+        if isinstance(index, slice):
+            return MDSIndexedView(self, index)
+
         index = self._index_bounds_check(index)
 
         # We store this for in-place ops
@@ -285,15 +609,102 @@ cdef class MDSArrayBase(MDSIndexedObject):
     def copy(self):
         raise NotImplementedError('Specialization of MDSArrayBase required')
 
+    def _materialize(self, MDSIndexedView view):
+        return type(self).of(view)
+
+    def iterate(self, size_t chunk=0):
+        """
+        Returns an independent iterator over the elements. When `chunk` is
+        given, elements are read ahead in native batches of that size, so
+        writes made to elements already prefetched won't be seen. Only the
+        primitive arrays prefetch; for String and Record arrays `chunk` has
+        no effect, and each element is read as it's reached.
+        """
+        return MDSIndexedIterator(self)
+
+    def __getbuffer__(self, Py_buffer *buffer, int flags):
+        # Each export takes its own snapshot, which then owns the memory
+        cdef MDSArrayBuffer snapshot = self.to_buffer()
+        snapshot._export(buffer, flags)
+
+    def to_buffer(self) -> MDSArrayBuffer:
+        """
+        Gathers every element into a contiguous native buffer in a single pass,
+        which is then exported through the buffer protocol. Only the primitive
+        arrays have one; String and Record arrays raise BufferError.
+        """
+        raise BufferError(f"`{type(self).__name__}` elements can't be exported as a buffer")
+
+    def to_numpy(self, copy=False):
+        """
+        Returns the elements as a NumPy array; NumPy is only imported when this
+        is called. MDS arrays hold a version per element rather than contiguous
+        storage, so this is always backed by a snapshot from to_buffer(). The
+        result is a read-only view of that snapshot, unless `copy` is set.
+        """
+        import numpy
+
+        retval = numpy.asarray(self.to_buffer())
+        return retval.copy() if copy else retval
+
     @classmethod
-    def of(cls, values: Iterable):
-        retval = cls(length=len(values))
+    def of(cls, values: Iterable, size_t chunk=65536):
+        """
+        Builds a new array from values. Buffers of the element type, such as
+        array.array, NumPy arrays or memoryviews, are written in one bulk pass.
+        Iterables without a length (e.g. generators) are drained `chunk`
+        elements at a time into native storage, then written the same way.
+        """
+        if type(values) is cls:
+            return values.copy()
 
-        for i, elem in enumerate(values):
-            retval[i] = elem
+        if not hasattr(values, "__len__"):
+            values = cls._stage(values, chunk)
 
+        retval = cls(length=len(values))
+        retval.write_range(0, values)
         return retval
 
+    @classmethod
+    def _stage(cls, values: Iterable, size_t chunk):
+        typecode = getattr(cls().dtype, "buffer_format", None)
+        staged = array.array(typecode) if typecode in array.typecodes else []
+        it = iter(values)
+
+        while True:
+            block = list(islice(it, chunk))
+
+            if not block:
+                return staged
+
+            try:
+                staged.extend(block if isinstance(staged, list) else array.array(typecode, block))
+            except (OverflowError, TypeError):
+                # Leave conversion and its errors to the per-element checks
+                staged = staged.tolist()
+                staged.extend(block)
+
+    def read_range(self, start: int, stop: int, out=None):
+        raise NotImplementedError('Specialization of MDSArrayBase required')
+
+    def write_range(self, start: int, values) -> None:
+        self._write_elements(start, values)
+
+    def _write_elements(self, start: int, values) -> None:
+        """
+        The fallback for write_range() when values isn't a buffer of the exact
+        element type; each element goes through the usual checks in __setitem__
+        """
+        # Buffers (NumPy especially) hand back native Python values this way
+        values = values.tolist() if hasattr(values, "tolist") else list(values)
+        start, stop = self._range_bounds_check(start)
+
+        if len(values) > stop - start:
+            raise IndexError('list range out of range')
+
+        for i, elem in enumerate(values, start):
+            self[i] = elem
+
     property dtype:
         def __get__(self):
             raise NotImplementedError('Specialization of MDSArrayBase required')
@@ -303,15 +714,183 @@ cdef class MDSArrayBase(MDSIndexedObject):
         self._to_mds(index, value)
 
 
-cdef class MDSIntArrayBase(MDSArrayBase):
+cdef class MDSNumericArrayBase(MDSArrayBase):
+    """
+    Aggregates over arithmetic arrays. Each one is a single native pass over
+    the underlying handle, supplied per-type by the `_`-prefixed kernels. When
+    `snapshot` is set, the pass runs inside a read-only snapshot so it sees a
+    consistent version of every element, even while others are writing.
+    """
+
+    def _evaluate(self, fn: Callable, args=tuple(), snapshot: bool=False):
+        if not snapshot:
+            return fn(*args)
+
+        # Imported here, as mds.containers depends on this module
+        from mds.containers import in_read_only_snapshot
+        return in_read_only_snapshot(lambda: fn(*args))
+
+    def _extreme(self, str name, bint largest):
+        """
+        The index of the smallest or largest element, with the value the pass
+        read there, so min() and max() don't read the element again
+        """
+        if not len(self):
+            raise ValueError(f"{name}() arg is an empty sequence")
+
+        return self._arg_extreme(largest)
+
+    def _mean(self):
+        cdef size_t n = len(self)
+
+        if not n:
+            raise ValueError("mean() arg is an empty sequence")
+
+        return self._sum() / n
+
+    def sum(self, snapshot: bool=False):
+        return self._evaluate(self._sum, snapshot=snapshot)
+
+    def mean(self, snapshot: bool=False) -> float:
+        return self._evaluate(self._mean, snapshot=snapshot)
+
+    def min(self, snapshot: bool=False):
+        return self._evaluate(self._extreme, ("min", False), snapshot)[1]
+
+    def max(self, snapshot: bool=False):
+        return self._evaluate(self._extreme, ("max", True), snapshot)[1]
+
+    def argmin(self, snapshot: bool=False) -> int:
+        return self._evaluate(self._extreme, ("argmin", False), snapshot)[0]
+
+    def argmax(self, snapshot: bool=False) -> int:
+        return self._evaluate(self._extreme, ("argmax", True), snapshot)[0]
+
+    def count(self, value, snapshot: bool=False) -> int:
+        return self._evaluate(self._count, (value,), snapshot)
+
+    def index(self, value, start: int=0, stop: Optional[int]=None, snapshot: bool=False) -> int:
+        # Out of range bounds are clamped, as list.index does
+        start, stop, _ = slice(start, stop).indices(len(self))
+        retval = self._evaluate(self._find, (value, start, stop), snapshot)
+
+        if retval < 0:
+            raise ValueError(f"{value} is not in array")
+
+        return retval
+
+    def where(self, value, snapshot: bool=False) -> MDSArrayBuffer:
+        """
+        The indices of every element equal to value, as a buffer of uint64
+        """
+        return self._evaluate(self._where, (value,), snapshot)
+
+    def add(self, other) -> None:
+        """
+        Adds a scalar, or the corresponding elements of an array of the same
+        type, to every element. Every result is computed and range checked
+        before anything is written, so on error the array is left unchanged.
+        """
+        self._elementwise(OP_ADD, other)
+
+    def sub(self, other) -> None:
+        self._elementwise(OP_SUB, other)
+
+    def mul(self, other) -> None:
+        self._elementwise(OP_MUL, other)
+
+    def div(self, other) -> None:
+        """
+        Integral arrays truncate the quotient, as assigning a float would
+        """
+        self._elementwise(OP_DIV, other)
+
+    def fill(self, value) -> None:
+        self._fill(value)
+
+    def clip(self, lower=None, upper=None) -> None:
+        """
+        Limits every element to [lower, upper]; either bound may be omitted.
+        Only elements that change are written.
+        """
+        if lower is not None and upper is not None and lower > upper:
+            raise ValueError(f"lower bound {lower} exceeds upper bound {upper}")
+
+        self._clip(lower, upper)
+
+    def _check_operand(self, other):
+        if len(other) != len(self):
+            raise ValueError(f"operand has {len(other)} elements, {len(self)} required")
+
+    def _elementwise_failed(self, int status, size_t index):
+        if status == 2:
+            raise ZeroDivisionError(f"division by zero at index {index}")
+        elif status > 0:
+            raise OverflowError(f"Can't fit result at index {index} in container {self.dtype}")
+        else:
+            raise UnderflowError(f"Can't fit result at index {index} in container {self.dtype}")
+
+    def _elementwise(self, int op, other):
+        raise NotImplementedError('Specialization of MDSNumericArrayBase required')
+
+    def _fill(self, value):
+        raise NotImplementedError('Specialization of MDSNumericArrayBase required')
+
+    def _clip(self, lower, upper):
+        raise NotImplementedError('Specialization of MDSNumericArrayBase required')
+
+    def _sum(self):
+        raise NotImplementedError('Specialization of MDSNumericArrayBase required')
+
+    def _arg_extreme(self, bint largest):
+        raise NotImplementedError('Specialization of MDSNumericArrayBase required')
+
+    def _comparable(self, value):
+        """
+        The value the native kernels compare elements with. TypeError means
+        no native comparison gives the same answer as Python's ==, so value
+        is then compared with each element in turn instead.
+        """
+        raise NotImplementedError('Specialization of MDSNumericArrayBase required')
+
+    def _count(self, value):
+        raise NotImplementedError('Specialization of MDSNumericArrayBase required')
+
+    def _find(self, value, size_t start, size_t stop):
+        raise NotImplementedError('Specialization of MDSNumericArrayBase required')
+
+    def _where(self, value):
+        raise NotImplementedError('Specialization of MDSNumericArrayBase required')
+
+
+cdef class MDSIntArrayBase(MDSNumericArrayBase):
 
     def _numeric_bounds_check(self, value):
         """
-        This is per-type as it delegates to the associated primitive to do the
-        bounds checking and follow Python/numpy conventions
+        This is per-type, checking against the bounds of the element type
+        while following the conventions of the associated primitive
+        """
+        raise NotImplementedError('Requires a type-specific instantiation')
+
+    def validate(self, values) -> None:
+        """
+        Checks a whole batch against the bounds of the element type in one
+        pass, without writing anything. The error names the first offending
+        index.
         """
         raise NotImplementedError('Requires a type-specific instantiation')
 
+    def _comparable(self, value):
+        if isinstance(value, int):
+            return value
+
+        # A float holding a whole number equals the int of the same value.
+        # Anything else would be truncated by the conversion, so isn't native.
+        if isinstance(value, float) and value.is_integer():
+            return int(value)
+
+        raise TypeError(f"Can't compare `{type(value).__name__}` natively")
+
     def __setitem__(self, index, value):
         index = self._index_bounds_check(index)
         value = self._numeric_bounds_check(value)
@@ -322,24 +901,95 @@ cdef class MDSIntArrayBase(MDSArrayBase):
             return int
 
 
-cdef class MDSFloatArrayBase(MDSArrayBase):
+cdef class MDSFloatArrayBase(MDSNumericArrayBase):
+
+    def _comparable(self, value):
+        if isinstance(value, float):
+            return value
+
+        # Only ints a double holds exactly compare the same way natively
+        if isinstance(value, int) and float(value) == value:
+            return value
+
+        raise TypeError(f"Can't compare `{type(value).__name__}` natively")
 
     property python_type:
         def __get__(self):
             return float
 
-# TODO: Finish impl
 cdef class RecordArray(MDSArrayBase):
+    """
+    An array of records. The Record subclass of the elements has to be known
+    to hand them back out as Python objects, or to read their fields in bulk.
+    """
+    cdef:
+        h_marray_record_t _handle
+        type _record_type
 
-    cdef h_marray_record_t _handle
-
-    def __cinit__(self, int length=0):
+    def __cinit__(self, int length=0, type record_type=None):
         if length:
             self._handle = create_record_marray(<size_t> length)
 
+        self._record_type = record_type
+
     def __len__(self):
         return self._handle.size()
 
+    def _checked_record_type(self) -> type:
+        if self._record_type is None:
+            raise TypeError("RecordArray needs a `record_type` to interpret its elements")
+
+        return self._record_type
+
+    def _to_python(self, index):
+        cdef h_mrecord_t handle = self._handle.frozen_read(index)
+        return Record_Adopt(self._checked_record_type(), handle)
+
+    def _to_mds(self, index, Record value):
+        self._handle.write(index, value._handle)
+
+    def column(self, str field_name, numpy: bool=False):
+        """
+        Gathers one primitive field across every record, in a single native
+        pass, as a managed array of the field's type (or a NumPy array).
+        """
+        return self.to_columns([field_name], numpy=numpy)[field_name]
+
+    def to_columns(self, field_names: Iterable[Text], numpy: bool=False) -> Dict[Text, object]:
+        """
+        The multi-field variant of column(); the record handles are only read
+        once, however many fields are asked for.
+        """
+        cdef:
+            h_marray_record_t handle = self._handle
+            size_t i, n = handle.size()
+            vector[h_mrecord_t] records
+            MDSRecordFieldBase field
+
+        cdef MDSRecordFieldTable table = Record_TypeDecl(self._checked_record_type())._fields
+        fields = dict()
+
+        for name in field_names:
+            fields[name] = table.field_at(table.slot(name))
+
+        records.resize(n)
+
+        with nogil:
+            for i in range(n):
+                records[i] = handle.frozen_read(i)
+
+        retval = dict()
+
+        for name, field in fields.items():
+            snapshot = field._gather(records)
+            retval[name] = snapshot.to_numpy() if numpy else field.get_array_type().of(snapshot)
+
+        return retval
+
+    property record_type:
+        def __get__(self):
+            return self._record_type
+
     def __hash__(self):
         return self._handle.hash1()
 
@@ -448,16 +1098,151 @@ cdef class BoolArray(MDSArrayBase):
     def bind_to_namespace(self, Namespace namespace):
         pass  # TODO: See how these properly bind
 
-cdef class ByteArray(MDSIntArrayBase):
+    def __iter__(self):
+        return MDSBoolArrayIterator(self)
 
-    cdef h_marray_byte_t _handle
-    _primitive = Byte
+    def iterate(self, size_t chunk=0):
+        return MDSBoolArrayIterator(self, chunk)
 
-    def __cinit__(self, int length=0):
-        if length:
-            self._handle = create_byte_marray(<size_t> length)
+    def to_buffer(self) -> MDSArrayBuffer:
+        cdef:
+            h_marray_bool_t handle = self._handle
+            size_t i, n = handle.size()
+            MDSArrayBuffer retval = MDSArrayBuffer(n, sizeof(bool), b"?", mds.typing.primitives.bool)
+            bool* data = <bool*> retval._data
 
-    def __len__(self):
+        with nogil:
+            for i in range(n):
+                data[i] = bool_to_core_val(handle.frozen_read(i))
+
+        return retval
+
+    def copy(self):
+        cdef:
+            h_marray_bool_t handle = self._handle
+            size_t i, n = handle.size()
+            BoolArray retval = BoolArray(length=n)
+            h_marray_bool_t dest = retval._handle
+
+        with nogil:
+            for i in range(n):
+                dest.write(i, handle.frozen_read(i))
+
+        return retval
+
+    def read_range(self, start: int, stop: int, out=None):
+        cdef:
+            h_marray_bool_t handle = self._handle
+            uint8_t[::1] dest
+            uint8_t* data
+            size_t i, lo, hi, n
+
+        lo, hi = self._range_bounds_check(start, stop)
+        n = hi - lo
+
+        if out is None:
+            out = MDSArrayBuffer(n, sizeof(bool), b"?", mds.typing.primitives.bool)
+            data = <uint8_t*> (<MDSArrayBuffer> out)._data
+        else:
+            dest = out
+
+            if <size_t> dest.shape[0] < n:
+                raise ValueError(f"`out` holds {dest.shape[0]} elements, {n} required")
+            if not n:
+                return out
+
+            data = &dest[0]
+
+        with nogil:
+            for i in range(n):
+                data[i] = bool_to_core_val(handle.frozen_read(lo + i))
+
+        return out
+
+    def write_range(self, start: int, values) -> None:
+        cdef:
+            h_marray_bool_t handle = self._handle
+            const uint8_t[::1] src
+            const uint8_t* data
+            size_t i, lo, hi, n
+
+        try:
+            src = values
+        except (BufferError, TypeError, ValueError):
+            self._write_elements(start, values)
+            return
+
+        lo, hi = self._range_bounds_check(start)
+        n = src.shape[0]
+
+        if n > hi - lo:
+            raise IndexError('list range out of range')
+        if not n:
+            return
+
+        data = &src[0]
+
+        with nogil:
+            for i in range(n):
+                handle.write(lo + i, mv_bool(data[i] != 0))
+
+
+cdef class MDSBoolArrayIterator(object):
+    cdef:
+        BoolArray _array
+        h_marray_bool_t _handle
+        size_t _index
+        size_t _size
+        size_t _chunk
+        size_t _chunk_start
+        vector[bool] _prefetched
+
+    def __cinit__(self, BoolArray array, size_t chunk=0):
+        self._array = array
+        self._handle = array._handle
+        self._index = 0
+        self._size = self._handle.size()
+        self._chunk = chunk
+        self._chunk_start = 0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        cdef:
+            size_t i, n
+            bool retval
+
+        if self._index >= self._size:
+            raise StopIteration
+
+        if not self._chunk:
+            retval = bool_to_core_val(self._handle.frozen_read(self._index))
+        else:
+            if self._index >= self._chunk_start + self._prefetched.size():
+                n = min(self._chunk, self._size - self._index)
+                self._chunk_start = self._index
+                self._prefetched.resize(n)
+
+                with nogil:
+                    for i in range(n):
+                        self._prefetched[i] = bool_to_core_val(self._handle.frozen_read(self._chunk_start + i))
+
+            retval = self._prefetched[self._index - self._chunk_start]
+
+        self._index += 1
+        return retval
+
+cdef class ByteArray(MDSIntArrayBase):
+
+    cdef h_marray_byte_t _handle
+    _primitive = Byte
+
+    def __cinit__(self, int length=0):
+        if length:
+            self._handle = create_byte_marray(<size_t> length)
+
+    def __len__(self):
         return self._handle.size()
 
     def __hash__(self):
@@ -486,29 +1271,146 @@ cdef class ByteArray(MDSIntArrayBase):
     def bind_to_namespace(self, Namespace namespace):
         pass  # TODO: See how these properly bind
 
+    def __iter__(self):
+        return MDSByteArrayIterator(self)
+
+    def iterate(self, size_t chunk=0):
+        return MDSByteArrayIterator(self, chunk)
+
+    def to_buffer(self) -> MDSArrayBuffer:
+        cdef:
+            h_marray_byte_t handle = self._handle
+            size_t i, n = handle.size()
+            MDSArrayBuffer retval = MDSArrayBuffer(n, sizeof(int8_t), b"b", mds.typing.primitives.byte)
+            int8_t* data = <int8_t*> retval._data
+
+        with nogil:
+            for i in range(n):
+                data[i] = byte_to_core_val(handle.frozen_read(i))
+
+        return retval
+
+    def copy(self):
+        cdef:
+            h_marray_byte_t handle = self._handle
+            size_t i, n = handle.size()
+            ByteArray retval = ByteArray(length=n)
+            h_marray_byte_t dest = retval._handle
+
+        with nogil:
+            for i in range(n):
+                dest.write(i, handle.frozen_read(i))
+
+        return retval
+
     def _numeric_bounds_check(self, value):
-        prim = Byte(value)
-        return prim.python_value
+        return _check_integral(value, INT8_MIN, INT8_MAX, mds.typing.primitives.byte)
+
+    def _to_mds(self, index, value):
+        self._handle.write(index, mv_byte(<int8_t> value))
+
+    def validate(self, values) -> None:
+        cdef:
+            const int8_t[::1] src
+            Py_ssize_t i
+
+        try:
+            src = values
+            return  # Every element of a buffer of this type is in bounds
+        except (BufferError, TypeError, ValueError):
+            pass
+
+        if _validate_wide(values, INT8_MIN, INT8_MAX, mds.typing.primitives.byte):
+            return
+
+        # Other buffers (NumPy especially) hand back native Python values this way
+        values = values.tolist() if hasattr(values, "tolist") else values
+
+        for i, value in enumerate(values):
+            _check_integral(value, INT8_MIN, INT8_MAX, mds.typing.primitives.byte, i)
+
+    def _write_elements(self, start: int, values) -> None:
+        cdef:
+            h_marray_byte_t handle = self._handle
+            size_t i, lo, hi, n
+            vector[int8_t] staged
+
+        values = values.tolist() if hasattr(values, "tolist") else list(values)
+        lo, hi = self._range_bounds_check(start)
+        n = len(values)
+
+        if n > hi - lo:
+            raise IndexError('list range out of range')
+
+        # Everything is validated before the first write
+        staged.resize(n)
+
+        for i in range(n):
+            staged[i] = _check_integral(values[i], INT8_MIN, INT8_MAX, mds.typing.primitives.byte, i)
+
+        with nogil:
+            for i in range(n):
+                handle.write(lo + i, mv_byte(staged[i]))
 
     def _to_python(self, index):
         return byte_to_core_val(self._handle.frozen_read(index))
 
-    def _to_mds(self, index, value):
-        # Delegate bounds checking etc. to the primitive wrapper
-        wrapped = self._primitive(value)
-        self._handle.write(index, mv_byte(value))
+    def read_range(self, start: int, stop: int, out=None):
+        cdef:
+            h_marray_byte_t handle = self._handle
+            int8_t[::1] dest
+            int8_t* data
+            size_t i, lo, hi, n
 
-    def copy(self):
+        lo, hi = self._range_bounds_check(start, stop)
+        n = hi - lo
+
+        if out is None:
+            out = MDSArrayBuffer(n, sizeof(int8_t), b"b", mds.typing.primitives.byte)
+            data = <int8_t*> (<MDSArrayBuffer> out)._data
+        else:
+            dest = out
+
+            if <size_t> dest.shape[0] < n:
+                raise ValueError(f"`out` holds {dest.shape[0]} elements, {n} required")
+            if not n:
+                return out
+
+            data = &dest[0]
+
+        with nogil:
+            for i in range(n):
+                data[i] = byte_to_core_val(handle.frozen_read(lo + i))
+
+        return out
+
+    def write_range(self, start: int, values) -> None:
         cdef:
-            size_t i = 0
-            size_t n = len(self)
+            h_marray_byte_t handle = self._handle
+            const int8_t[::1] src
+            const int8_t* data
+            size_t i, lo, hi, n
 
-        retval = ByteArray(length=len(self))
+        try:
+            src = values
+        except (BufferError, TypeError, ValueError):
+            # Not a buffer of exactly this element type, so take the slow path
+            self._write_elements(start, values)
+            return
 
-        for i in range(n):
-            retval[i] = self[i]
+        lo, hi = self._range_bounds_check(start)
+        n = src.shape[0]
 
-        return retval
+        if n > hi - lo:
+            raise IndexError('list range out of range')
+        if not n:
+            return
+
+        data = &src[0]
+
+        with nogil:
+            for i in range(n):
+                handle.write(lo + i, mv_byte(data[i]))
 
     def __iadd__(self, other):
         return self._handle.add(self._last_index, <int8_t> other)
@@ -522,162 +1424,245 @@ cdef class ByteArray(MDSIntArrayBase):
     def __itruediv__(self, other):
         return self._handle.div(self._last_index, <int8_t> other)
 
-cdef class UByteArray(MDSIntArrayBase):
+    def _sum(self):
+        cdef:
+            h_marray_byte_t handle = self._handle
+            size_t i, n = handle.size()
+            int64_t acc = 0, v
 
-    cdef h_marray_ubyte_t _handle
-    _primitive = UByte
+        total = 0
 
-    def __cinit__(self, int length=0):
-        if length:
-            self._handle = create_ubyte_marray(<size_t> length)
+        with nogil:
+            for i in range(n):
+                v = byte_to_core_val(handle.frozen_read(i))
 
-    def __len__(self):
-        return self._handle.size()
+                if (v > 0 and acc > INT64_MAX - v) or (v < 0 and acc < INT64_MIN - v):
+                    with gil:
+                        total += acc
 
-    def __hash__(self):
-        return self._handle.hash1()
+                    acc = 0
 
-    property dtype:
-        def __get__(self):
-            return mds.typing.primitives.ubyte
+                acc += v
 
-    @classmethod
-    def from_namespace(cls, Namespace namespace, path) -> Optional[UByteArray]:
+        return total + acc
+
+    def _arg_extreme(self, bint largest):
         cdef:
-            String p = __cast_to_mds_string(path)
-            h_istring_t ish = p._ish
-            h_namespace_t nhandle = namespace._handle
-            h_marray_ubyte_t handle
+            h_marray_byte_t handle = self._handle
+            size_t i, best = 0, n = handle.size()
+            int8_t v, current = byte_to_core_val(handle.frozen_read(0))
+
+        with nogil:
+            for i in range(1, n):
+                v = byte_to_core_val(handle.frozen_read(i))
+
+                if (v > current) if largest else (v < current):
+                    best = i
+                    current = v
+
+        return best, current
+
+    def _count(self, value):
+        cdef:
+            h_marray_byte_t handle = self._handle
+            size_t i, c = 0, n = handle.size()
+            int8_t target
 
         try:
-            handle = nhandle.lookup_ubyte_array(ish, h_array_ubyte_t())
-            retval = UByteArray()
-            retval._handle = handle
-            return retval
-        except:
-            return None
+            target = self._comparable(value)
+        except OverflowError:
+            return 0  # Out of range for this array, so can't be in it
+        except TypeError:
+            return sum(1 for v in self if v == value)
 
-    def bind_to_namespace(self, Namespace namespace):
-        pass  # TODO: See how these properly bind
+        with nogil:
+            for i in range(n):
+                if byte_to_core_val(handle.frozen_read(i)) == target:
+                    c += 1
 
-    def _numeric_bounds_check(self, value):
-        prim = UByte(value)
-        return prim.python_value
+        return c
 
-    def _to_python(self, index):
-        return ubyte_to_core_val(self._handle.frozen_read(index))
+    def _find(self, value, size_t start, size_t stop):
+        cdef:
+            h_marray_byte_t handle = self._handle
+            size_t i
+            Py_ssize_t found = -1
+            int8_t target
 
-    def _to_mds(self, index, value):
-        # Delegate bounds checking etc. to the primitive wrapper
-        wrapped = self._primitive(value)
-        self._handle.write(index, mv_ubyte(value))
+        try:
+            target = self._comparable(value)
+        except OverflowError:
+            return found
+        except TypeError:
+            for i in range(start, stop):
+                if self[i] == value:
+                    return i
 
-    def copy(self):
+            return found
+
+        with nogil:
+            for i in range(start, stop):
+                if byte_to_core_val(handle.frozen_read(i)) == target:
+                    found = i
+                    break
+
+        return found
+
+    def _where(self, value):
         cdef:
-            size_t i = 0
-            size_t n = len(self)
+            h_marray_byte_t handle = self._handle
+            size_t i, n = handle.size()
+            vector[uint64_t] found
+            int8_t target
+            MDSArrayBuffer retval
+            uint64_t* data
 
-        retval = UByteArray(length=len(self))
+        try:
+            target = self._comparable(value)
+        except OverflowError:
+            n = 0
+        except TypeError:
+            for i in range(n):
+                if self[i] == value:
+                    found.push_back(i)
 
-        for i in range(n):
-            retval[i] = self[i]
+            n = 0
 
-        return retval
+        with nogil:
+            for i in range(n):
+                if byte_to_core_val(handle.frozen_read(i)) == target:
+                    found.push_back(i)
 
-    def __iadd__(self, other):
-        return self._handle.add(self._last_index, <uint8_t> other)
+        n = found.size()
+        retval = MDSArrayBuffer(n, sizeof(uint64_t), b"Q", mds.typing.primitives.ulong)
+        data = <uint64_t*> retval._data
 
-    def __isub__(self, other):
-        return self._handle.sub(self._last_index, <uint8_t> other)
+        for i in range(n):
+            data[i] = found[i]
 
-    def __imul__(self, other):
-        return self._handle.mul(self._last_index, <uint8_t> other)
+        return retval
 
-    def __itruediv__(self, other):
-        return self._handle.div(self._last_index, <uint8_t> other)
+    def _elementwise(self, int op, other):
+        cdef:
+            h_marray_byte_t handle = self._handle
+            h_marray_byte_t rhs
+            size_t i, n = handle.size()
+            bint from_array = isinstance(other, ByteArray)
+            int status = 0
+            int8_t b
+            vector[int8_t] results
+
+        if from_array:
+            self._check_operand(other)
+            rhs = (<ByteArray> other)._handle
+        else:
+            b = self._numeric_bounds_check(other)
 
-cdef class ShortArray(MDSIntArrayBase):
+        results.resize(n)
 
-    cdef h_marray_short_t _handle
-    _primitive = Short
+        with nogil:
+            for i in range(n):
+                if from_array:
+                    b = byte_to_core_val(rhs.frozen_read(i))
 
-    def __cinit__(self, int length=0):
-        if length:
-            self._handle = create_short_marray(<size_t> length)
+                status = apply_elementwise[int8_t](op, byte_to_core_val(handle.frozen_read(i)), b, &results[i])
 
-    def __len__(self):
-        return self._handle.size()
+                if status:
+                    break
 
-    def __hash__(self):
-        return self._handle.hash1()
+        if status:
+            self._elementwise_failed(status, i)
 
-    property dtype:
-        def __get__(self):
-            return mds.typing.primitives.short
+        with nogil:
+            for i in range(n):
+                handle.write(i, mv_byte(results[i]))
 
-    @classmethod
-    def from_namespace(cls, Namespace namespace, path) -> Optional[ShortArray]:
+    def _fill(self, value):
         cdef:
-            String p = __cast_to_mds_string(path)
-            h_istring_t ish = p._ish
-            h_namespace_t nhandle = namespace._handle
-            h_marray_short_t handle
+            h_marray_byte_t handle = self._handle
+            size_t i, n = handle.size()
+            int8_t v = self._numeric_bounds_check(value)
 
-        try:
-            handle = nhandle.lookup_short_array(ish, h_array_short_t())
-            retval = ShortArray()
-            retval._handle = handle
-            return retval
-        except:
-            return None
+        with nogil:
+            for i in range(n):
+                handle.write(i, mv_byte(v))
 
-    def bind_to_namespace(self, Namespace namespace):
-        pass  # TODO: See how these properly bind
+    def _clip(self, lower, upper):
+        cdef:
+            h_marray_byte_t handle = self._handle
+            size_t i, n = handle.size()
+            bint has_lower = lower is not None, has_upper = upper is not None
+            int8_t lo = 0, hi = 0, v
 
-    def _numeric_bounds_check(self, value):
-        prim = Short(value)
-        return prim.python_value
+        if has_lower:
+            lo = self._numeric_bounds_check(max(lower, -128))
+        if has_upper:
+            hi = self._numeric_bounds_check(min(upper, 127))
 
-    def _to_python(self, index):
-        return short_to_core_val(self._handle.frozen_read(index))
+        with nogil:
+            for i in range(n):
+                v = byte_to_core_val(handle.frozen_read(i))
 
-    def _to_mds(self, index, value):
-        # Delegate bounds checking etc. to the primitive wrapper
-        wrapped = self._primitive(value)
-        self._handle.write(index, mv_short(value))
+                if has_lower and v < lo:
+                    handle.write(i, mv_byte(lo))
+                elif has_upper and v > hi:
+                    handle.write(i, mv_byte(hi))
 
-    def copy(self):
-        cdef:
-            size_t i = 0
-            size_t n = len(self)
 
-        retval = ShortArray(length=len(self))
+cdef class MDSByteArrayIterator(object):
+    cdef:
+        ByteArray _array
+        h_marray_byte_t _handle
+        size_t _index
+        size_t _size
+        size_t _chunk
+        size_t _chunk_start
+        vector[int8_t] _prefetched
+
+    def __cinit__(self, ByteArray array, size_t chunk=0):
+        self._array = array
+        self._handle = array._handle
+        self._index = 0
+        self._size = self._handle.size()
+        self._chunk = chunk
+        self._chunk_start = 0
 
-        for i in range(n):
-            retval[i] = self[i]
+    def __iter__(self):
+        return self
 
-        return retval
+    def __next__(self):
+        cdef:
+            size_t i, n
+            int8_t retval
 
-    def __iadd__(self, other):
-        return self._handle.add(self._last_index, <int16_t> other)
+        if self._index >= self._size:
+            raise StopIteration
 
-    def __isub__(self, other):
-        return self._handle.sub(self._last_index, <int16_t> other)
+        if not self._chunk:
+            retval = byte_to_core_val(self._handle.frozen_read(self._index))
+        else:
+            if self._index >= self._chunk_start + self._prefetched.size():
+                n = min(self._chunk, self._size - self._index)
+                self._chunk_start = self._index
+                self._prefetched.resize(n)
 
-    def __imul__(self, other):
-        return self._handle.mul(self._last_index, <int16_t> other)
+                with nogil:
+                    for i in range(n):
+                        self._prefetched[i] = byte_to_core_val(self._handle.frozen_read(self._chunk_start + i))
 
-    def __itruediv__(self, other):
-        return self._handle.div(self._last_index, <int16_t> other)
+            retval = self._prefetched[self._index - self._chunk_start]
 
-cdef class UShortArray(MDSIntArrayBase):
+        self._index += 1
+        return retval
 
-    cdef h_marray_ushort_t _handle
-    _primitive = UShort
+cdef class UByteArray(MDSIntArrayBase):
+
+    cdef h_marray_ubyte_t _handle
+    _primitive = UByte
 
     def __cinit__(self, int length=0):
         if length:
-            self._handle = create_ushort_marray(<size_t> length)
+            self._handle = create_ubyte_marray(<size_t> length)
 
     def __len__(self):
         return self._handle.size()
@@ -687,19 +1672,19 @@ cdef class UShortArray(MDSIntArrayBase):
 
     property dtype:
         def __get__(self):
-            return mds.typing.primitives.ushort
+            return mds.typing.primitives.ubyte
 
     @classmethod
-    def from_namespace(cls, Namespace namespace, path) -> Optional[UShortArray]:
+    def from_namespace(cls, Namespace namespace, path) -> Optional[UByteArray]:
         cdef:
             String p = __cast_to_mds_string(path)
             h_istring_t ish = p._ish
             h_namespace_t nhandle = namespace._handle
-            h_marray_ushort_t handle
+            h_marray_ubyte_t handle
 
         try:
-            handle = nhandle.lookup_ushort_array(ish, h_array_ushort_t())
-            retval = UShortArray()
+            handle = nhandle.lookup_ubyte_array(ish, h_array_ubyte_t())
+            retval = UByteArray()
             retval._handle = handle
             return retval
         except:
@@ -708,272 +1693,398 @@ cdef class UShortArray(MDSIntArrayBase):
     def bind_to_namespace(self, Namespace namespace):
         pass  # TODO: See how these properly bind
 
-    def _numeric_bounds_check(self, value):
-        prim = UShort(value)
-        return prim.python_value
-
-    def _to_python(self, index):
-        return ushort_to_core_val(self._handle.frozen_read(index))
+    def __iter__(self):
+        return MDSUByteArrayIterator(self)
 
-    def _to_mds(self, index, value):
-        # Delegate bounds checking etc. to the primitive wrapper
-        wrapped = self._primitive(value)
-        self._handle.write(index, mv_ushort(value))
+    def iterate(self, size_t chunk=0):
+        return MDSUByteArrayIterator(self, chunk)
 
-    def copy(self):
+    def to_buffer(self) -> MDSArrayBuffer:
         cdef:
-            size_t i = 0
-            size_t n = len(self)
+            h_marray_ubyte_t handle = self._handle
+            size_t i, n = handle.size()
+            MDSArrayBuffer retval = MDSArrayBuffer(n, sizeof(uint8_t), b"B", mds.typing.primitives.ubyte)
+            uint8_t* data = <uint8_t*> retval._data
 
-        retval = UShortArray(length=len(self))
-
-        for i in range(n):
-            retval[i] = self[i]
+        with nogil:
+            for i in range(n):
+                data[i] = ubyte_to_core_val(handle.frozen_read(i))
 
         return retval
 
-    def __iadd__(self, other):
-        return self._handle.add(self._last_index, <uint16_t> other)
+    def copy(self):
+        cdef:
+            h_marray_ubyte_t handle = self._handle
+            size_t i, n = handle.size()
+            UByteArray retval = UByteArray(length=n)
+            h_marray_ubyte_t dest = retval._handle
 
-    def __isub__(self, other):
-        return self._handle.sub(self._last_index, <uint16_t> other)
+        with nogil:
+            for i in range(n):
+                dest.write(i, handle.frozen_read(i))
 
-    def __imul__(self, other):
-        return self._handle.mul(self._last_index, <uint16_t> other)
+        return retval
 
-    def __itruediv__(self, other):
-        return self._handle.div(self._last_index, <uint16_t> other)
+    def _numeric_bounds_check(self, value):
+        return _check_integral(value, 0, UINT8_MAX, mds.typing.primitives.ubyte)
 
-cdef class IntArray(MDSIntArrayBase):
+    def _to_mds(self, index, value):
+        self._handle.write(index, mv_ubyte(<uint8_t> value))
 
-    cdef h_marray_int_t _handle
-    _primitive = Int
+    def validate(self, values) -> None:
+        cdef:
+            const uint8_t[::1] src
+            Py_ssize_t i
 
-    def __cinit__(self, int length=0):
-        if length:
-            self._handle = create_int_marray(<size_t> length)
+        try:
+            src = values
+            return  # Every element of a buffer of this type is in bounds
+        except (BufferError, TypeError, ValueError):
+            pass
 
-    def __len__(self):
-        return self._handle.size()
+        if _validate_wide(values, 0, UINT8_MAX, mds.typing.primitives.ubyte):
+            return
 
-    def __hash__(self):
-        return self._handle.hash1()
+        # Other buffers (NumPy especially) hand back native Python values this way
+        values = values.tolist() if hasattr(values, "tolist") else values
 
-    property dtype:
-        def __get__(self):
-            return mds.typing.primitives.int
+        for i, value in enumerate(values):
+            _check_integral(value, 0, UINT8_MAX, mds.typing.primitives.ubyte, i)
 
-    @classmethod
-    def from_namespace(cls, Namespace namespace, path) -> Optional[IntArray]:
+    def _write_elements(self, start: int, values) -> None:
         cdef:
-            String p = __cast_to_mds_string(path)
-            h_istring_t ish = p._ish
-            h_namespace_t nhandle = namespace._handle
-            h_marray_int_t handle
+            h_marray_ubyte_t handle = self._handle
+            size_t i, lo, hi, n
+            vector[uint8_t] staged
 
-        try:
-            handle = nhandle.lookup_int_array(ish, h_array_int_t())
-            retval = IntArray()
-            retval._handle = handle
-            return retval
-        except:
-            return None
+        values = values.tolist() if hasattr(values, "tolist") else list(values)
+        lo, hi = self._range_bounds_check(start)
+        n = len(values)
 
-    def bind_to_namespace(self, Namespace namespace):
-        pass  # TODO: See how these properly bind
+        if n > hi - lo:
+            raise IndexError('list range out of range')
 
-    def _numeric_bounds_check(self, value):
-        prim = Int(value)
-        return prim.python_value
+        # Everything is validated before the first write
+        staged.resize(n)
+
+        for i in range(n):
+            staged[i] = _check_integral(values[i], 0, UINT8_MAX, mds.typing.primitives.ubyte, i)
+
+        with nogil:
+            for i in range(n):
+                handle.write(lo + i, mv_ubyte(staged[i]))
 
     def _to_python(self, index):
-        return int_to_core_val(self._handle.frozen_read(index))
+        return ubyte_to_core_val(self._handle.frozen_read(index))
 
-    def _to_mds(self, index, value):
-        # Delegate bounds checking etc. to the primitive wrapper
-        wrapped = self._primitive(value)
-        self._handle.write(index, mv_int(value))
+    def read_range(self, start: int, stop: int, out=None):
+        cdef:
+            h_marray_ubyte_t handle = self._handle
+            uint8_t[::1] dest
+            uint8_t* data
+            size_t i, lo, hi, n
 
-    def copy(self):
+        lo, hi = self._range_bounds_check(start, stop)
+        n = hi - lo
+
+        if out is None:
+            out = MDSArrayBuffer(n, sizeof(uint8_t), b"B", mds.typing.primitives.ubyte)
+            data = <uint8_t*> (<MDSArrayBuffer> out)._data
+        else:
+            dest = out
+
+            if <size_t> dest.shape[0] < n:
+                raise ValueError(f"`out` holds {dest.shape[0]} elements, {n} required")
+            if not n:
+                return out
+
+            data = &dest[0]
+
+        with nogil:
+            for i in range(n):
+                data[i] = ubyte_to_core_val(handle.frozen_read(lo + i))
+
+        return out
+
+    def write_range(self, start: int, values) -> None:
         cdef:
-            size_t i = 0
-            size_t n = len(self)
+            h_marray_ubyte_t handle = self._handle
+            const uint8_t[::1] src
+            const uint8_t* data
+            size_t i, lo, hi, n
 
-        retval = IntArray(length=len(self))
+        try:
+            src = values
+        except (BufferError, TypeError, ValueError):
+            # Not a buffer of exactly this element type, so take the slow path
+            self._write_elements(start, values)
+            return
 
-        for i in range(n):
-            retval[i] = self[i]
+        lo, hi = self._range_bounds_check(start)
+        n = src.shape[0]
 
-        return retval
+        if n > hi - lo:
+            raise IndexError('list range out of range')
+        if not n:
+            return
+
+        data = &src[0]
+
+        with nogil:
+            for i in range(n):
+                handle.write(lo + i, mv_ubyte(data[i]))
 
     def __iadd__(self, other):
-        return self._handle.add(self._last_index, <int32_t> other)
+        return self._handle.add(self._last_index, <uint8_t> other)
 
     def __isub__(self, other):
-        return self._handle.sub(self._last_index, <int32_t> other)
+        return self._handle.sub(self._last_index, <uint8_t> other)
 
     def __imul__(self, other):
-        return self._handle.mul(self._last_index, <int32_t> other)
+        return self._handle.mul(self._last_index, <uint8_t> other)
 
     def __itruediv__(self, other):
-        return self._handle.div(self._last_index, <int32_t> other)
+        return self._handle.div(self._last_index, <uint8_t> other)
 
-cdef class UIntArray(MDSIntArrayBase):
+    def _sum(self):
+        cdef:
+            h_marray_ubyte_t handle = self._handle
+            size_t i, n = handle.size()
+            uint64_t acc = 0, v
 
-    cdef h_marray_uint_t _handle
-    _primitive = UInt
+        total = 0
 
-    def __cinit__(self, int length=0):
-        if length:
-            self._handle = create_uint_marray(<size_t> length)
+        with nogil:
+            for i in range(n):
+                v = ubyte_to_core_val(handle.frozen_read(i))
 
-    def __len__(self):
-        return self._handle.size()
+                if acc > UINT64_MAX - v:
+                    with gil:
+                        total += acc
 
-    def __hash__(self):
-        return self._handle.hash1()
+                    acc = 0
 
-    property dtype:
-        def __get__(self):
-            return mds.typing.primitives.uint
+                acc += v
 
-    @classmethod
-    def from_namespace(cls, Namespace namespace, path) -> Optional[UIntArray]:
+        return total + acc
+
+    def _arg_extreme(self, bint largest):
         cdef:
-            String p = __cast_to_mds_string(path)
-            h_istring_t ish = p._ish
-            h_namespace_t nhandle = namespace._handle
-            h_marray_uint_t handle
+            h_marray_ubyte_t handle = self._handle
+            size_t i, best = 0, n = handle.size()
+            uint8_t v, current = ubyte_to_core_val(handle.frozen_read(0))
+
+        with nogil:
+            for i in range(1, n):
+                v = ubyte_to_core_val(handle.frozen_read(i))
+
+                if (v > current) if largest else (v < current):
+                    best = i
+                    current = v
+
+        return best, current
+
+    def _count(self, value):
+        cdef:
+            h_marray_ubyte_t handle = self._handle
+            size_t i, c = 0, n = handle.size()
+            uint8_t target
 
         try:
-            handle = nhandle.lookup_uint_array(ish, h_array_uint_t())
-            retval = UIntArray()
-            retval._handle = handle
-            return retval
-        except:
-            return None
+            target = self._comparable(value)
+        except OverflowError:
+            return 0  # Out of range for this array, so can't be in it
+        except TypeError:
+            return sum(1 for v in self if v == value)
 
-    def bind_to_namespace(self, Namespace namespace):
-        pass  # TODO: See how these properly bind
+        with nogil:
+            for i in range(n):
+                if ubyte_to_core_val(handle.frozen_read(i)) == target:
+                    c += 1
 
-    def _numeric_bounds_check(self, value):
-        prim = UInt(value)
-        return prim.python_value
+        return c
 
-    def _to_python(self, index):
-        return uint_to_core_val(self._handle.frozen_read(index))
+    def _find(self, value, size_t start, size_t stop):
+        cdef:
+            h_marray_ubyte_t handle = self._handle
+            size_t i
+            Py_ssize_t found = -1
+            uint8_t target
 
-    def _to_mds(self, index, value):
-        # Delegate bounds checking etc. to the primitive wrapper
-        wrapped = self._primitive(value)
-        self._handle.write(index, mv_uint(value))
+        try:
+            target = self._comparable(value)
+        except OverflowError:
+            return found
+        except TypeError:
+            for i in range(start, stop):
+                if self[i] == value:
+                    return i
 
-    def copy(self):
+            return found
+
+        with nogil:
+            for i in range(start, stop):
+                if ubyte_to_core_val(handle.frozen_read(i)) == target:
+                    found = i
+                    break
+
+        return found
+
+    def _where(self, value):
         cdef:
-            size_t i = 0
-            size_t n = len(self)
+            h_marray_ubyte_t handle = self._handle
+            size_t i, n = handle.size()
+            vector[uint64_t] found
+            uint8_t target
+            MDSArrayBuffer retval
+            uint64_t* data
+
+        try:
+            target = self._comparable(value)
+        except OverflowError:
+            n = 0
+        except TypeError:
+            for i in range(n):
+                if self[i] == value:
+                    found.push_back(i)
+
+            n = 0
 
-        retval = UIntArray(length=len(self))
+        with nogil:
+            for i in range(n):
+                if ubyte_to_core_val(handle.frozen_read(i)) == target:
+                    found.push_back(i)
+
+        n = found.size()
+        retval = MDSArrayBuffer(n, sizeof(uint64_t), b"Q", mds.typing.primitives.ulong)
+        data = <uint64_t*> retval._data
 
         for i in range(n):
-            retval[i] = self[i]
+            data[i] = found[i]
 
         return retval
 
-    def __iadd__(self, other):
-        return self._handle.add(self._last_index, <uint32_t> other)
-
-    def __isub__(self, other):
-        return self._handle.sub(self._last_index, <uint32_t> other)
+    def _elementwise(self, int op, other):
+        cdef:
+            h_marray_ubyte_t handle = self._handle
+            h_marray_ubyte_t rhs
+            size_t i, n = handle.size()
+            bint from_array = isinstance(other, UByteArray)
+            int status = 0
+            uint8_t b
+            vector[uint8_t] results
+
+        if from_array:
+            self._check_operand(other)
+            rhs = (<UByteArray> other)._handle
+        else:
+            b = self._numeric_bounds_check(other)
 
-    def __imul__(self, other):
-        return self._handle.mul(self._last_index, <uint32_t> other)
+        results.resize(n)
 
-    def __itruediv__(self, other):
-        return self._handle.div(self._last_index, <uint32_t> other)
+        with nogil:
+            for i in range(n):
+                if from_array:
+                    b = ubyte_to_core_val(rhs.frozen_read(i))
 
-cdef class LongArray(MDSIntArrayBase):
+                status = apply_elementwise[uint8_t](op, ubyte_to_core_val(handle.frozen_read(i)), b, &results[i])
 
-    cdef h_marray_long_t _handle
-    _primitive = Long
+                if status:
+                    break
 
-    def __cinit__(self, int length=0):
-        if length:
-            self._handle = create_long_marray(<size_t> length)
+        if status:
+            self._elementwise_failed(status, i)
 
-    def __len__(self):
-        return self._handle.size()
+        with nogil:
+            for i in range(n):
+                handle.write(i, mv_ubyte(results[i]))
 
-    def __hash__(self):
-        return self._handle.hash1()
+    def _fill(self, value):
+        cdef:
+            h_marray_ubyte_t handle = self._handle
+            size_t i, n = handle.size()
+            uint8_t v = self._numeric_bounds_check(value)
 
-    property dtype:
-        def __get__(self):
-            return mds.typing.primitives.long
+        with nogil:
+            for i in range(n):
+                handle.write(i, mv_ubyte(v))
 
-    @classmethod
-    def from_namespace(cls, Namespace namespace, path) -> Optional[LongArray]:
+    def _clip(self, lower, upper):
         cdef:
-            String p = __cast_to_mds_string(path)
-            h_istring_t ish = p._ish
-            h_namespace_t nhandle = namespace._handle
-            h_marray_long_t handle
-
-        try:
-            handle = nhandle.lookup_long_array(ish, h_array_long_t())
-            retval = LongArray()
-            retval._handle = handle
-            return retval
-        except:
-            return None
+            h_marray_ubyte_t handle = self._handle
+            size_t i, n = handle.size()
+            bint has_lower = lower is not None, has_upper = upper is not None
+            uint8_t lo = 0, hi = 0, v
 
-    def bind_to_namespace(self, Namespace namespace):
-        pass  # TODO: See how these properly bind
+        if has_lower:
+            lo = self._numeric_bounds_check(max(lower, 0))
+        if has_upper:
+            hi = self._numeric_bounds_check(min(upper, 255))
 
-    def _numeric_bounds_check(self, value):
-        prim = Long(value)
-        return prim.python_value
+        with nogil:
+            for i in range(n):
+                v = ubyte_to_core_val(handle.frozen_read(i))
 
-    def _to_python(self, index):
-        return long_to_core_val(self._handle.frozen_read(index))
+                if has_lower and v < lo:
+                    handle.write(i, mv_ubyte(lo))
+                elif has_upper and v > hi:
+                    handle.write(i, mv_ubyte(hi))
 
-    def _to_mds(self, index, value):
-        # Delegate bounds checking etc. to the primitive wrapper
-        wrapped = self._primitive(value)
-        self._handle.write(index, mv_long(value))
 
-    def copy(self):
-        cdef:
-            size_t i = 0
-            size_t n = len(self)
+cdef class MDSUByteArrayIterator(object):
+    cdef:
+        UByteArray _array
+        h_marray_ubyte_t _handle
+        size_t _index
+        size_t _size
+        size_t _chunk
+        size_t _chunk_start
+        vector[uint8_t] _prefetched
+
+    def __cinit__(self, UByteArray array, size_t chunk=0):
+        self._array = array
+        self._handle = array._handle
+        self._index = 0
+        self._size = self._handle.size()
+        self._chunk = chunk
+        self._chunk_start = 0
 
-        retval = LongArray(length=len(self))
+    def __iter__(self):
+        return self
 
-        for i in range(n):
-            retval[i] = self[i]
+    def __next__(self):
+        cdef:
+            size_t i, n
+            uint8_t retval
 
-        return retval
+        if self._index >= self._size:
+            raise StopIteration
 
-    def __iadd__(self, other):
-        return self._handle.add(self._last_index, <int64_t> other)
+        if not self._chunk:
+            retval = ubyte_to_core_val(self._handle.frozen_read(self._index))
+        else:
+            if self._index >= self._chunk_start + self._prefetched.size():
+                n = min(self._chunk, self._size - self._index)
+                self._chunk_start = self._index
+                self._prefetched.resize(n)
 
-    def __isub__(self, other):
-        return self._handle.sub(self._last_index, <int64_t> other)
+                with nogil:
+                    for i in range(n):
+                        self._prefetched[i] = ubyte_to_core_val(self._handle.frozen_read(self._chunk_start + i))
 
-    def __imul__(self, other):
-        return self._handle.mul(self._last_index, <int64_t> other)
+            retval = self._prefetched[self._index - self._chunk_start]
 
-    def __itruediv__(self, other):
-        return self._handle.div(self._last_index, <int64_t> other)
+        self._index += 1
+        return retval
 
-cdef class ULongArray(MDSIntArrayBase):
+cdef class ShortArray(MDSIntArrayBase):
 
-    cdef h_marray_ulong_t _handle
-    _primitive = ULong
+    cdef h_marray_short_t _handle
+    _primitive = Short
 
     def __cinit__(self, int length=0):
         if length:
-            self._handle = create_ulong_marray(<size_t> length)
+            self._handle = create_short_marray(<size_t> length)
 
     def __len__(self):
         return self._handle.size()
@@ -983,19 +2094,19 @@ cdef class ULongArray(MDSIntArrayBase):
 
     property dtype:
         def __get__(self):
-            return mds.typing.primitives.ulong
+            return mds.typing.primitives.short
 
     @classmethod
-    def from_namespace(cls, Namespace namespace, path) -> Optional[ULongArray]:
+    def from_namespace(cls, Namespace namespace, path) -> Optional[ShortArray]:
         cdef:
             String p = __cast_to_mds_string(path)
             h_istring_t ish = p._ish
             h_namespace_t nhandle = namespace._handle
-            h_marray_ulong_t handle
+            h_marray_short_t handle
 
         try:
-            handle = nhandle.lookup_ulong_array(ish, h_array_ulong_t())
-            retval = ULongArray()
+            handle = nhandle.lookup_short_array(ish, h_array_short_t())
+            retval = ShortArray()
             retval._handle = handle
             return retval
         except:
@@ -1004,115 +2115,2875 @@ cdef class ULongArray(MDSIntArrayBase):
     def bind_to_namespace(self, Namespace namespace):
         pass  # TODO: See how these properly bind
 
-    def _numeric_bounds_check(self, value):
-        prim = ULong(value)
-        return prim.python_value
+    def __iter__(self):
+        return MDSShortArrayIterator(self)
 
-    def _to_python(self, index):
-        return ulong_to_core_val(self._handle.frozen_read(index))
+    def iterate(self, size_t chunk=0):
+        return MDSShortArrayIterator(self, chunk)
 
-    def _to_mds(self, index, value):
-        # Delegate bounds checking etc. to the primitive wrapper
-        wrapped = self._primitive(value)
-        self._handle.write(index, mv_ulong(value))
+    def to_buffer(self) -> MDSArrayBuffer:
+        cdef:
+            h_marray_short_t handle = self._handle
+            size_t i, n = handle.size()
+            MDSArrayBuffer retval = MDSArrayBuffer(n, sizeof(int16_t), b"h", mds.typing.primitives.short)
+            int16_t* data = <int16_t*> retval._data
+
+        with nogil:
+            for i in range(n):
+                data[i] = short_to_core_val(handle.frozen_read(i))
+
+        return retval
 
     def copy(self):
         cdef:
-            size_t i = 0
-            size_t n = len(self)
-
-        retval = ULongArray(length=len(self))
+            h_marray_short_t handle = self._handle
+            size_t i, n = handle.size()
+            ShortArray retval = ShortArray(length=n)
+            h_marray_short_t dest = retval._handle
 
-        for i in range(n):
-            retval[i] = self[i]
+        with nogil:
+            for i in range(n):
+                dest.write(i, handle.frozen_read(i))
 
         return retval
 
-    def __iadd__(self, other):
-        return self._handle.add(self._last_index, <uint64_t> other)
+    def _numeric_bounds_check(self, value):
+        return _check_integral(value, INT16_MIN, INT16_MAX, mds.typing.primitives.short)
 
-    def __isub__(self, other):
-        return self._handle.sub(self._last_index, <uint64_t> other)
+    def _to_mds(self, index, value):
+        self._handle.write(index, mv_short(<int16_t> value))
 
-    def __imul__(self, other):
-        return self._handle.mul(self._last_index, <uint64_t> other)
+    def validate(self, values) -> None:
+        cdef:
+            const int16_t[::1] src
+            Py_ssize_t i
 
-    def __itruediv__(self, other):
-        return self._handle.div(self._last_index, <uint64_t> other)
+        try:
+            src = values
+            return  # Every element of a buffer of this type is in bounds
+        except (BufferError, TypeError, ValueError):
+            pass
 
-cdef class FloatArray(MDSFloatArrayBase):
+        if _validate_wide(values, INT16_MIN, INT16_MAX, mds.typing.primitives.short):
+            return
 
-    cdef h_marray_float_t _handle
-    _primitive = Float
+        # Other buffers (NumPy especially) hand back native Python values this way
+        values = values.tolist() if hasattr(values, "tolist") else values
 
-    def __cinit__(self, int length=0):
-        if length:
-            self._handle = create_float_marray(<size_t> length)
+        for i, value in enumerate(values):
+            _check_integral(value, INT16_MIN, INT16_MAX, mds.typing.primitives.short, i)
 
-    def __len__(self):
-        return self._handle.size()
+    def _write_elements(self, start: int, values) -> None:
+        cdef:
+            h_marray_short_t handle = self._handle
+            size_t i, lo, hi, n
+            vector[int16_t] staged
 
-    def __hash__(self):
-        return self._handle.hash1()
+        values = values.tolist() if hasattr(values, "tolist") else list(values)
+        lo, hi = self._range_bounds_check(start)
+        n = len(values)
 
-    property dtype:
+        if n > hi - lo:
+            raise IndexError('list range out of range')
+
+        # Everything is validated before the first write
+        staged.resize(n)
+
+        for i in range(n):
+            staged[i] = _check_integral(values[i], INT16_MIN, INT16_MAX, mds.typing.primitives.short, i)
+
+        with nogil:
+            for i in range(n):
+                handle.write(lo + i, mv_short(staged[i]))
+
+    def _to_python(self, index):
+        return short_to_core_val(self._handle.frozen_read(index))
+
+    def read_range(self, start: int, stop: int, out=None):
+        cdef:
+            h_marray_short_t handle = self._handle
+            int16_t[::1] dest
+            int16_t* data
+            size_t i, lo, hi, n
+
+        lo, hi = self._range_bounds_check(start, stop)
+        n = hi - lo
+
+        if out is None:
+            out = MDSArrayBuffer(n, sizeof(int16_t), b"h", mds.typing.primitives.short)
+            data = <int16_t*> (<MDSArrayBuffer> out)._data
+        else:
+            dest = out
+
+            if <size_t> dest.shape[0] < n:
+                raise ValueError(f"`out` holds {dest.shape[0]} elements, {n} required")
+            if not n:
+                return out
+
+            data = &dest[0]
+
+        with nogil:
+            for i in range(n):
+                data[i] = short_to_core_val(handle.frozen_read(lo + i))
+
+        return out
+
+    def write_range(self, start: int, values) -> None:
+        cdef:
+            h_marray_short_t handle = self._handle
+            const int16_t[::1] src
+            const int16_t* data
+            size_t i, lo, hi, n
+
+        try:
+            src = values
+        except (BufferError, TypeError, ValueError):
+            # Not a buffer of exactly this element type, so take the slow path
+            self._write_elements(start, values)
+            return
+
+        lo, hi = self._range_bounds_check(start)
+        n = src.shape[0]
+
+        if n > hi - lo:
+            raise IndexError('list range out of range')
+        if not n:
+            return
+
+        data = &src[0]
+
+        with nogil:
+            for i in range(n):
+                handle.write(lo + i, mv_short(data[i]))
+
+    def __iadd__(self, other):
+        return self._handle.add(self._last_index, <int16_t> other)
+
+    def __isub__(self, other):
+        return self._handle.sub(self._last_index, <int16_t> other)
+
+    def __imul__(self, other):
+        return self._handle.mul(self._last_index, <int16_t> other)
+
+    def __itruediv__(self, other):
+        return self._handle.div(self._last_index, <int16_t> other)
+
+    def _sum(self):
+        cdef:
+            h_marray_short_t handle = self._handle
+            size_t i, n = handle.size()
+            int64_t acc = 0, v
+
+        total = 0
+
+        with nogil:
+            for i in range(n):
+                v = short_to_core_val(handle.frozen_read(i))
+
+                if (v > 0 and acc > INT64_MAX - v) or (v < 0 and acc < INT64_MIN - v):
+                    with gil:
+                        total += acc
+
+                    acc = 0
+
+                acc += v
+
+        return total + acc
+
+    def _arg_extreme(self, bint largest):
+        cdef:
+            h_marray_short_t handle = self._handle
+            size_t i, best = 0, n = handle.size()
+            int16_t v, current = short_to_core_val(handle.frozen_read(0))
+
+        with nogil:
+            for i in range(1, n):
+                v = short_to_core_val(handle.frozen_read(i))
+
+                if (v > current) if largest else (v < current):
+                    best = i
+                    current = v
+
+        return best, current
+
+    def _count(self, value):
+        cdef:
+            h_marray_short_t handle = self._handle
+            size_t i, c = 0, n = handle.size()
+            int16_t target
+
+        try:
+            target = self._comparable(value)
+        except OverflowError:
+            return 0  # Out of range for this array, so can't be in it
+        except TypeError:
+            return sum(1 for v in self if v == value)
+
+        with nogil:
+            for i in range(n):
+                if short_to_core_val(handle.frozen_read(i)) == target:
+                    c += 1
+
+        return c
+
+    def _find(self, value, size_t start, size_t stop):
+        cdef:
+            h_marray_short_t handle = self._handle
+            size_t i
+            Py_ssize_t found = -1
+            int16_t target
+
+        try:
+            target = self._comparable(value)
+        except OverflowError:
+            return found
+        except TypeError:
+            for i in range(start, stop):
+                if self[i] == value:
+                    return i
+
+            return found
+
+        with nogil:
+            for i in range(start, stop):
+                if short_to_core_val(handle.frozen_read(i)) == target:
+                    found = i
+                    break
+
+        return found
+
+    def _where(self, value):
+        cdef:
+            h_marray_short_t handle = self._handle
+            size_t i, n = handle.size()
+            vector[uint64_t] found
+            int16_t target
+            MDSArrayBuffer retval
+            uint64_t* data
+
+        try:
+            target = self._comparable(value)
+        except OverflowError:
+            n = 0
+        except TypeError:
+            for i in range(n):
+                if self[i] == value:
+                    found.push_back(i)
+
+            n = 0
+
+        with nogil:
+            for i in range(n):
+                if short_to_core_val(handle.frozen_read(i)) == target:
+                    found.push_back(i)
+
+        n = found.size()
+        retval = MDSArrayBuffer(n, sizeof(uint64_t), b"Q", mds.typing.primitives.ulong)
+        data = <uint64_t*> retval._data
+
+        for i in range(n):
+            data[i] = found[i]
+
+        return retval
+
+    def _elementwise(self, int op, other):
+        cdef:
+            h_marray_short_t handle = self._handle
+            h_marray_short_t rhs
+            size_t i, n = handle.size()
+            bint from_array = isinstance(other, ShortArray)
+            int status = 0
+            int16_t b
+            vector[int16_t] results
+
+        if from_array:
+            self._check_operand(other)
+            rhs = (<ShortArray> other)._handle
+        else:
+            b = self._numeric_bounds_check(other)
+
+        results.resize(n)
+
+        with nogil:
+            for i in range(n):
+                if from_array:
+                    b = short_to_core_val(rhs.frozen_read(i))
+
+                status = apply_elementwise[int16_t](op, short_to_core_val(handle.frozen_read(i)), b, &results[i])
+
+                if status:
+                    break
+
+        if status:
+            self._elementwise_failed(status, i)
+
+        with nogil:
+            for i in range(n):
+                handle.write(i, mv_short(results[i]))
+
+    def _fill(self, value):
+        cdef:
+            h_marray_short_t handle = self._handle
+            size_t i, n = handle.size()
+            int16_t v = self._numeric_bounds_check(value)
+
+        with nogil:
+            for i in range(n):
+                handle.write(i, mv_short(v))
+
+    def _clip(self, lower, upper):
+        cdef:
+            h_marray_short_t handle = self._handle
+            size_t i, n = handle.size()
+            bint has_lower = lower is not None, has_upper = upper is not None
+            int16_t lo = 0, hi = 0, v
+
+        if has_lower:
+            lo = self._numeric_bounds_check(max(lower, -32768))
+        if has_upper:
+            hi = self._numeric_bounds_check(min(upper, 32767))
+
+        with nogil:
+            for i in range(n):
+                v = short_to_core_val(handle.frozen_read(i))
+
+                if has_lower and v < lo:
+                    handle.write(i, mv_short(lo))
+                elif has_upper and v > hi:
+                    handle.write(i, mv_short(hi))
+
+
+cdef class MDSShortArrayIterator(object):
+    cdef:
+        ShortArray _array
+        h_marray_short_t _handle
+        size_t _index
+        size_t _size
+        size_t _chunk
+        size_t _chunk_start
+        vector[int16_t] _prefetched
+
+    def __cinit__(self, ShortArray array, size_t chunk=0):
+        self._array = array
+        self._handle = array._handle
+        self._index = 0
+        self._size = self._handle.size()
+        self._chunk = chunk
+        self._chunk_start = 0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        cdef:
+            size_t i, n
+            int16_t retval
+
+        if self._index >= self._size:
+            raise StopIteration
+
+        if not self._chunk:
+            retval = short_to_core_val(self._handle.frozen_read(self._index))
+        else:
+            if self._index >= self._chunk_start + self._prefetched.size():
+                n = min(self._chunk, self._size - self._index)
+                self._chunk_start = self._index
+                self._prefetched.resize(n)
+
+                with nogil:
+                    for i in range(n):
+                        self._prefetched[i] = short_to_core_val(self._handle.frozen_read(self._chunk_start + i))
+
+            retval = self._prefetched[self._index - self._chunk_start]
+
+        self._index += 1
+        return retval
+
+cdef class UShortArray(MDSIntArrayBase):
+
+    cdef h_marray_ushort_t _handle
+    _primitive = UShort
+
+    def __cinit__(self, int length=0):
+        if length:
+            self._handle = create_ushort_marray(<size_t> length)
+
+    def __len__(self):
+        return self._handle.size()
+
+    def __hash__(self):
+        return self._handle.hash1()
+
+    property dtype:
+        def __get__(self):
+            return mds.typing.primitives.ushort
+
+    @classmethod
+    def from_namespace(cls, Namespace namespace, path) -> Optional[UShortArray]:
+        cdef:
+            String p = __cast_to_mds_string(path)
+            h_istring_t ish = p._ish
+            h_namespace_t nhandle = namespace._handle
+            h_marray_ushort_t handle
+
+        try:
+            handle = nhandle.lookup_ushort_array(ish, h_array_ushort_t())
+            retval = UShortArray()
+            retval._handle = handle
+            return retval
+        except:
+            return None
+
+    def bind_to_namespace(self, Namespace namespace):
+        pass  # TODO: See how these properly bind
+
+    def __iter__(self):
+        return MDSUShortArrayIterator(self)
+
+    def iterate(self, size_t chunk=0):
+        return MDSUShortArrayIterator(self, chunk)
+
+    def to_buffer(self) -> MDSArrayBuffer:
+        cdef:
+            h_marray_ushort_t handle = self._handle
+            size_t i, n = handle.size()
+            MDSArrayBuffer retval = MDSArrayBuffer(n, sizeof(uint16_t), b"H", mds.typing.primitives.ushort)
+            uint16_t* data = <uint16_t*> retval._data
+
+        with nogil:
+            for i in range(n):
+                data[i] = ushort_to_core_val(handle.frozen_read(i))
+
+        return retval
+
+    def copy(self):
+        cdef:
+            h_marray_ushort_t handle = self._handle
+            size_t i, n = handle.size()
+            UShortArray retval = UShortArray(length=n)
+            h_marray_ushort_t dest = retval._handle
+
+        with nogil:
+            for i in range(n):
+                dest.write(i, handle.frozen_read(i))
+
+        return retval
+
+    def _numeric_bounds_check(self, value):
+        return _check_integral(value, 0, UINT16_MAX, mds.typing.primitives.ushort)
+
+    def _to_mds(self, index, value):
+        self._handle.write(index, mv_ushort(<uint16_t> value))
+
+    def validate(self, values) -> None:
+        cdef:
+            const uint16_t[::1] src
+            Py_ssize_t i
+
+        try:
+            src = values
+            return  # Every element of a buffer of this type is in bounds
+        except (BufferError, TypeError, ValueError):
+            pass
+
+        if _validate_wide(values, 0, UINT16_MAX, mds.typing.primitives.ushort):
+            return
+
+        # Other buffers (NumPy especially) hand back native Python values this way
+        values = values.tolist() if hasattr(values, "tolist") else values
+
+        for i, value in enumerate(values):
+            _check_integral(value, 0, UINT16_MAX, mds.typing.primitives.ushort, i)
+
+    def _write_elements(self, start: int, values) -> None:
+        cdef:
+            h_marray_ushort_t handle = self._handle
+            size_t i, lo, hi, n
+            vector[uint16_t] staged
+
+        values = values.tolist() if hasattr(values, "tolist") else list(values)
+        lo, hi = self._range_bounds_check(start)
+        n = len(values)
+
+        if n > hi - lo:
+            raise IndexError('list range out of range')
+
+        # Everything is validated before the first write
+        staged.resize(n)
+
+        for i in range(n):
+            staged[i] = _check_integral(values[i], 0, UINT16_MAX, mds.typing.primitives.ushort, i)
+
+        with nogil:
+            for i in range(n):
+                handle.write(lo + i, mv_ushort(staged[i]))
+
+    def _to_python(self, index):
+        return ushort_to_core_val(self._handle.frozen_read(index))
+
+    def read_range(self, start: int, stop: int, out=None):
+        cdef:
+            h_marray_ushort_t handle = self._handle
+            uint16_t[::1] dest
+            uint16_t* data
+            size_t i, lo, hi, n
+
+        lo, hi = self._range_bounds_check(start, stop)
+        n = hi - lo
+
+        if out is None:
+            out = MDSArrayBuffer(n, sizeof(uint16_t), b"H", mds.typing.primitives.ushort)
+            data = <uint16_t*> (<MDSArrayBuffer> out)._data
+        else:
+            dest = out
+
+            if <size_t> dest.shape[0] < n:
+                raise ValueError(f"`out` holds {dest.shape[0]} elements, {n} required")
+            if not n:
+                return out
+
+            data = &dest[0]
+
+        with nogil:
+            for i in range(n):
+                data[i] = ushort_to_core_val(handle.frozen_read(lo + i))
+
+        return out
+
+    def write_range(self, start: int, values) -> None:
+        cdef:
+            h_marray_ushort_t handle = self._handle
+            const uint16_t[::1] src
+            const uint16_t* data
+            size_t i, lo, hi, n
+
+        try:
+            src = values
+        except (BufferError, TypeError, ValueError):
+            # Not a buffer of exactly this element type, so take the slow path
+            self._write_elements(start, values)
+            return
+
+        lo, hi = self._range_bounds_check(start)
+        n = src.shape[0]
+
+        if n > hi - lo:
+            raise IndexError('list range out of range')
+        if not n:
+            return
+
+        data = &src[0]
+
+        with nogil:
+            for i in range(n):
+                handle.write(lo + i, mv_ushort(data[i]))
+
+    def __iadd__(self, other):
+        return self._handle.add(self._last_index, <uint16_t> other)
+
+    def __isub__(self, other):
+        return self._handle.sub(self._last_index, <uint16_t> other)
+
+    def __imul__(self, other):
+        return self._handle.mul(self._last_index, <uint16_t> other)
+
+    def __itruediv__(self, other):
+        return self._handle.div(self._last_index, <uint16_t> other)
+
+    def _sum(self):
+        cdef:
+            h_marray_ushort_t handle = self._handle
+            size_t i, n = handle.size()
+            uint64_t acc = 0, v
+
+        total = 0
+
+        with nogil:
+            for i in range(n):
+                v = ushort_to_core_val(handle.frozen_read(i))
+
+                if acc > UINT64_MAX - v:
+                    with gil:
+                        total += acc
+
+                    acc = 0
+
+                acc += v
+
+        return total + acc
+
+    def _arg_extreme(self, bint largest):
+        cdef:
+            h_marray_ushort_t handle = self._handle
+            size_t i, best = 0, n = handle.size()
+            uint16_t v, current = ushort_to_core_val(handle.frozen_read(0))
+
+        with nogil:
+            for i in range(1, n):
+                v = ushort_to_core_val(handle.frozen_read(i))
+
+                if (v > current) if largest else (v < current):
+                    best = i
+                    current = v
+
+        return best, current
+
+    def _count(self, value):
+        cdef:
+            h_marray_ushort_t handle = self._handle
+            size_t i, c = 0, n = handle.size()
+            uint16_t target
+
+        try:
+            target = self._comparable(value)
+        except OverflowError:
+            return 0  # Out of range for this array, so can't be in it
+        except TypeError:
+            return sum(1 for v in self if v == value)
+
+        with nogil:
+            for i in range(n):
+                if ushort_to_core_val(handle.frozen_read(i)) == target:
+                    c += 1
+
+        return c
+
+    def _find(self, value, size_t start, size_t stop):
+        cdef:
+            h_marray_ushort_t handle = self._handle
+            size_t i
+            Py_ssize_t found = -1
+            uint16_t target
+
+        try:
+            target = self._comparable(value)
+        except OverflowError:
+            return found
+        except TypeError:
+            for i in range(start, stop):
+                if self[i] == value:
+                    return i
+
+            return found
+
+        with nogil:
+            for i in range(start, stop):
+                if ushort_to_core_val(handle.frozen_read(i)) == target:
+                    found = i
+                    break
+
+        return found
+
+    def _where(self, value):
+        cdef:
+            h_marray_ushort_t handle = self._handle
+            size_t i, n = handle.size()
+            vector[uint64_t] found
+            uint16_t target
+            MDSArrayBuffer retval
+            uint64_t* data
+
+        try:
+            target = self._comparable(value)
+        except OverflowError:
+            n = 0
+        except TypeError:
+            for i in range(n):
+                if self[i] == value:
+                    found.push_back(i)
+
+            n = 0
+
+        with nogil:
+            for i in range(n):
+                if ushort_to_core_val(handle.frozen_read(i)) == target:
+                    found.push_back(i)
+
+        n = found.size()
+        retval = MDSArrayBuffer(n, sizeof(uint64_t), b"Q", mds.typing.primitives.ulong)
+        data = <uint64_t*> retval._data
+
+        for i in range(n):
+            data[i] = found[i]
+
+        return retval
+
+    def _elementwise(self, int op, other):
+        cdef:
+            h_marray_ushort_t handle = self._handle
+            h_marray_ushort_t rhs
+            size_t i, n = handle.size()
+            bint from_array = isinstance(other, UShortArray)
+            int status = 0
+            uint16_t b
+            vector[uint16_t] results
+
+        if from_array:
+            self._check_operand(other)
+            rhs = (<UShortArray> other)._handle
+        else:
+            b = self._numeric_bounds_check(other)
+
+        results.resize(n)
+
+        with nogil:
+            for i in range(n):
+                if from_array:
+                    b = ushort_to_core_val(rhs.frozen_read(i))
+
+                status = apply_elementwise[uint16_t](op, ushort_to_core_val(handle.frozen_read(i)), b, &results[i])
+
+                if status:
+                    break
+
+        if status:
+            self._elementwise_failed(status, i)
+
+        with nogil:
+            for i in range(n):
+                handle.write(i, mv_ushort(results[i]))
+
+    def _fill(self, value):
+        cdef:
+            h_marray_ushort_t handle = self._handle
+            size_t i, n = handle.size()
+            uint16_t v = self._numeric_bounds_check(value)
+
+        with nogil:
+            for i in range(n):
+                handle.write(i, mv_ushort(v))
+
+    def _clip(self, lower, upper):
+        cdef:
+            h_marray_ushort_t handle = self._handle
+            size_t i, n = handle.size()
+            bint has_lower = lower is not None, has_upper = upper is not None
+            uint16_t lo = 0, hi = 0, v
+
+        if has_lower:
+            lo = self._numeric_bounds_check(max(lower, 0))
+        if has_upper:
+            hi = self._numeric_bounds_check(min(upper, 65535))
+
+        with nogil:
+            for i in range(n):
+                v = ushort_to_core_val(handle.frozen_read(i))
+
+                if has_lower and v < lo:
+                    handle.write(i, mv_ushort(lo))
+                elif has_upper and v > hi:
+                    handle.write(i, mv_ushort(hi))
+
+
+cdef class MDSUShortArrayIterator(object):
+    cdef:
+        UShortArray _array
+        h_marray_ushort_t _handle
+        size_t _index
+        size_t _size
+        size_t _chunk
+        size_t _chunk_start
+        vector[uint16_t] _prefetched
+
+    def __cinit__(self, UShortArray array, size_t chunk=0):
+        self._array = array
+        self._handle = array._handle
+        self._index = 0
+        self._size = self._handle.size()
+        self._chunk = chunk
+        self._chunk_start = 0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        cdef:
+            size_t i, n
+            uint16_t retval
+
+        if self._index >= self._size:
+            raise StopIteration
+
+        if not self._chunk:
+            retval = ushort_to_core_val(self._handle.frozen_read(self._index))
+        else:
+            if self._index >= self._chunk_start + self._prefetched.size():
+                n = min(self._chunk, self._size - self._index)
+                self._chunk_start = self._index
+                self._prefetched.resize(n)
+
+                with nogil:
+                    for i in range(n):
+                        self._prefetched[i] = ushort_to_core_val(self._handle.frozen_read(self._chunk_start + i))
+
+            retval = self._prefetched[self._index - self._chunk_start]
+
+        self._index += 1
+        return retval
+
+cdef class IntArray(MDSIntArrayBase):
+
+    cdef h_marray_int_t _handle
+    _primitive = Int
+
+    def __cinit__(self, int length=0):
+        if length:
+            self._handle = create_int_marray(<size_t> length)
+
+    def __len__(self):
+        return self._handle.size()
+
+    def __hash__(self):
+        return self._handle.hash1()
+
+    property dtype:
+        def __get__(self):
+            return mds.typing.primitives.int
+
+    @classmethod
+    def from_namespace(cls, Namespace namespace, path) -> Optional[IntArray]:
+        cdef:
+            String p = __cast_to_mds_string(path)
+            h_istring_t ish = p._ish
+            h_namespace_t nhandle = namespace._handle
+            h_marray_int_t handle
+
+        try:
+            handle = nhandle.lookup_int_array(ish, h_array_int_t())
+            retval = IntArray()
+            retval._handle = handle
+            return retval
+        except:
+            return None
+
+    def bind_to_namespace(self, Namespace namespace):
+        pass  # TODO: See how these properly bind
+
+    def __iter__(self):
+        return MDSIntArrayIterator(self)
+
+    def iterate(self, size_t chunk=0):
+        return MDSIntArrayIterator(self, chunk)
+
+    def to_buffer(self) -> MDSArrayBuffer:
+        cdef:
+            h_marray_int_t handle = self._handle
+            size_t i, n = handle.size()
+            MDSArrayBuffer retval = MDSArrayBuffer(n, sizeof(int32_t), b"i", mds.typing.primitives.int)
+            int32_t* data = <int32_t*> retval._data
+
+        with nogil:
+            for i in range(n):
+                data[i] = int_to_core_val(handle.frozen_read(i))
+
+        return retval
+
+    def copy(self):
+        cdef:
+            h_marray_int_t handle = self._handle
+            size_t i, n = handle.size()
+            IntArray retval = IntArray(length=n)
+            h_marray_int_t dest = retval._handle
+
+        with nogil:
+            for i in range(n):
+                dest.write(i, handle.frozen_read(i))
+
+        return retval
+
+    def _numeric_bounds_check(self, value):
+        return _check_integral(value, INT32_MIN, INT32_MAX, mds.typing.primitives.int)
+
+    def _to_mds(self, index, value):
+        self._handle.write(index, mv_int(<int32_t> value))
+
+    def validate(self, values) -> None:
+        cdef:
+            const int32_t[::1] src
+            Py_ssize_t i
+
+        try:
+            src = values
+            return  # Every element of a buffer of this type is in bounds
+        except (BufferError, TypeError, ValueError):
+            pass
+
+        if _validate_wide(values, INT32_MIN, INT32_MAX, mds.typing.primitives.int):
+            return
+
+        # Other buffers (NumPy especially) hand back native Python values this way
+        values = values.tolist() if hasattr(values, "tolist") else values
+
+        for i, value in enumerate(values):
+            _check_integral(value, INT32_MIN, INT32_MAX, mds.typing.primitives.int, i)
+
+    def _write_elements(self, start: int, values) -> None:
+        cdef:
+            h_marray_int_t handle = self._handle
+            size_t i, lo, hi, n
+            vector[int32_t] staged
+
+        values = values.tolist() if hasattr(values, "tolist") else list(values)
+        lo, hi = self._range_bounds_check(start)
+        n = len(values)
+
+        if n > hi - lo:
+            raise IndexError('list range out of range')
+
+        # Everything is validated before the first write
+        staged.resize(n)
+
+        for i in range(n):
+            staged[i] = _check_integral(values[i], INT32_MIN, INT32_MAX, mds.typing.primitives.int, i)
+
+        with nogil:
+            for i in range(n):
+                handle.write(lo + i, mv_int(staged[i]))
+
+    def _to_python(self, index):
+        return int_to_core_val(self._handle.frozen_read(index))
+
+    def read_range(self, start: int, stop: int, out=None):
+        cdef:
+            h_marray_int_t handle = self._handle
+            int32_t[::1] dest
+            int32_t* data
+            size_t i, lo, hi, n
+
+        lo, hi = self._range_bounds_check(start, stop)
+        n = hi - lo
+
+        if out is None:
+            out = MDSArrayBuffer(n, sizeof(int32_t), b"i", mds.typing.primitives.int)
+            data = <int32_t*> (<MDSArrayBuffer> out)._data
+        else:
+            dest = out
+
+            if <size_t> dest.shape[0] < n:
+                raise ValueError(f"`out` holds {dest.shape[0]} elements, {n} required")
+            if not n:
+                return out
+
+            data = &dest[0]
+
+        with nogil:
+            for i in range(n):
+                data[i] = int_to_core_val(handle.frozen_read(lo + i))
+
+        return out
+
+    def write_range(self, start: int, values) -> None:
+        cdef:
+            h_marray_int_t handle = self._handle
+            const int32_t[::1] src
+            const int32_t* data
+            size_t i, lo, hi, n
+
+        try:
+            src = values
+        except (BufferError, TypeError, ValueError):
+            # Not a buffer of exactly this element type, so take the slow path
+            self._write_elements(start, values)
+            return
+
+        lo, hi = self._range_bounds_check(start)
+        n = src.shape[0]
+
+        if n > hi - lo:
+            raise IndexError('list range out of range')
+        if not n:
+            return
+
+        data = &src[0]
+
+        with nogil:
+            for i in range(n):
+                handle.write(lo + i, mv_int(data[i]))
+
+    def __iadd__(self, other):
+        return self._handle.add(self._last_index, <int32_t> other)
+
+    def __isub__(self, other):
+        return self._handle.sub(self._last_index, <int32_t> other)
+
+    def __imul__(self, other):
+        return self._handle.mul(self._last_index, <int32_t> other)
+
+    def __itruediv__(self, other):
+        return self._handle.div(self._last_index, <int32_t> other)
+
+    def _sum(self):
+        cdef:
+            h_marray_int_t handle = self._handle
+            size_t i, n = handle.size()
+            int64_t acc = 0, v
+
+        total = 0
+
+        with nogil:
+            for i in range(n):
+                v = int_to_core_val(handle.frozen_read(i))
+
+                if (v > 0 and acc > INT64_MAX - v) or (v < 0 and acc < INT64_MIN - v):
+                    with gil:
+                        total += acc
+
+                    acc = 0
+
+                acc += v
+
+        return total + acc
+
+    def _arg_extreme(self, bint largest):
+        cdef:
+            h_marray_int_t handle = self._handle
+            size_t i, best = 0, n = handle.size()
+            int32_t v, current = int_to_core_val(handle.frozen_read(0))
+
+        with nogil:
+            for i in range(1, n):
+                v = int_to_core_val(handle.frozen_read(i))
+
+                if (v > current) if largest else (v < current):
+                    best = i
+                    current = v
+
+        return best, current
+
+    def _count(self, value):
+        cdef:
+            h_marray_int_t handle = self._handle
+            size_t i, c = 0, n = handle.size()
+            int32_t target
+
+        try:
+            target = self._comparable(value)
+        except OverflowError:
+            return 0  # Out of range for this array, so can't be in it
+        except TypeError:
+            return sum(1 for v in self if v == value)
+
+        with nogil:
+            for i in range(n):
+                if int_to_core_val(handle.frozen_read(i)) == target:
+                    c += 1
+
+        return c
+
+    def _find(self, value, size_t start, size_t stop):
+        cdef:
+            h_marray_int_t handle = self._handle
+            size_t i
+            Py_ssize_t found = -1
+            int32_t target
+
+        try:
+            target = self._comparable(value)
+        except OverflowError:
+            return found
+        except TypeError:
+            for i in range(start, stop):
+                if self[i] == value:
+                    return i
+
+            return found
+
+        with nogil:
+            for i in range(start, stop):
+                if int_to_core_val(handle.frozen_read(i)) == target:
+                    found = i
+                    break
+
+        return found
+
+    def _where(self, value):
+        cdef:
+            h_marray_int_t handle = self._handle
+            size_t i, n = handle.size()
+            vector[uint64_t] found
+            int32_t target
+            MDSArrayBuffer retval
+            uint64_t* data
+
+        try:
+            target = self._comparable(value)
+        except OverflowError:
+            n = 0
+        except TypeError:
+            for i in range(n):
+                if self[i] == value:
+                    found.push_back(i)
+
+            n = 0
+
+        with nogil:
+            for i in range(n):
+                if int_to_core_val(handle.frozen_read(i)) == target:
+                    found.push_back(i)
+
+        n = found.size()
+        retval = MDSArrayBuffer(n, sizeof(uint64_t), b"Q", mds.typing.primitives.ulong)
+        data = <uint64_t*> retval._data
+
+        for i in range(n):
+            data[i] = found[i]
+
+        return retval
+
+    def _elementwise(self, int op, other):
+        cdef:
+            h_marray_int_t handle = self._handle
+            h_marray_int_t rhs
+            size_t i, n = handle.size()
+            bint from_array = isinstance(other, IntArray)
+            int status = 0
+            int32_t b
+            vector[int32_t] results
+
+        if from_array:
+            self._check_operand(other)
+            rhs = (<IntArray> other)._handle
+        else:
+            b = self._numeric_bounds_check(other)
+
+        results.resize(n)
+
+        with nogil:
+            for i in range(n):
+                if from_array:
+                    b = int_to_core_val(rhs.frozen_read(i))
+
+                status = apply_elementwise[int32_t](op, int_to_core_val(handle.frozen_read(i)), b, &results[i])
+
+                if status:
+                    break
+
+        if status:
+            self._elementwise_failed(status, i)
+
+        with nogil:
+            for i in range(n):
+                handle.write(i, mv_int(results[i]))
+
+    def _fill(self, value):
+        cdef:
+            h_marray_int_t handle = self._handle
+            size_t i, n = handle.size()
+            int32_t v = self._numeric_bounds_check(value)
+
+        with nogil:
+            for i in range(n):
+                handle.write(i, mv_int(v))
+
+    def _clip(self, lower, upper):
+        cdef:
+            h_marray_int_t handle = self._handle
+            size_t i, n = handle.size()
+            bint has_lower = lower is not None, has_upper = upper is not None
+            int32_t lo = 0, hi = 0, v
+
+        if has_lower:
+            lo = self._numeric_bounds_check(max(lower, -2147483648))
+        if has_upper:
+            hi = self._numeric_bounds_check(min(upper, 2147483647))
+
+        with nogil:
+            for i in range(n):
+                v = int_to_core_val(handle.frozen_read(i))
+
+                if has_lower and v < lo:
+                    handle.write(i, mv_int(lo))
+                elif has_upper and v > hi:
+                    handle.write(i, mv_int(hi))
+
+
+cdef class MDSIntArrayIterator(object):
+    cdef:
+        IntArray _array
+        h_marray_int_t _handle
+        size_t _index
+        size_t _size
+        size_t _chunk
+        size_t _chunk_start
+        vector[int32_t] _prefetched
+
+    def __cinit__(self, IntArray array, size_t chunk=0):
+        self._array = array
+        self._handle = array._handle
+        self._index = 0
+        self._size = self._handle.size()
+        self._chunk = chunk
+        self._chunk_start = 0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        cdef:
+            size_t i, n
+            int32_t retval
+
+        if self._index >= self._size:
+            raise StopIteration
+
+        if not self._chunk:
+            retval = int_to_core_val(self._handle.frozen_read(self._index))
+        else:
+            if self._index >= self._chunk_start + self._prefetched.size():
+                n = min(self._chunk, self._size - self._index)
+                self._chunk_start = self._index
+                self._prefetched.resize(n)
+
+                with nogil:
+                    for i in range(n):
+                        self._prefetched[i] = int_to_core_val(self._handle.frozen_read(self._chunk_start + i))
+
+            retval = self._prefetched[self._index - self._chunk_start]
+
+        self._index += 1
+        return retval
+
+cdef class UIntArray(MDSIntArrayBase):
+
+    cdef h_marray_uint_t _handle
+    _primitive = UInt
+
+    def __cinit__(self, int length=0):
+        if length:
+            self._handle = create_uint_marray(<size_t> length)
+
+    def __len__(self):
+        return self._handle.size()
+
+    def __hash__(self):
+        return self._handle.hash1()
+
+    property dtype:
+        def __get__(self):
+            return mds.typing.primitives.uint
+
+    @classmethod
+    def from_namespace(cls, Namespace namespace, path) -> Optional[UIntArray]:
+        cdef:
+            String p = __cast_to_mds_string(path)
+            h_istring_t ish = p._ish
+            h_namespace_t nhandle = namespace._handle
+            h_marray_uint_t handle
+
+        try:
+            handle = nhandle.lookup_uint_array(ish, h_array_uint_t())
+            retval = UIntArray()
+            retval._handle = handle
+            return retval
+        except:
+            return None
+
+    def bind_to_namespace(self, Namespace namespace):
+        pass  # TODO: See how these properly bind
+
+    def __iter__(self):
+        return MDSUIntArrayIterator(self)
+
+    def iterate(self, size_t chunk=0):
+        return MDSUIntArrayIterator(self, chunk)
+
+    def to_buffer(self) -> MDSArrayBuffer:
+        cdef:
+            h_marray_uint_t handle = self._handle
+            size_t i, n = handle.size()
+            MDSArrayBuffer retval = MDSArrayBuffer(n, sizeof(uint32_t), b"I", mds.typing.primitives.uint)
+            uint32_t* data = <uint32_t*> retval._data
+
+        with nogil:
+            for i in range(n):
+                data[i] = uint_to_core_val(handle.frozen_read(i))
+
+        return retval
+
+    def copy(self):
+        cdef:
+            h_marray_uint_t handle = self._handle
+            size_t i, n = handle.size()
+            UIntArray retval = UIntArray(length=n)
+            h_marray_uint_t dest = retval._handle
+
+        with nogil:
+            for i in range(n):
+                dest.write(i, handle.frozen_read(i))
+
+        return retval
+
+    def _numeric_bounds_check(self, value):
+        return _check_integral(value, 0, UINT32_MAX, mds.typing.primitives.uint)
+
+    def _to_mds(self, index, value):
+        self._handle.write(index, mv_uint(<uint32_t> value))
+
+    def validate(self, values) -> None:
+        cdef:
+            const uint32_t[::1] src
+            Py_ssize_t i
+
+        try:
+            src = values
+            return  # Every element of a buffer of this type is in bounds
+        except (BufferError, TypeError, ValueError):
+            pass
+
+        if _validate_wide(values, 0, UINT32_MAX, mds.typing.primitives.uint):
+            return
+
+        # Other buffers (NumPy especially) hand back native Python values this way
+        values = values.tolist() if hasattr(values, "tolist") else values
+
+        for i, value in enumerate(values):
+            _check_integral(value, 0, UINT32_MAX, mds.typing.primitives.uint, i)
+
+    def _write_elements(self, start: int, values) -> None:
+        cdef:
+            h_marray_uint_t handle = self._handle
+            size_t i, lo, hi, n
+            vector[uint32_t] staged
+
+        values = values.tolist() if hasattr(values, "tolist") else list(values)
+        lo, hi = self._range_bounds_check(start)
+        n = len(values)
+
+        if n > hi - lo:
+            raise IndexError('list range out of range')
+
+        # Everything is validated before the first write
+        staged.resize(n)
+
+        for i in range(n):
+            staged[i] = _check_integral(values[i], 0, UINT32_MAX, mds.typing.primitives.uint, i)
+
+        with nogil:
+            for i in range(n):
+                handle.write(lo + i, mv_uint(staged[i]))
+
+    def _to_python(self, index):
+        return uint_to_core_val(self._handle.frozen_read(index))
+
+    def read_range(self, start: int, stop: int, out=None):
+        cdef:
+            h_marray_uint_t handle = self._handle
+            uint32_t[::1] dest
+            uint32_t* data
+            size_t i, lo, hi, n
+
+        lo, hi = self._range_bounds_check(start, stop)
+        n = hi - lo
+
+        if out is None:
+            out = MDSArrayBuffer(n, sizeof(uint32_t), b"I", mds.typing.primitives.uint)
+            data = <uint32_t*> (<MDSArrayBuffer> out)._data
+        else:
+            dest = out
+
+            if <size_t> dest.shape[0] < n:
+                raise ValueError(f"`out` holds {dest.shape[0]} elements, {n} required")
+            if not n:
+                return out
+
+            data = &dest[0]
+
+        with nogil:
+            for i in range(n):
+                data[i] = uint_to_core_val(handle.frozen_read(lo + i))
+
+        return out
+
+    def write_range(self, start: int, values) -> None:
+        cdef:
+            h_marray_uint_t handle = self._handle
+            const uint32_t[::1] src
+            const uint32_t* data
+            size_t i, lo, hi, n
+
+        try:
+            src = values
+        except (BufferError, TypeError, ValueError):
+            # Not a buffer of exactly this element type, so take the slow path
+            self._write_elements(start, values)
+            return
+
+        lo, hi = self._range_bounds_check(start)
+        n = src.shape[0]
+
+        if n > hi - lo:
+            raise IndexError('list range out of range')
+        if not n:
+            return
+
+        data = &src[0]
+
+        with nogil:
+            for i in range(n):
+                handle.write(lo + i, mv_uint(data[i]))
+
+    def __iadd__(self, other):
+        return self._handle.add(self._last_index, <uint32_t> other)
+
+    def __isub__(self, other):
+        return self._handle.sub(self._last_index, <uint32_t> other)
+
+    def __imul__(self, other):
+        return self._handle.mul(self._last_index, <uint32_t> other)
+
+    def __itruediv__(self, other):
+        return self._handle.div(self._last_index, <uint32_t> other)
+
+    def _sum(self):
+        cdef:
+            h_marray_uint_t handle = self._handle
+            size_t i, n = handle.size()
+            uint64_t acc = 0, v
+
+        total = 0
+
+        with nogil:
+            for i in range(n):
+                v = uint_to_core_val(handle.frozen_read(i))
+
+                if acc > UINT64_MAX - v:
+                    with gil:
+                        total += acc
+
+                    acc = 0
+
+                acc += v
+
+        return total + acc
+
+    def _arg_extreme(self, bint largest):
+        cdef:
+            h_marray_uint_t handle = self._handle
+            size_t i, best = 0, n = handle.size()
+            uint32_t v, current = uint_to_core_val(handle.frozen_read(0))
+
+        with nogil:
+            for i in range(1, n):
+                v = uint_to_core_val(handle.frozen_read(i))
+
+                if (v > current) if largest else (v < current):
+                    best = i
+                    current = v
+
+        return best, current
+
+    def _count(self, value):
+        cdef:
+            h_marray_uint_t handle = self._handle
+            size_t i, c = 0, n = handle.size()
+            uint32_t target
+
+        try:
+            target = self._comparable(value)
+        except OverflowError:
+            return 0  # Out of range for this array, so can't be in it
+        except TypeError:
+            return sum(1 for v in self if v == value)
+
+        with nogil:
+            for i in range(n):
+                if uint_to_core_val(handle.frozen_read(i)) == target:
+                    c += 1
+
+        return c
+
+    def _find(self, value, size_t start, size_t stop):
+        cdef:
+            h_marray_uint_t handle = self._handle
+            size_t i
+            Py_ssize_t found = -1
+            uint32_t target
+
+        try:
+            target = self._comparable(value)
+        except OverflowError:
+            return found
+        except TypeError:
+            for i in range(start, stop):
+                if self[i] == value:
+                    return i
+
+            return found
+
+        with nogil:
+            for i in range(start, stop):
+                if uint_to_core_val(handle.frozen_read(i)) == target:
+                    found = i
+                    break
+
+        return found
+
+    def _where(self, value):
+        cdef:
+            h_marray_uint_t handle = self._handle
+            size_t i, n = handle.size()
+            vector[uint64_t] found
+            uint32_t target
+            MDSArrayBuffer retval
+            uint64_t* data
+
+        try:
+            target = self._comparable(value)
+        except OverflowError:
+            n = 0
+        except TypeError:
+            for i in range(n):
+                if self[i] == value:
+                    found.push_back(i)
+
+            n = 0
+
+        with nogil:
+            for i in range(n):
+                if uint_to_core_val(handle.frozen_read(i)) == target:
+                    found.push_back(i)
+
+        n = found.size()
+        retval = MDSArrayBuffer(n, sizeof(uint64_t), b"Q", mds.typing.primitives.ulong)
+        data = <uint64_t*> retval._data
+
+        for i in range(n):
+            data[i] = found[i]
+
+        return retval
+
+    def _elementwise(self, int op, other):
+        cdef:
+            h_marray_uint_t handle = self._handle
+            h_marray_uint_t rhs
+            size_t i, n = handle.size()
+            bint from_array = isinstance(other, UIntArray)
+            int status = 0
+            uint32_t b
+            vector[uint32_t] results
+
+        if from_array:
+            self._check_operand(other)
+            rhs = (<UIntArray> other)._handle
+        else:
+            b = self._numeric_bounds_check(other)
+
+        results.resize(n)
+
+        with nogil:
+            for i in range(n):
+                if from_array:
+                    b = uint_to_core_val(rhs.frozen_read(i))
+
+                status = apply_elementwise[uint32_t](op, uint_to_core_val(handle.frozen_read(i)), b, &results[i])
+
+                if status:
+                    break
+
+        if status:
+            self._elementwise_failed(status, i)
+
+        with nogil:
+            for i in range(n):
+                handle.write(i, mv_uint(results[i]))
+
+    def _fill(self, value):
+        cdef:
+            h_marray_uint_t handle = self._handle
+            size_t i, n = handle.size()
+            uint32_t v = self._numeric_bounds_check(value)
+
+        with nogil:
+            for i in range(n):
+                handle.write(i, mv_uint(v))
+
+    def _clip(self, lower, upper):
+        cdef:
+            h_marray_uint_t handle = self._handle
+            size_t i, n = handle.size()
+            bint has_lower = lower is not None, has_upper = upper is not None
+            uint32_t lo = 0, hi = 0, v
+
+        if has_lower:
+            lo = self._numeric_bounds_check(max(lower, 0))
+        if has_upper:
+            hi = self._numeric_bounds_check(min(upper, 4294967295))
+
+        with nogil:
+            for i in range(n):
+                v = uint_to_core_val(handle.frozen_read(i))
+
+                if has_lower and v < lo:
+                    handle.write(i, mv_uint(lo))
+                elif has_upper and v > hi:
+                    handle.write(i, mv_uint(hi))
+
+
+cdef class MDSUIntArrayIterator(object):
+    cdef:
+        UIntArray _array
+        h_marray_uint_t _handle
+        size_t _index
+        size_t _size
+        size_t _chunk
+        size_t _chunk_start
+        vector[uint32_t] _prefetched
+
+    def __cinit__(self, UIntArray array, size_t chunk=0):
+        self._array = array
+        self._handle = array._handle
+        self._index = 0
+        self._size = self._handle.size()
+        self._chunk = chunk
+        self._chunk_start = 0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        cdef:
+            size_t i, n
+            uint32_t retval
+
+        if self._index >= self._size:
+            raise StopIteration
+
+        if not self._chunk:
+            retval = uint_to_core_val(self._handle.frozen_read(self._index))
+        else:
+            if self._index >= self._chunk_start + self._prefetched.size():
+                n = min(self._chunk, self._size - self._index)
+                self._chunk_start = self._index
+                self._prefetched.resize(n)
+
+                with nogil:
+                    for i in range(n):
+                        self._prefetched[i] = uint_to_core_val(self._handle.frozen_read(self._chunk_start + i))
+
+            retval = self._prefetched[self._index - self._chunk_start]
+
+        self._index += 1
+        return retval
+
+cdef class LongArray(MDSIntArrayBase):
+
+    cdef h_marray_long_t _handle
+    _primitive = Long
+
+    def __cinit__(self, int length=0):
+        if length:
+            self._handle = create_long_marray(<size_t> length)
+
+    def __len__(self):
+        return self._handle.size()
+
+    def __hash__(self):
+        return self._handle.hash1()
+
+    property dtype:
+        def __get__(self):
+            return mds.typing.primitives.long
+
+    @classmethod
+    def from_namespace(cls, Namespace namespace, path) -> Optional[LongArray]:
+        cdef:
+            String p = __cast_to_mds_string(path)
+            h_istring_t ish = p._ish
+            h_namespace_t nhandle = namespace._handle
+            h_marray_long_t handle
+
+        try:
+            handle = nhandle.lookup_long_array(ish, h_array_long_t())
+            retval = LongArray()
+            retval._handle = handle
+            return retval
+        except:
+            return None
+
+    def bind_to_namespace(self, Namespace namespace):
+        pass  # TODO: See how these properly bind
+
+    def __iter__(self):
+        return MDSLongArrayIterator(self)
+
+    def iterate(self, size_t chunk=0):
+        return MDSLongArrayIterator(self, chunk)
+
+    def to_buffer(self) -> MDSArrayBuffer:
+        cdef:
+            h_marray_long_t handle = self._handle
+            size_t i, n = handle.size()
+            MDSArrayBuffer retval = MDSArrayBuffer(n, sizeof(int64_t), b"q", mds.typing.primitives.long)
+            int64_t* data = <int64_t*> retval._data
+
+        with nogil:
+            for i in range(n):
+                data[i] = long_to_core_val(handle.frozen_read(i))
+
+        return retval
+
+    def copy(self):
+        cdef:
+            h_marray_long_t handle = self._handle
+            size_t i, n = handle.size()
+            LongArray retval = LongArray(length=n)
+            h_marray_long_t dest = retval._handle
+
+        with nogil:
+            for i in range(n):
+                dest.write(i, handle.frozen_read(i))
+
+        return retval
+
+    def _numeric_bounds_check(self, value):
+        return _check_integral(value, INT64_MIN, INT64_MAX, mds.typing.primitives.long)
+
+    def _to_mds(self, index, value):
+        self._handle.write(index, mv_long(<int64_t> value))
+
+    def validate(self, values) -> None:
+        cdef:
+            const int64_t[::1] src
+            Py_ssize_t i
+
+        try:
+            src = values
+            return  # Every element of a buffer of this type is in bounds
+        except (BufferError, TypeError, ValueError):
+            pass
+
+        if _validate_wide(values, INT64_MIN, INT64_MAX, mds.typing.primitives.long):
+            return
+
+        # Other buffers (NumPy especially) hand back native Python values this way
+        values = values.tolist() if hasattr(values, "tolist") else values
+
+        for i, value in enumerate(values):
+            _check_integral(value, INT64_MIN, INT64_MAX, mds.typing.primitives.long, i)
+
+    def _write_elements(self, start: int, values) -> None:
+        cdef:
+            h_marray_long_t handle = self._handle
+            size_t i, lo, hi, n
+            vector[int64_t] staged
+
+        values = values.tolist() if hasattr(values, "tolist") else list(values)
+        lo, hi = self._range_bounds_check(start)
+        n = len(values)
+
+        if n > hi - lo:
+            raise IndexError('list range out of range')
+
+        # Everything is validated before the first write
+        staged.resize(n)
+
+        for i in range(n):
+            staged[i] = _check_integral(values[i], INT64_MIN, INT64_MAX, mds.typing.primitives.long, i)
+
+        with nogil:
+            for i in range(n):
+                handle.write(lo + i, mv_long(staged[i]))
+
+    def _to_python(self, index):
+        return long_to_core_val(self._handle.frozen_read(index))
+
+    def read_range(self, start: int, stop: int, out=None):
+        cdef:
+            h_marray_long_t handle = self._handle
+            int64_t[::1] dest
+            int64_t* data
+            size_t i, lo, hi, n
+
+        lo, hi = self._range_bounds_check(start, stop)
+        n = hi - lo
+
+        if out is None:
+            out = MDSArrayBuffer(n, sizeof(int64_t), b"q", mds.typing.primitives.long)
+            data = <int64_t*> (<MDSArrayBuffer> out)._data
+        else:
+            dest = out
+
+            if <size_t> dest.shape[0] < n:
+                raise ValueError(f"`out` holds {dest.shape[0]} elements, {n} required")
+            if not n:
+                return out
+
+            data = &dest[0]
+
+        with nogil:
+            for i in range(n):
+                data[i] = long_to_core_val(handle.frozen_read(lo + i))
+
+        return out
+
+    def write_range(self, start: int, values) -> None:
+        cdef:
+            h_marray_long_t handle = self._handle
+            const int64_t[::1] src
+            const int64_t* data
+            size_t i, lo, hi, n
+
+        try:
+            src = values
+        except (BufferError, TypeError, ValueError):
+            # Not a buffer of exactly this element type, so take the slow path
+            self._write_elements(start, values)
+            return
+
+        lo, hi = self._range_bounds_check(start)
+        n = src.shape[0]
+
+        if n > hi - lo:
+            raise IndexError('list range out of range')
+        if not n:
+            return
+
+        data = &src[0]
+
+        with nogil:
+            for i in range(n):
+                handle.write(lo + i, mv_long(data[i]))
+
+    def __iadd__(self, other):
+        return self._handle.add(self._last_index, <int64_t> other)
+
+    def __isub__(self, other):
+        return self._handle.sub(self._last_index, <int64_t> other)
+
+    def __imul__(self, other):
+        return self._handle.mul(self._last_index, <int64_t> other)
+
+    def __itruediv__(self, other):
+        return self._handle.div(self._last_index, <int64_t> other)
+
+    def _sum(self):
+        cdef:
+            h_marray_long_t handle = self._handle
+            size_t i, n = handle.size()
+            int64_t acc = 0, v
+
+        total = 0
+
+        with nogil:
+            for i in range(n):
+                v = long_to_core_val(handle.frozen_read(i))
+
+                if (v > 0 and acc > INT64_MAX - v) or (v < 0 and acc < INT64_MIN - v):
+                    with gil:
+                        total += acc
+
+                    acc = 0
+
+                acc += v
+
+        return total + acc
+
+    def _arg_extreme(self, bint largest):
+        cdef:
+            h_marray_long_t handle = self._handle
+            size_t i, best = 0, n = handle.size()
+            int64_t v, current = long_to_core_val(handle.frozen_read(0))
+
+        with nogil:
+            for i in range(1, n):
+                v = long_to_core_val(handle.frozen_read(i))
+
+                if (v > current) if largest else (v < current):
+                    best = i
+                    current = v
+
+        return best, current
+
+    def _count(self, value):
+        cdef:
+            h_marray_long_t handle = self._handle
+            size_t i, c = 0, n = handle.size()
+            int64_t target
+
+        try:
+            target = self._comparable(value)
+        except OverflowError:
+            return 0  # Out of range for this array, so can't be in it
+        except TypeError:
+            return sum(1 for v in self if v == value)
+
+        with nogil:
+            for i in range(n):
+                if long_to_core_val(handle.frozen_read(i)) == target:
+                    c += 1
+
+        return c
+
+    def _find(self, value, size_t start, size_t stop):
+        cdef:
+            h_marray_long_t handle = self._handle
+            size_t i
+            Py_ssize_t found = -1
+            int64_t target
+
+        try:
+            target = self._comparable(value)
+        except OverflowError:
+            return found
+        except TypeError:
+            for i in range(start, stop):
+                if self[i] == value:
+                    return i
+
+            return found
+
+        with nogil:
+            for i in range(start, stop):
+                if long_to_core_val(handle.frozen_read(i)) == target:
+                    found = i
+                    break
+
+        return found
+
+    def _where(self, value):
+        cdef:
+            h_marray_long_t handle = self._handle
+            size_t i, n = handle.size()
+            vector[uint64_t] found
+            int64_t target
+            MDSArrayBuffer retval
+            uint64_t* data
+
+        try:
+            target = self._comparable(value)
+        except OverflowError:
+            n = 0
+        except TypeError:
+            for i in range(n):
+                if self[i] == value:
+                    found.push_back(i)
+
+            n = 0
+
+        with nogil:
+            for i in range(n):
+                if long_to_core_val(handle.frozen_read(i)) == target:
+                    found.push_back(i)
+
+        n = found.size()
+        retval = MDSArrayBuffer(n, sizeof(uint64_t), b"Q", mds.typing.primitives.ulong)
+        data = <uint64_t*> retval._data
+
+        for i in range(n):
+            data[i] = found[i]
+
+        return retval
+
+    def _elementwise(self, int op, other):
+        cdef:
+            h_marray_long_t handle = self._handle
+            h_marray_long_t rhs
+            size_t i, n = handle.size()
+            bint from_array = isinstance(other, LongArray)
+            int status = 0
+            int64_t b
+            vector[int64_t] results
+
+        if from_array:
+            self._check_operand(other)
+            rhs = (<LongArray> other)._handle
+        else:
+            b = self._numeric_bounds_check(other)
+
+        results.resize(n)
+
+        with nogil:
+            for i in range(n):
+                if from_array:
+                    b = long_to_core_val(rhs.frozen_read(i))
+
+                status = apply_elementwise[int64_t](op, long_to_core_val(handle.frozen_read(i)), b, &results[i])
+
+                if status:
+                    break
+
+        if status:
+            self._elementwise_failed(status, i)
+
+        with nogil:
+            for i in range(n):
+                handle.write(i, mv_long(results[i]))
+
+    def _fill(self, value):
+        cdef:
+            h_marray_long_t handle = self._handle
+            size_t i, n = handle.size()
+            int64_t v = self._numeric_bounds_check(value)
+
+        with nogil:
+            for i in range(n):
+                handle.write(i, mv_long(v))
+
+    def _clip(self, lower, upper):
+        cdef:
+            h_marray_long_t handle = self._handle
+            size_t i, n = handle.size()
+            bint has_lower = lower is not None, has_upper = upper is not None
+            int64_t lo = 0, hi = 0, v
+
+        if has_lower:
+            lo = self._numeric_bounds_check(max(lower, -9223372036854775808))
+        if has_upper:
+            hi = self._numeric_bounds_check(min(upper, 9223372036854775807))
+
+        with nogil:
+            for i in range(n):
+                v = long_to_core_val(handle.frozen_read(i))
+
+                if has_lower and v < lo:
+                    handle.write(i, mv_long(lo))
+                elif has_upper and v > hi:
+                    handle.write(i, mv_long(hi))
+
+
+cdef class MDSLongArrayIterator(object):
+    cdef:
+        LongArray _array
+        h_marray_long_t _handle
+        size_t _index
+        size_t _size
+        size_t _chunk
+        size_t _chunk_start
+        vector[int64_t] _prefetched
+
+    def __cinit__(self, LongArray array, size_t chunk=0):
+        self._array = array
+        self._handle = array._handle
+        self._index = 0
+        self._size = self._handle.size()
+        self._chunk = chunk
+        self._chunk_start = 0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        cdef:
+            size_t i, n
+            int64_t retval
+
+        if self._index >= self._size:
+            raise StopIteration
+
+        if not self._chunk:
+            retval = long_to_core_val(self._handle.frozen_read(self._index))
+        else:
+            if self._index >= self._chunk_start + self._prefetched.size():
+                n = min(self._chunk, self._size - self._index)
+                self._chunk_start = self._index
+                self._prefetched.resize(n)
+
+                with nogil:
+                    for i in range(n):
+                        self._prefetched[i] = long_to_core_val(self._handle.frozen_read(self._chunk_start + i))
+
+            retval = self._prefetched[self._index - self._chunk_start]
+
+        self._index += 1
+        return retval
+
+cdef class ULongArray(MDSIntArrayBase):
+
+    cdef h_marray_ulong_t _handle
+    _primitive = ULong
+
+    def __cinit__(self, int length=0):
+        if length:
+            self._handle = create_ulong_marray(<size_t> length)
+
+    def __len__(self):
+        return self._handle.size()
+
+    def __hash__(self):
+        return self._handle.hash1()
+
+    property dtype:
+        def __get__(self):
+            return mds.typing.primitives.ulong
+
+    @classmethod
+    def from_namespace(cls, Namespace namespace, path) -> Optional[ULongArray]:
+        cdef:
+            String p = __cast_to_mds_string(path)
+            h_istring_t ish = p._ish
+            h_namespace_t nhandle = namespace._handle
+            h_marray_ulong_t handle
+
+        try:
+            handle = nhandle.lookup_ulong_array(ish, h_array_ulong_t())
+            retval = ULongArray()
+            retval._handle = handle
+            return retval
+        except:
+            return None
+
+    def bind_to_namespace(self, Namespace namespace):
+        pass  # TODO: See how these properly bind
+
+    def __iter__(self):
+        return MDSULongArrayIterator(self)
+
+    def iterate(self, size_t chunk=0):
+        return MDSULongArrayIterator(self, chunk)
+
+    def to_buffer(self) -> MDSArrayBuffer:
+        cdef:
+            h_marray_ulong_t handle = self._handle
+            size_t i, n = handle.size()
+            MDSArrayBuffer retval = MDSArrayBuffer(n, sizeof(uint64_t), b"Q", mds.typing.primitives.ulong)
+            uint64_t* data = <uint64_t*> retval._data
+
+        with nogil:
+            for i in range(n):
+                data[i] = ulong_to_core_val(handle.frozen_read(i))
+
+        return retval
+
+    def copy(self):
+        cdef:
+            h_marray_ulong_t handle = self._handle
+            size_t i, n = handle.size()
+            ULongArray retval = ULongArray(length=n)
+            h_marray_ulong_t dest = retval._handle
+
+        with nogil:
+            for i in range(n):
+                dest.write(i, handle.frozen_read(i))
+
+        return retval
+
+    def _numeric_bounds_check(self, value):
+        return _check_integral(value, 0, UINT64_MAX, mds.typing.primitives.ulong)
+
+    def _to_mds(self, index, value):
+        self._handle.write(index, mv_ulong(<uint64_t> value))
+
+    def validate(self, values) -> None:
+        cdef:
+            const uint64_t[::1] src
+            Py_ssize_t i
+
+        try:
+            src = values
+            return  # Every element of a buffer of this type is in bounds
+        except (BufferError, TypeError, ValueError):
+            pass
+
+        if _validate_wide(values, 0, UINT64_MAX, mds.typing.primitives.ulong):
+            return
+
+        # Other buffers (NumPy especially) hand back native Python values this way
+        values = values.tolist() if hasattr(values, "tolist") else values
+
+        for i, value in enumerate(values):
+            _check_integral(value, 0, UINT64_MAX, mds.typing.primitives.ulong, i)
+
+    def _write_elements(self, start: int, values) -> None:
+        cdef:
+            h_marray_ulong_t handle = self._handle
+            size_t i, lo, hi, n
+            vector[uint64_t] staged
+
+        values = values.tolist() if hasattr(values, "tolist") else list(values)
+        lo, hi = self._range_bounds_check(start)
+        n = len(values)
+
+        if n > hi - lo:
+            raise IndexError('list range out of range')
+
+        # Everything is validated before the first write
+        staged.resize(n)
+
+        for i in range(n):
+            staged[i] = _check_integral(values[i], 0, UINT64_MAX, mds.typing.primitives.ulong, i)
+
+        with nogil:
+            for i in range(n):
+                handle.write(lo + i, mv_ulong(staged[i]))
+
+    def _to_python(self, index):
+        return ulong_to_core_val(self._handle.frozen_read(index))
+
+    def read_range(self, start: int, stop: int, out=None):
+        cdef:
+            h_marray_ulong_t handle = self._handle
+            uint64_t[::1] dest
+            uint64_t* data
+            size_t i, lo, hi, n
+
+        lo, hi = self._range_bounds_check(start, stop)
+        n = hi - lo
+
+        if out is None:
+            out = MDSArrayBuffer(n, sizeof(uint64_t), b"Q", mds.typing.primitives.ulong)
+            data = <uint64_t*> (<MDSArrayBuffer> out)._data
+        else:
+            dest = out
+
+            if <size_t> dest.shape[0] < n:
+                raise ValueError(f"`out` holds {dest.shape[0]} elements, {n} required")
+            if not n:
+                return out
+
+            data = &dest[0]
+
+        with nogil:
+            for i in range(n):
+                data[i] = ulong_to_core_val(handle.frozen_read(lo + i))
+
+        return out
+
+    def write_range(self, start: int, values) -> None:
+        cdef:
+            h_marray_ulong_t handle = self._handle
+            const uint64_t[::1] src
+            const uint64_t* data
+            size_t i, lo, hi, n
+
+        try:
+            src = values
+        except (BufferError, TypeError, ValueError):
+            # Not a buffer of exactly this element type, so take the slow path
+            self._write_elements(start, values)
+            return
+
+        lo, hi = self._range_bounds_check(start)
+        n = src.shape[0]
+
+        if n > hi - lo:
+            raise IndexError('list range out of range')
+        if not n:
+            return
+
+        data = &src[0]
+
+        with nogil:
+            for i in range(n):
+                handle.write(lo + i, mv_ulong(data[i]))
+
+    def __iadd__(self, other):
+        return self._handle.add(self._last_index, <uint64_t> other)
+
+    def __isub__(self, other):
+        return self._handle.sub(self._last_index, <uint64_t> other)
+
+    def __imul__(self, other):
+        return self._handle.mul(self._last_index, <uint64_t> other)
+
+    def __itruediv__(self, other):
+        return self._handle.div(self._last_index, <uint64_t> other)
+
+    def _sum(self):
+        cdef:
+            h_marray_ulong_t handle = self._handle
+            size_t i, n = handle.size()
+            uint64_t acc = 0, v
+
+        total = 0
+
+        with nogil:
+            for i in range(n):
+                v = ulong_to_core_val(handle.frozen_read(i))
+
+                if acc > UINT64_MAX - v:
+                    with gil:
+                        total += acc
+
+                    acc = 0
+
+                acc += v
+
+        return total + acc
+
+    def _arg_extreme(self, bint largest):
+        cdef:
+            h_marray_ulong_t handle = self._handle
+            size_t i, best = 0, n = handle.size()
+            uint64_t v, current = ulong_to_core_val(handle.frozen_read(0))
+
+        with nogil:
+            for i in range(1, n):
+                v = ulong_to_core_val(handle.frozen_read(i))
+
+                if (v > current) if largest else (v < current):
+                    best = i
+                    current = v
+
+        return best, current
+
+    def _count(self, value):
+        cdef:
+            h_marray_ulong_t handle = self._handle
+            size_t i, c = 0, n = handle.size()
+            uint64_t target
+
+        try:
+            target = self._comparable(value)
+        except OverflowError:
+            return 0  # Out of range for this array, so can't be in it
+        except TypeError:
+            return sum(1 for v in self if v == value)
+
+        with nogil:
+            for i in range(n):
+                if ulong_to_core_val(handle.frozen_read(i)) == target:
+                    c += 1
+
+        return c
+
+    def _find(self, value, size_t start, size_t stop):
+        cdef:
+            h_marray_ulong_t handle = self._handle
+            size_t i
+            Py_ssize_t found = -1
+            uint64_t target
+
+        try:
+            target = self._comparable(value)
+        except OverflowError:
+            return found
+        except TypeError:
+            for i in range(start, stop):
+                if self[i] == value:
+                    return i
+
+            return found
+
+        with nogil:
+            for i in range(start, stop):
+                if ulong_to_core_val(handle.frozen_read(i)) == target:
+                    found = i
+                    break
+
+        return found
+
+    def _where(self, value):
+        cdef:
+            h_marray_ulong_t handle = self._handle
+            size_t i, n = handle.size()
+            vector[uint64_t] found
+            uint64_t target
+            MDSArrayBuffer retval
+            uint64_t* data
+
+        try:
+            target = self._comparable(value)
+        except OverflowError:
+            n = 0
+        except TypeError:
+            for i in range(n):
+                if self[i] == value:
+                    found.push_back(i)
+
+            n = 0
+
+        with nogil:
+            for i in range(n):
+                if ulong_to_core_val(handle.frozen_read(i)) == target:
+                    found.push_back(i)
+
+        n = found.size()
+        retval = MDSArrayBuffer(n, sizeof(uint64_t), b"Q", mds.typing.primitives.ulong)
+        data = <uint64_t*> retval._data
+
+        for i in range(n):
+            data[i] = found[i]
+
+        return retval
+
+    def _elementwise(self, int op, other):
+        cdef:
+            h_marray_ulong_t handle = self._handle
+            h_marray_ulong_t rhs
+            size_t i, n = handle.size()
+            bint from_array = isinstance(other, ULongArray)
+            int status = 0
+            uint64_t b
+            vector[uint64_t] results
+
+        if from_array:
+            self._check_operand(other)
+            rhs = (<ULongArray> other)._handle
+        else:
+            b = self._numeric_bounds_check(other)
+
+        results.resize(n)
+
+        with nogil:
+            for i in range(n):
+                if from_array:
+                    b = ulong_to_core_val(rhs.frozen_read(i))
+
+                status = apply_elementwise[uint64_t](op, ulong_to_core_val(handle.frozen_read(i)), b, &results[i])
+
+                if status:
+                    break
+
+        if status:
+            self._elementwise_failed(status, i)
+
+        with nogil:
+            for i in range(n):
+                handle.write(i, mv_ulong(results[i]))
+
+    def _fill(self, value):
+        cdef:
+            h_marray_ulong_t handle = self._handle
+            size_t i, n = handle.size()
+            uint64_t v = self._numeric_bounds_check(value)
+
+        with nogil:
+            for i in range(n):
+                handle.write(i, mv_ulong(v))
+
+    def _clip(self, lower, upper):
+        cdef:
+            h_marray_ulong_t handle = self._handle
+            size_t i, n = handle.size()
+            bint has_lower = lower is not None, has_upper = upper is not None
+            uint64_t lo = 0, hi = 0, v
+
+        if has_lower:
+            lo = self._numeric_bounds_check(max(lower, 0))
+        if has_upper:
+            hi = self._numeric_bounds_check(min(upper, 18446744073709551615))
+
+        with nogil:
+            for i in range(n):
+                v = ulong_to_core_val(handle.frozen_read(i))
+
+                if has_lower and v < lo:
+                    handle.write(i, mv_ulong(lo))
+                elif has_upper and v > hi:
+                    handle.write(i, mv_ulong(hi))
+
+
+cdef class MDSULongArrayIterator(object):
+    cdef:
+        ULongArray _array
+        h_marray_ulong_t _handle
+        size_t _index
+        size_t _size
+        size_t _chunk
+        size_t _chunk_start
+        vector[uint64_t] _prefetched
+
+    def __cinit__(self, ULongArray array, size_t chunk=0):
+        self._array = array
+        self._handle = array._handle
+        self._index = 0
+        self._size = self._handle.size()
+        self._chunk = chunk
+        self._chunk_start = 0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        cdef:
+            size_t i, n
+            uint64_t retval
+
+        if self._index >= self._size:
+            raise StopIteration
+
+        if not self._chunk:
+            retval = ulong_to_core_val(self._handle.frozen_read(self._index))
+        else:
+            if self._index >= self._chunk_start + self._prefetched.size():
+                n = min(self._chunk, self._size - self._index)
+                self._chunk_start = self._index
+                self._prefetched.resize(n)
+
+                with nogil:
+                    for i in range(n):
+                        self._prefetched[i] = ulong_to_core_val(self._handle.frozen_read(self._chunk_start + i))
+
+            retval = self._prefetched[self._index - self._chunk_start]
+
+        self._index += 1
+        return retval
+
+cdef class FloatArray(MDSFloatArrayBase):
+
+    cdef h_marray_float_t _handle
+    _primitive = Float
+
+    def __cinit__(self, int length=0):
+        if length:
+            self._handle = create_float_marray(<size_t> length)
+
+    def __len__(self):
+        return self._handle.size()
+
+    def __hash__(self):
+        return self._handle.hash1()
+
+    property dtype:
         def __get__(self):
             return mds.typing.primitives.float
 
-    @classmethod
-    def from_namespace(cls, Namespace namespace, path) -> Optional[FloatArray]:
+    @classmethod
+    def from_namespace(cls, Namespace namespace, path) -> Optional[FloatArray]:
+        cdef:
+            String p = __cast_to_mds_string(path)
+            h_istring_t ish = p._ish
+            h_namespace_t nhandle = namespace._handle
+            h_marray_float_t handle
+
+        try:
+            handle = nhandle.lookup_float_array(ish, h_array_float_t())
+            retval = FloatArray()
+            retval._handle = handle
+            return retval
+        except:
+            return None
+
+    def bind_to_namespace(self, Namespace namespace):
+        pass  # TODO: See how these properly bind
+
+    def __iter__(self):
+        return MDSFloatArrayIterator(self)
+
+    def iterate(self, size_t chunk=0):
+        return MDSFloatArrayIterator(self, chunk)
+
+    def to_buffer(self) -> MDSArrayBuffer:
+        cdef:
+            h_marray_float_t handle = self._handle
+            size_t i, n = handle.size()
+            MDSArrayBuffer retval = MDSArrayBuffer(n, sizeof(float), b"f", mds.typing.primitives.float)
+            float* data = <float*> retval._data
+
+        with nogil:
+            for i in range(n):
+                data[i] = float_to_core_val(handle.frozen_read(i))
+
+        return retval
+
+    def copy(self):
+        cdef:
+            h_marray_float_t handle = self._handle
+            size_t i, n = handle.size()
+            FloatArray retval = FloatArray(length=n)
+            h_marray_float_t dest = retval._handle
+
+        with nogil:
+            for i in range(n):
+                dest.write(i, handle.frozen_read(i))
+
+        return retval
+
+    def _numeric_bounds_check(self, value):
+        prim = Float(value)
+        return prim.python_value
+
+    def _to_mds(self, index, value):
+        # Delegate bounds checking etc. to the primitive wrapper
+        wrapped = self._primitive(value)
+        self._handle.write(index, mv_float(value))
+
+    def _to_python(self, index):
+        return float_to_core_val(self._handle.frozen_read(index))
+
+    def read_range(self, start: int, stop: int, out=None):
+        cdef:
+            h_marray_float_t handle = self._handle
+            float[::1] dest
+            float* data
+            size_t i, lo, hi, n
+
+        lo, hi = self._range_bounds_check(start, stop)
+        n = hi - lo
+
+        if out is None:
+            out = MDSArrayBuffer(n, sizeof(float), b"f", mds.typing.primitives.float)
+            data = <float*> (<MDSArrayBuffer> out)._data
+        else:
+            dest = out
+
+            if <size_t> dest.shape[0] < n:
+                raise ValueError(f"`out` holds {dest.shape[0]} elements, {n} required")
+            if not n:
+                return out
+
+            data = &dest[0]
+
+        with nogil:
+            for i in range(n):
+                data[i] = float_to_core_val(handle.frozen_read(lo + i))
+
+        return out
+
+    def write_range(self, start: int, values) -> None:
+        cdef:
+            h_marray_float_t handle = self._handle
+            const float[::1] src
+            const float* data
+            size_t i, lo, hi, n
+
+        try:
+            src = values
+        except (BufferError, TypeError, ValueError):
+            # Not a buffer of exactly this element type, so take the slow path
+            self._write_elements(start, values)
+            return
+
+        lo, hi = self._range_bounds_check(start)
+        n = src.shape[0]
+
+        if n > hi - lo:
+            raise IndexError('list range out of range')
+        if not n:
+            return
+
+        data = &src[0]
+
+        with nogil:
+            for i in range(n):
+                handle.write(lo + i, mv_float(data[i]))
+
+    def __iadd__(self, other):
+        return self._handle.add(self._last_index, <float> other)
+
+    def __isub__(self, other):
+        return self._handle.sub(self._last_index, <float> other)
+
+    def __imul__(self, other):
+        return self._handle.mul(self._last_index, <float> other)
+
+    def __itruediv__(self, other):
+        return self._handle.div(self._last_index, <float> other)
+
+    def _sum(self):
         cdef:
-            String p = __cast_to_mds_string(path)
-            h_istring_t ish = p._ish
-            h_namespace_t nhandle = namespace._handle
-            h_marray_float_t handle
+            h_marray_float_t handle = self._handle
+            size_t i, n = handle.size()
+            double acc = 0, v
+
+        total = 0
+
+        with nogil:
+            for i in range(n):
+                v = float_to_core_val(handle.frozen_read(i))
+
+                acc += v
+
+        return total + acc
+
+    def _arg_extreme(self, bint largest):
+        cdef:
+            h_marray_float_t handle = self._handle
+            size_t i, best = 0, n = handle.size()
+            float v, current = float_to_core_val(handle.frozen_read(0))
+
+        with nogil:
+            for i in range(1, n):
+                v = float_to_core_val(handle.frozen_read(i))
+
+                if (v > current) if largest else (v < current):
+                    best = i
+                    current = v
+
+        return best, current
+
+    def _count(self, value):
+        cdef:
+            h_marray_float_t handle = self._handle
+            size_t i, c = 0, n = handle.size()
+            double target
 
         try:
-            handle = nhandle.lookup_float_array(ish, h_array_float_t())
-            retval = FloatArray()
-            retval._handle = handle
-            return retval
-        except:
-            return None
+            target = self._comparable(value)
+        except OverflowError:
+            return 0  # Out of range for this array, so can't be in it
+        except TypeError:
+            return sum(1 for v in self if v == value)
 
-    def bind_to_namespace(self, Namespace namespace):
-        pass  # TODO: See how these properly bind
+        with nogil:
+            for i in range(n):
+                if float_to_core_val(handle.frozen_read(i)) == target:
+                    c += 1
 
-    def _numeric_bounds_check(self, value):
-        prim = Float(value)
-        return prim.python_value
+        return c
 
-    def _to_python(self, index):
-        return float_to_core_val(self._handle.frozen_read(index))
+    def _find(self, value, size_t start, size_t stop):
+        cdef:
+            h_marray_float_t handle = self._handle
+            size_t i
+            Py_ssize_t found = -1
+            double target
 
-    def _to_mds(self, index, value):
-        # Delegate bounds checking etc. to the primitive wrapper
-        wrapped = self._primitive(value)
-        self._handle.write(index, mv_float(value))
+        try:
+            target = self._comparable(value)
+        except OverflowError:
+            return found
+        except TypeError:
+            for i in range(start, stop):
+                if self[i] == value:
+                    return i
 
-    def copy(self):
+            return found
+
+        with nogil:
+            for i in range(start, stop):
+                if float_to_core_val(handle.frozen_read(i)) == target:
+                    found = i
+                    break
+
+        return found
+
+    def _where(self, value):
         cdef:
-            size_t i = 0
-            size_t n = len(self)
+            h_marray_float_t handle = self._handle
+            size_t i, n = handle.size()
+            vector[uint64_t] found
+            double target
+            MDSArrayBuffer retval
+            uint64_t* data
+
+        try:
+            target = self._comparable(value)
+        except OverflowError:
+            n = 0
+        except TypeError:
+            for i in range(n):
+                if self[i] == value:
+                    found.push_back(i)
+
+            n = 0
 
-        retval = FloatArray(length=len(self))
+        with nogil:
+            for i in range(n):
+                if float_to_core_val(handle.frozen_read(i)) == target:
+                    found.push_back(i)
+
+        n = found.size()
+        retval = MDSArrayBuffer(n, sizeof(uint64_t), b"Q", mds.typing.primitives.ulong)
+        data = <uint64_t*> retval._data
 
         for i in range(n):
-            retval[i] = self[i]
+            data[i] = found[i]
 
         return retval
 
-    def __iadd__(self, other):
-        return self._handle.add(self._last_index, <float> other)
+    def _elementwise(self, int op, other):
+        cdef:
+            h_marray_float_t handle = self._handle
+            h_marray_float_t rhs
+            size_t i, n = handle.size()
+            bint from_array = isinstance(other, FloatArray)
+            int status = 0
+            float b
+            vector[float] results
+
+        if from_array:
+            self._check_operand(other)
+            rhs = (<FloatArray> other)._handle
+        else:
+            b = other
 
-    def __isub__(self, other):
-        return self._handle.sub(self._last_index, <float> other)
+        results.resize(n)
 
-    def __imul__(self, other):
-        return self._handle.mul(self._last_index, <float> other)
+        with nogil:
+            for i in range(n):
+                if from_array:
+                    b = float_to_core_val(rhs.frozen_read(i))
 
-    def __itruediv__(self, other):
-        return self._handle.div(self._last_index, <float> other)
+                status = apply_elementwise[float](op, float_to_core_val(handle.frozen_read(i)), b, &results[i])
+
+                if status:
+                    break
+
+        if status:
+            self._elementwise_failed(status, i)
+
+        with nogil:
+            for i in range(n):
+                handle.write(i, mv_float(results[i]))
+
+    def _fill(self, value):
+        cdef:
+            h_marray_float_t handle = self._handle
+            size_t i, n = handle.size()
+            float v = value
+
+        with nogil:
+            for i in range(n):
+                handle.write(i, mv_float(v))
+
+    def _clip(self, lower, upper):
+        cdef:
+            h_marray_float_t handle = self._handle
+            size_t i, n = handle.size()
+            bint has_lower = lower is not None, has_upper = upper is not None
+            float lo = 0, hi = 0, v
+
+        if has_lower:
+            lo = lower
+        if has_upper:
+            hi = upper
+
+        with nogil:
+            for i in range(n):
+                v = float_to_core_val(handle.frozen_read(i))
+
+                if has_lower and v < lo:
+                    handle.write(i, mv_float(lo))
+                elif has_upper and v > hi:
+                    handle.write(i, mv_float(hi))
+
+
+cdef class MDSFloatArrayIterator(object):
+    cdef:
+        FloatArray _array
+        h_marray_float_t _handle
+        size_t _index
+        size_t _size
+        size_t _chunk
+        size_t _chunk_start
+        vector[float] _prefetched
+
+    def __cinit__(self, FloatArray array, size_t chunk=0):
+        self._array = array
+        self._handle = array._handle
+        self._index = 0
+        self._size = self._handle.size()
+        self._chunk = chunk
+        self._chunk_start = 0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        cdef:
+            size_t i, n
+            float retval
+
+        if self._index >= self._size:
+            raise StopIteration
+
+        if not self._chunk:
+            retval = float_to_core_val(self._handle.frozen_read(self._index))
+        else:
+            if self._index >= self._chunk_start + self._prefetched.size():
+                n = min(self._chunk, self._size - self._index)
+                self._chunk_start = self._index
+                self._prefetched.resize(n)
+
+                with nogil:
+                    for i in range(n):
+                        self._prefetched[i] = float_to_core_val(self._handle.frozen_read(self._chunk_start + i))
+
+            retval = self._prefetched[self._index - self._chunk_start]
+
+        self._index += 1
+        return retval
 
 cdef class DoubleArray(MDSFloatArrayBase):
 
@@ -1152,70 +5023,536 @@ cdef class DoubleArray(MDSFloatArrayBase):
     def bind_to_namespace(self, Namespace namespace):
         pass  # TODO: See how these properly bind
 
+    def __iter__(self):
+        return MDSDoubleArrayIterator(self)
+
+    def iterate(self, size_t chunk=0):
+        return MDSDoubleArrayIterator(self, chunk)
+
+    def to_buffer(self) -> MDSArrayBuffer:
+        cdef:
+            h_marray_double_t handle = self._handle
+            size_t i, n = handle.size()
+            MDSArrayBuffer retval = MDSArrayBuffer(n, sizeof(double), b"d", mds.typing.primitives.double)
+            double* data = <double*> retval._data
+
+        with nogil:
+            for i in range(n):
+                data[i] = double_to_core_val(handle.frozen_read(i))
+
+        return retval
+
+    def copy(self):
+        cdef:
+            h_marray_double_t handle = self._handle
+            size_t i, n = handle.size()
+            DoubleArray retval = DoubleArray(length=n)
+            h_marray_double_t dest = retval._handle
+
+        with nogil:
+            for i in range(n):
+                dest.write(i, handle.frozen_read(i))
+
+        return retval
+
     def _numeric_bounds_check(self, value):
         prim = Double(value)
         return prim.python_value
 
-    def _to_python(self, index):
-        return double_to_core_val(self._handle.frozen_read(index))
-
     def _to_mds(self, index, value):
         # Delegate bounds checking etc. to the primitive wrapper
         wrapped = self._primitive(value)
         self._handle.write(index, mv_double(value))
 
-    def copy(self):
+    def _to_python(self, index):
+        return double_to_core_val(self._handle.frozen_read(index))
+
+    def read_range(self, start: int, stop: int, out=None):
         cdef:
-            size_t i = 0
-            size_t n = len(self)
+            h_marray_double_t handle = self._handle
+            double[::1] dest
+            double* data
+            size_t i, lo, hi, n
 
-        retval = DoubleArray(length=len(self))
+        lo, hi = self._range_bounds_check(start, stop)
+        n = hi - lo
 
-        for i in range(n):
-            retval[i] = self[i]
+        if out is None:
+            out = MDSArrayBuffer(n, sizeof(double), b"d", mds.typing.primitives.double)
+            data = <double*> (<MDSArrayBuffer> out)._data
+        else:
+            dest = out
 
-        return retval
+            if <size_t> dest.shape[0] < n:
+                raise ValueError(f"`out` holds {dest.shape[0]} elements, {n} required")
+            if not n:
+                return out
+
+            data = &dest[0]
+
+        with nogil:
+            for i in range(n):
+                data[i] = double_to_core_val(handle.frozen_read(lo + i))
+
+        return out
+
+    def write_range(self, start: int, values) -> None:
+        cdef:
+            h_marray_double_t handle = self._handle
+            const double[::1] src
+            const double* data
+            size_t i, lo, hi, n
+
+        try:
+            src = values
+        except (BufferError, TypeError, ValueError):
+            # Not a buffer of exactly this element type, so take the slow path
+            self._write_elements(start, values)
+            return
+
+        lo, hi = self._range_bounds_check(start)
+        n = src.shape[0]
+
+        if n > hi - lo:
+            raise IndexError('list range out of range')
+        if not n:
+            return
+
+        data = &src[0]
+
+        with nogil:
+            for i in range(n):
+                handle.write(lo + i, mv_double(data[i]))
 
     def __iadd__(self, other):
         return self._handle.add(self._last_index, <double> other)
 
-    def __isub__(self, other):
-        return self._handle.sub(self._last_index, <double> other)
+    def __isub__(self, other):
+        return self._handle.sub(self._last_index, <double> other)
+
+    def __imul__(self, other):
+        return self._handle.mul(self._last_index, <double> other)
+
+    def __itruediv__(self, other):
+        return self._handle.div(self._last_index, <double> other)
+
+    def _sum(self):
+        cdef:
+            h_marray_double_t handle = self._handle
+            size_t i, n = handle.size()
+            double acc = 0, v
+
+        total = 0
+
+        with nogil:
+            for i in range(n):
+                v = double_to_core_val(handle.frozen_read(i))
+
+                acc += v
+
+        return total + acc
+
+    def _arg_extreme(self, bint largest):
+        cdef:
+            h_marray_double_t handle = self._handle
+            size_t i, best = 0, n = handle.size()
+            double v, current = double_to_core_val(handle.frozen_read(0))
+
+        with nogil:
+            for i in range(1, n):
+                v = double_to_core_val(handle.frozen_read(i))
+
+                if (v > current) if largest else (v < current):
+                    best = i
+                    current = v
+
+        return best, current
+
+    def _count(self, value):
+        cdef:
+            h_marray_double_t handle = self._handle
+            size_t i, c = 0, n = handle.size()
+            double target
+
+        try:
+            target = self._comparable(value)
+        except OverflowError:
+            return 0  # Out of range for this array, so can't be in it
+        except TypeError:
+            return sum(1 for v in self if v == value)
+
+        with nogil:
+            for i in range(n):
+                if double_to_core_val(handle.frozen_read(i)) == target:
+                    c += 1
+
+        return c
+
+    def _find(self, value, size_t start, size_t stop):
+        cdef:
+            h_marray_double_t handle = self._handle
+            size_t i
+            Py_ssize_t found = -1
+            double target
+
+        try:
+            target = self._comparable(value)
+        except OverflowError:
+            return found
+        except TypeError:
+            for i in range(start, stop):
+                if self[i] == value:
+                    return i
+
+            return found
+
+        with nogil:
+            for i in range(start, stop):
+                if double_to_core_val(handle.frozen_read(i)) == target:
+                    found = i
+                    break
+
+        return found
+
+    def _where(self, value):
+        cdef:
+            h_marray_double_t handle = self._handle
+            size_t i, n = handle.size()
+            vector[uint64_t] found
+            double target
+            MDSArrayBuffer retval
+            uint64_t* data
+
+        try:
+            target = self._comparable(value)
+        except OverflowError:
+            n = 0
+        except TypeError:
+            for i in range(n):
+                if self[i] == value:
+                    found.push_back(i)
+
+            n = 0
+
+        with nogil:
+            for i in range(n):
+                if double_to_core_val(handle.frozen_read(i)) == target:
+                    found.push_back(i)
+
+        n = found.size()
+        retval = MDSArrayBuffer(n, sizeof(uint64_t), b"Q", mds.typing.primitives.ulong)
+        data = <uint64_t*> retval._data
+
+        for i in range(n):
+            data[i] = found[i]
+
+        return retval
+
+    def _elementwise(self, int op, other):
+        cdef:
+            h_marray_double_t handle = self._handle
+            h_marray_double_t rhs
+            size_t i, n = handle.size()
+            bint from_array = isinstance(other, DoubleArray)
+            int status = 0
+            double b
+            vector[double] results
+
+        if from_array:
+            self._check_operand(other)
+            rhs = (<DoubleArray> other)._handle
+        else:
+            b = other
+
+        results.resize(n)
+
+        with nogil:
+            for i in range(n):
+                if from_array:
+                    b = double_to_core_val(rhs.frozen_read(i))
+
+                status = apply_elementwise[double](op, double_to_core_val(handle.frozen_read(i)), b, &results[i])
+
+                if status:
+                    break
+
+        if status:
+            self._elementwise_failed(status, i)
+
+        with nogil:
+            for i in range(n):
+                handle.write(i, mv_double(results[i]))
+
+    def _fill(self, value):
+        cdef:
+            h_marray_double_t handle = self._handle
+            size_t i, n = handle.size()
+            double v = value
+
+        with nogil:
+            for i in range(n):
+                handle.write(i, mv_double(v))
+
+    def _clip(self, lower, upper):
+        cdef:
+            h_marray_double_t handle = self._handle
+            size_t i, n = handle.size()
+            bint has_lower = lower is not None, has_upper = upper is not None
+            double lo = 0, hi = 0, v
+
+        if has_lower:
+            lo = lower
+        if has_upper:
+            hi = upper
+
+        with nogil:
+            for i in range(n):
+                v = double_to_core_val(handle.frozen_read(i))
+
+                if has_lower and v < lo:
+                    handle.write(i, mv_double(lo))
+                elif has_upper and v > hi:
+                    handle.write(i, mv_double(hi))
+
+
+cdef class MDSDoubleArrayIterator(object):
+    cdef:
+        DoubleArray _array
+        h_marray_double_t _handle
+        size_t _index
+        size_t _size
+        size_t _chunk
+        size_t _chunk_start
+        vector[double] _prefetched
+
+    def __cinit__(self, DoubleArray array, size_t chunk=0):
+        self._array = array
+        self._handle = array._handle
+        self._index = 0
+        self._size = self._handle.size()
+        self._chunk = chunk
+        self._chunk_start = 0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        cdef:
+            size_t i, n
+            double retval
+
+        if self._index >= self._size:
+            raise StopIteration
+
+        if not self._chunk:
+            retval = double_to_core_val(self._handle.frozen_read(self._index))
+        else:
+            if self._index >= self._chunk_start + self._prefetched.size():
+                n = min(self._chunk, self._size - self._index)
+                self._chunk_start = self._index
+                self._prefetched.resize(n)
+
+                with nogil:
+                    for i in range(n):
+                        self._prefetched[i] = double_to_core_val(self._handle.frozen_read(self._chunk_start + i))
+
+            retval = self._prefetched[self._index - self._chunk_start]
+
+        self._index += 1
+        return retval
+# END INJECTION
+
+# =========================================================================
+#  Records
+# =========================================================================
+
+class MDSRecordFieldMemberPair(object):
+    """
+    This is an internal class to deal with the fact that we don't have
+    static variables per-se in Python, and certainly not in Cython, so
+    we pair the instantiated RecordField with the type of the requested
+    RecordMember (whether const or not), to be plugged into derived
+    classes
+    """
+
+    def __init__(self, field: MDSRecordFieldBase, member: type, kind: MDSTypeInfo=None, is_const: bool=False):
+        self.field = field  # derived <- MDSRecordFieldBase
+        self.member = member  # type: derived <- MDSRecordMemberBase
+        self.kind = kind  # The `mds.typing` entry it was declared with
+        self.is_const = is_const
+
+
+# This is where we keep built record types, with the associated Lock
+cdef __RECORD_DECLARATION_MUTEX = threading.Lock()
+cdef __RECORD_DECLARED_TYPES = dict()
+cdef __RECORD_IDENTS = dict()
+cdef __RECORD_PROXIES = defaultdict(set)
+
+# Passed through __new__ to get a Record that wraps an existing handle
+cdef object __RECORD_ADOPT = object()
+
+cdef implant_record_handle(Record record, MDSRecordHandleWrapper wrapper):
+    cdef h_record_type_t handle = wrapper._handle
+    record._handle = handle.create_record()
+
+cdef MDSRecordTypeDeclaration Record_TypeDecl(type cls):
+    # Set on the class by Record.__init_subclass__, so the attribute lookup is
+    # served from the type cache rather than the module registries
+    return <MDSRecordTypeDeclaration?> cls._mds_type_decl
+
+cdef Record Record_Adopt(type cls, h_mrecord_t handle):
+    cdef Record retval = cls.__new__(cls, __RECORD_ADOPT)
+    retval._handle = handle
+    return retval
+
+
+cdef class MDSRecordFieldTable(object):
+    """
+    The compiled schema of a Record type, with one slot per field in
+    declaration order. Each slot holds the label, the field kind, the
+    RecordField (and so its core handle, once declared) and the member type.
+
+    This is built once, when the type comes into scope, and never modified,
+    so it can be shared by every record of the type without locking.
+    """
+    cdef:
+        tuple _labels
+        tuple _names  # String, so the interned labels are only made once
+        tuple _kinds
+        tuple _fields
+        tuple _members
+        tuple _consts
+        dict  _slots
+
+    def __len__(self):
+        return len(self._labels)
+
+    def __iter__(self):
+        return iter(self._labels)
+
+    def __contains__(self, label):
+        return label in self._slots
+
+    def __getitem__(self, key) -> MDSRecordFieldBase:
+        return self._fields[self.slot(key)]
+
+    cdef Py_ssize_t slot(self, key) except -1:
+        """
+        Resolves a label, or a (possibly negative) index, to a slot
+        """
+        cdef Py_ssize_t retval, n = len(self._labels)
+
+        if isinstance(key, str):
+            try:
+                return self._slots[key]
+            except KeyError:
+                raise KeyError(f"Record has no field `{key}`") from None
+
+        retval = key
+        if retval < 0:
+            retval += n
+        if not 0 <= retval < n:
+            raise IndexError(f"Record field index out of range: {key}")
+
+        return retval
+
+    cdef inline MDSRecordFieldBase field_at(self, Py_ssize_t slot):
+        return self._fields[slot]
+
+    cdef MDSRecordFieldBase writable_at(self, Py_ssize_t slot):
+        if self._consts[slot]:
+            raise TypeError(f"Field `{self._labels[slot]}` is const")
+
+        return self._fields[slot]
+
+    def index(self, str label) -> int:
+        return self.slot(label)
+
+    def items(self):
+        return zip(self._labels, self._fields)
+
+    def member_type(self, key) -> type:
+        return self._members[self.slot(key)]
+
+    property labels:
+        def __get__(self):
+            return self._labels
 
-    def __imul__(self, other):
-        return self._handle.mul(self._last_index, <double> other)
+    property kinds:
+        def __get__(self):
+            return self._kinds
 
-    def __itruediv__(self, other):
-        return self._handle.div(self._last_index, <double> other)
-# END INJECTION
+cdef MDSRecordFieldTable RecordSchema_Compile(type cls, schema):
+    """
+    Turns the dict returned by a Record's schema() into its field table
+    """
+    cdef:
+        MDSRecordFieldTable retval = MDSRecordFieldTable()
+        list labels = list(), kinds = list(), fields = list(), members = list(), consts = list()
+        set seen = set()
+
+    if not isinstance(schema, dict):
+        raise TypeError(f"{cls.__name__}.schema() should return a `dict`, not {type(schema).__name__}")
+
+    for label, pair in schema.items():
+        if not isinstance(label, str):
+            raise TypeError(f"Field labels must be `str`, {cls.__name__} has {label!r}")
+        if not isinstance(pair, MDSRecordFieldMemberPair):
+            raise TypeError(f"Field `{label}` of {cls.__name__} should come from declare_field()")
+        if id(pair.field) in seen:
+            raise ValueError(f"Field `{label}` of {cls.__name__} reuses another field's declaration")
+
+        seen.add(id(pair.field))
+        labels.append(label)
+        kinds.append(pair.kind)
+        fields.append(pair.field)
+        members.append(pair.member)
+        consts.append(True if pair.is_const else False)
+
+    retval._labels = tuple(labels)
+    retval._names = tuple(String(label) for label in labels)
+    retval._kinds = tuple(kinds)
+    retval._fields = tuple(fields)
+    retval._members = tuple(members)
+    retval._consts = tuple(consts)
+    retval._slots = {label: i for i, label in enumerate(labels)}
 
-# =========================================================================
-#  Records
-# =========================================================================
+    return retval
 
-class MDSRecordFieldMemberPair(object):
+
+cdef class MDSRecordMemberDescriptor(object):
     """
-    This is an internal class to deal with the fact that we don't have
-    static variables per-se in Python, and certainly not in Cython, so
-    we pair the instantiated RecordField with the type of the requested
-    RecordMember (whether const or not), to be plugged into derived
-    classes
+    When a Record subclass is declared, each of its fields becomes one of
+    these on the class, holding the single instance of the RecordField. The
+    member binding it to a record is only made on first access, and is then
+    kept in the record's __dict__, which takes precedence from then on.
     """
+    cdef:
+        str                 _label
+        MDSRecordFieldBase  _field
+        type                _member_t
+        bint                _const
 
-    def __init__(self, field: MDSRecordFieldBase, member: type):
-        self.field = field  # derived <- MDSRecordFieldBase
-        self.member = member  # type: derived <- MDSRecordMemberBase
+    def __cinit__(self, str label, MDSRecordFieldBase field, type member_t, bint is_const=False):
+        self._label = label
+        self._field = field
+        self._member_t = member_t
+        self._const = is_const
 
+    def __get__(self, record, owner):
+        cdef MDSRecordMemberBase member
 
-# This is where we keep built record types, with the associated Lock
-cdef __RECORD_DECLARATION_MUTEX = threading.Lock()
-cdef __RECORD_DECLARED_TYPES = dict()
-cdef __RECORD_IDENTS = dict()
-cdef __RECORD_PROXIES = defaultdict(set)
+        if record is None:
+            return self
 
-cdef implant_record_handle(Record record, MDSRecordHandleWrapper wrapper):
-    cdef h_record_type_t handle = wrapper._handle
-    record._handle = handle.create_record()
+        member = self._member_t(record, self._field)
+        member._const = self._const
+        record.__dict__[self._label] = member
+        return member
+
+    property field:
+        def __get__(self):
+            return self._field
 
 
 cdef class MDSRecordProxy(object):
@@ -1240,18 +5577,87 @@ cdef class Record(MDSObject):
     The MDS schema should be defined in a static method schema() returning a dictionary
     mapping field names (str) to field declarations. Examples are given.
 
-    TODO: implement __getitem__ and __setitem__ to mask the write() read() ops, maybe make this primary?
+    Fields can also be read and written by label or by position in the schema,
+    as record["name"] or record[0].
     """
     cdef h_mrecord_t _handle
 
-    def __cinit__(self):
+    def __cinit__(self, *args, **kwargs):
         if self.__class__ is Record:
             raise TypeError('Cannot directly instantiate Record; a subclass is required.')
 
-        implant_record_handle(self, self.type_decl.ensure_created())
+        if args and args[0] is __RECORD_ADOPT:
+            return  # The caller brings the handle, see Record_Adopt
+
+        implant_record_handle(self, Record_TypeDecl(type(self)).ensure_created())
 
     def __init__(self):
-        self._register_fields()
+        pass
+
+    def __getitem__(self, key):
+        cdef MDSRecordFieldTable fields = Record_TypeDecl(type(self))._fields
+        return fields.field_at(fields.slot(key))._read(self._handle)
+
+    def __setitem__(self, key, value):
+        cdef MDSRecordFieldTable fields = Record_TypeDecl(type(self))._fields
+        fields.writable_at(fields.slot(key))._write(self._handle, value)
+
+    def read_fields(self, keys: Iterable=None, snapshot: bool=False) -> tuple:
+        """
+        Reads several fields, given by label or index (all of them by
+        default), in one call and returns their values in the order asked
+        for. With snapshot=True they are all read in one read-only snapshot,
+        so they are consistent with each other.
+        """
+        cdef:
+            MDSRecordTypeDeclaration type_decl = Record_TypeDecl(type(self))
+            MDSRecordFieldTable fields = type_decl._fields
+
+        type_decl.ensure_created()
+
+        if keys is None:
+            slots = list(range(len(fields)))
+        elif isinstance(keys, (str, int)):
+            raise TypeError("read_fields() takes an iterable of field labels or indices")
+        else:
+            slots = [fields.slot(key) for key in keys]
+
+        if not snapshot:
+            return self._read_slots(fields, slots)
+
+        # Imported here, as mds.containers depends on this module
+        from mds.containers import in_read_only_snapshot
+        return in_read_only_snapshot(lambda: self._read_slots(fields, slots))
+
+    def write_fields(self, values: Dict=None, **kwargs) -> None:
+        """
+        Writes several fields in one call, from a mapping of labels (or
+        indices) to values, and/or keyword arguments. Every key is resolved
+        before anything is written.
+        """
+        cdef:
+            MDSRecordTypeDeclaration type_decl = Record_TypeDecl(type(self))
+            MDSRecordFieldTable fields = type_decl._fields
+            MDSRecordFieldBase field
+
+        type_decl.ensure_created()
+        updates = list()
+
+        for key, value in chain(values.items() if values else (), kwargs.items()):
+            updates.append((fields.writable_at(fields.slot(key)), value))
+
+        for field, value in updates:
+            field._write(self._handle, value)
+
+    cdef tuple _read_slots(self, MDSRecordFieldTable fields, list slots):
+        cdef:
+            Py_ssize_t i, n = len(slots)
+            list retval = [None] * n
+
+        for i in range(n):
+            retval[i] = fields.field_at(slots[i])._read(self._handle)
+
+        return tuple(retval)
 
     # def __richcmp__(a, b, op):
     #     if op == 2:  # ==
@@ -1280,7 +5686,16 @@ cdef class Record(MDSObject):
         # the RecordTypeDeclarion (rt_decl)
         # This will store a reference in __RECORD_DECLARED_TYPES in a thread-safe way
         __RECORD_IDENTS[cls.__name__] = ident
-        MDSRecordTypeDeclaration(cls, cls.schema()).ensure_created()
+        fields = RecordSchema_Compile(cls, cls.schema())
+        type_decl = MDSRecordTypeDeclaration(cls, fields)
+        type_decl.ensure_created()
+        cls._mds_type_decl = type_decl
+
+        # Members are only made when a field is first touched on a record
+        for i, label in enumerate(fields.labels):
+            setattr(cls, label, MDSRecordMemberDescriptor(
+                label, fields.field_at(i), fields._members[i], fields._consts[i]
+            ))
         
         # Now that this has come into scope, see if there are any previous proxies
         # to this type in the process-space; if so we should update their entires
@@ -1289,26 +5704,12 @@ cdef class Record(MDSObject):
 
     property type_decl:
         def __get__(self):
-            return __RECORD_DECLARED_TYPES[self.ident]
+            return Record_TypeDecl(type(self))
 
     property ident:
         def __get__(self):
             return __RECORD_IDENTS[self.__class__.__name__]
 
-    def _register_fields(self) -> None:
-        """
-        When this subclass was declared, we automatically registered the Record type
-        with MDS; in so doing we stored single-instances of the RecordFields we required,
-        but type references to the members, as they must be instance-bound.
-
-        This method iterates through that container and updates the object's dict
-        to enable dot notation access to the associated MemberRecords
-        """
-        # Stll need to make the RecordMembers and bind them to this instance
-        for label, field_member_pair in self.type_decl.get_field_member_pairs().items():
-            field, member_t = field_member_pair.field, field_member_pair.member
-            self.__dict__[label] = member_t(record=self)
-
     def bind_to_namespace(self, Namespace namespace, String name) -> None:
         cdef:
             h_istring_t nhandle = name._ish
@@ -1327,6 +5728,44 @@ cdef class Record(MDSObject):
 
         return retval
 
+    @classmethod
+    def create_many(cls, size_t n, **columns) -> RecordArray:
+        """
+        Allocates n records of this type in one call, filling fields from the
+        keyword arguments, each a column (a sequence, buffer or NumPy array)
+        of n values. The records are created, and primitive columns written,
+        in native loops with the GIL released.
+        """
+        cdef:
+            MDSRecordTypeDeclaration type_decl = Record_TypeDecl(cls)
+            MDSRecordHandleWrapper wrapper = type_decl.ensure_created()
+            h_record_type_t rtype = wrapper._handle
+            RecordArray retval = RecordArray(length=n, record_type=cls)
+            h_marray_record_t handle = retval._handle
+            vector[h_mrecord_t] records
+            MDSRecordFieldTable fields = type_decl._fields
+            MDSRecordFieldBase field
+            size_t i
+
+        for name, values in columns.items():
+            if name not in fields:
+                raise TypeError(f"{cls.__name__} has no field `{name}`")
+            if len(values) != n:
+                raise ValueError(f"column `{name}` has {len(values)} values, {n} required")
+
+        records.resize(n)
+
+        with nogil:
+            for i in range(n):
+                records[i] = rtype.create_record()
+                handle.write(i, records[i])
+
+        for name, values in columns.items():
+            field = fields.field_at(fields.slot(name))
+            field._scatter(records, values)
+
+        return retval
+
     @classmethod
     def force(cls) -> None:
         MDSManagedRecordType.ensure_complete(klass=cls)
@@ -1336,29 +5775,46 @@ cdef class Record(MDSObject):
         raise TypeError("Derived `Record`s should return a `dict` detailing the schema here.")
 
 
-def declare_field(type_decl: MDSTypeInfo) -> MDSRecordFieldMemberPair:
+def declare_field(type_decl: MDSTypeInfo, make_const: bool=False) -> MDSRecordFieldMemberPair:
     """
     This returns the derived RecordField for the combination of the arguments.
 
-    TODO: This only works for primitives, will need adaptation for {String, Array, Record}
-    TODO: String-based hacking isn't neat, should make a dict using the generator,
-    but this works for now.
+    Fields holding records, or arrays of them, name the Record subclass, as in
+    mds.typing.composites.record[Department].
 
     Args:
         type_decl:  MDSTypeInfo, obtained from `mds.typing`
+        make_const: whether the field is only written when records are made
     """
     if not isinstance(type_decl, MDSTypeInfo):
         raise TypeError("First parameter needs to be a type from `mds.typing`")
 
-    # Now, let's see if it's known and of the correct lineage
-    field_t = globals()[type_decl.title_record_field]
-    assert issubclass(field_t, MDSRecordFieldBase)
-    identifier = type_decl.title_record_member
-    member_t = globals()[identifier]
-    assert issubclass(member_t, MDSRecordMemberBase)
+    key = type_decl
+    record_t = getattr(type_decl, "derived_record", None)
+
+    # Each record[R] is its own entry, but they all share the one field type
+    if type_decl.is_record:
+        key = mds.typing.composites.record
+    elif type_decl.is_array and type_decl.elt.is_record:
+        key = mds.typing.arrays.record
+
+    try:
+        field_t, member_t = __RECORD_FIELD_TYPES[key]
+    except KeyError:
+        raise TypeError(f"Records can't have fields of type {type_decl}") from None
+
+    if key is mds.typing.composites.record or key is mds.typing.arrays.record:
+        if type_decl.is_record and record_t is None:
+            raise TypeError("Record fields need the record type, as in mds.typing.composites.record[R]")
+        if record_t is not None and not (isinstance(record_t, type) and issubclass(record_t, Record)):
+            raise TypeError(f"{record_t!r} is not a Record type")
+
+        field = field_t(record_t)
+    else:
+        field = field_t()
 
     # Unlike the CAPI we return both the instantiated field and a type for the member
-    return MDSRecordFieldMemberPair(field=field_t(), member=member_t)
+    return MDSRecordFieldMemberPair(field=field, member=member_t, kind=type_decl, is_const=make_const)
 
 
 cdef class MDSManagedRecordType(MDSObject):
@@ -1368,11 +5824,11 @@ cdef class MDSManagedRecordType(MDSObject):
         self._parent = parent
 
     def ensure_created(self) -> MDSRecordHandleWrapper:
-        return self._parent.type_decl.ensure_created()
+        return Record_TypeDecl(type(self._parent)).ensure_created()
 
     @staticmethod
     def ensure_complete(klass: type) -> MDSRecordHandleWrapper:
-        return klass.type_decl.ensure_created()
+        return Record_TypeDecl(klass).ensure_created()
 
     def from_core(self, handle: MDSRecordHandleWrapper) -> Record:
   # mds_ptr<R> from_core(const Record::handle_t &val) const {
@@ -1423,13 +5879,16 @@ cdef class MDSRecordFieldBase(MDSObject):
         #   R::type_decl().ensure_created();
         #   return const_reference(*this, *r);
         # }
-        member.record.type_decl.ensure_created()
+        Record_TypeDecl(type(member.record)).ensure_created()
+        reference_t = self.get_reference_type()
 
-        # So whether the reference is const or not, surely that'd be on the member's
-        # constness, how to pass this through?
-        # TODO: Double check this on the CAPI, seems to make sense on a per-meber
-        #       granularity, though the CAPI looks like it's at Record
-        return self.get_reference_type()(self, member.record)
+        if reference_t is None:
+            raise TypeError(f"`{type(self).__name__}` has no field references")
+
+        # Const-ness is per member, so the reference takes the member's
+        cdef MDSRecordFieldReferenceBase retval = reference_t(self, member.record)
+        retval._const = member._const
+        return retval
 
     def ensure_type(self):
         """
@@ -1454,6 +5913,35 @@ cdef class MDSRecordFieldBase(MDSObject):
     def get_reference_type() -> type:
         return None
 
+    @staticmethod
+    def get_array_type() -> type:
+        return None
+
+    cdef object _read(self, h_mrecord_t& record):
+        raise NotImplementedError('Specialization of MDSRecordFieldBase required')
+
+    cdef object _peek(self, h_mrecord_t& record):
+        raise NotImplementedError('Specialization of MDSRecordFieldBase required')
+
+    cdef _write(self, h_mrecord_t& record, value):
+        raise NotImplementedError('Specialization of MDSRecordFieldBase required')
+
+    cdef _scatter(self, vector[h_mrecord_t]& records, values):
+        """
+        Writes values[i] to this field of records[i], one at a time here;
+        primitive fields do it natively
+        """
+        cdef size_t i
+
+        for i, value in enumerate(values):
+            self._write(records[i], value)
+
+    cdef MDSArrayBuffer _gather(self, vector[h_mrecord_t]& records):
+        """
+        Reads this field from each of the records into a native buffer
+        """
+        raise TypeError(f"Only primitive fields can be gathered, not `{type(self).__name__}`")
+
 # START INJECTION | tmpl_record_field_primitives(Primitives)
 
 cdef class MDSBoolRecordField(MDSRecordFieldBase):
@@ -1469,6 +5957,34 @@ cdef class MDSBoolRecordField(MDSRecordFieldBase):
     def get_reference_type() -> type:
         return MDSBoolRecordFieldReference
 
+    @staticmethod
+    def get_array_type() -> type:
+        return BoolArray
+
+    cdef object _read(self, h_mrecord_t& record):
+        cdef bool retval = self._handle.frozen_read(record)
+        return retval
+
+    cdef object _peek(self, h_mrecord_t& record):
+        cdef bool retval = self._handle.free_read(record)
+        return retval
+
+    cdef _write(self, h_mrecord_t& record, value):
+        self._handle.write(record, <bool> value)
+
+    cdef MDSArrayBuffer _gather(self, vector[h_mrecord_t]& records):
+        cdef:
+            h_rfield_bool_t handle = self._handle
+            size_t i, n = records.size()
+            MDSArrayBuffer retval = MDSArrayBuffer(n, sizeof(bool), b"?", mds.typing.primitives.bool)
+            bool* data = <bool*> retval._data
+
+        with nogil:
+            for i in range(n):
+                data[i] = handle.frozen_read(records[i])
+
+        return retval
+
 cdef class MDSByteRecordField(MDSRecordFieldBase):
     cdef:
         h_rfield_byte_t _handle
@@ -1482,6 +5998,57 @@ cdef class MDSByteRecordField(MDSRecordFieldBase):
     def get_reference_type() -> type:
         return MDSByteRecordFieldReference
 
+    @staticmethod
+    def get_array_type() -> type:
+        return ByteArray
+
+    cdef object _read(self, h_mrecord_t& record):
+        cdef int8_t retval = self._handle.frozen_read(record)
+        return retval
+
+    cdef object _peek(self, h_mrecord_t& record):
+        cdef int8_t retval = self._handle.free_read(record)
+        return retval
+
+    cdef _write(self, h_mrecord_t& record, value):
+        self._handle.write(record, <int8_t> value)
+
+    cdef MDSArrayBuffer _gather(self, vector[h_mrecord_t]& records):
+        cdef:
+            h_rfield_byte_t handle = self._handle
+            size_t i, n = records.size()
+            MDSArrayBuffer retval = MDSArrayBuffer(n, sizeof(int8_t), b"b", mds.typing.primitives.byte)
+            int8_t* data = <int8_t*> retval._data
+
+        with nogil:
+            for i in range(n):
+                data[i] = handle.frozen_read(records[i])
+
+        return retval
+
+    cdef _scatter(self, vector[h_mrecord_t]& records, values):
+        cdef:
+            h_rfield_byte_t handle = self._handle
+            const int8_t[::1] src
+            const int8_t* data
+            vector[int8_t] staged
+            size_t i, n = records.size()
+
+        if not n:
+            return
+
+        try:
+            src = values
+            data = &src[0]
+        except (BufferError, TypeError, ValueError):
+            # Conversion range checks each value against int8_t
+            staged = values.tolist() if hasattr(values, "tolist") else list(values)
+            data = staged.data()
+
+        with nogil:
+            for i in range(n):
+                handle.write(records[i], data[i])
+
 cdef class MDSUByteRecordField(MDSRecordFieldBase):
     cdef:
         h_rfield_ubyte_t _handle
@@ -1495,6 +6062,57 @@ cdef class MDSUByteRecordField(MDSRecordFieldBase):
     def get_reference_type() -> type:
         return MDSUByteRecordFieldReference
 
+    @staticmethod
+    def get_array_type() -> type:
+        return UByteArray
+
+    cdef object _read(self, h_mrecord_t& record):
+        cdef uint8_t retval = self._handle.frozen_read(record)
+        return retval
+
+    cdef object _peek(self, h_mrecord_t& record):
+        cdef uint8_t retval = self._handle.free_read(record)
+        return retval
+
+    cdef _write(self, h_mrecord_t& record, value):
+        self._handle.write(record, <uint8_t> value)
+
+    cdef MDSArrayBuffer _gather(self, vector[h_mrecord_t]& records):
+        cdef:
+            h_rfield_ubyte_t handle = self._handle
+            size_t i, n = records.size()
+            MDSArrayBuffer retval = MDSArrayBuffer(n, sizeof(uint8_t), b"B", mds.typing.primitives.ubyte)
+            uint8_t* data = <uint8_t*> retval._data
+
+        with nogil:
+            for i in range(n):
+                data[i] = handle.frozen_read(records[i])
+
+        return retval
+
+    cdef _scatter(self, vector[h_mrecord_t]& records, values):
+        cdef:
+            h_rfield_ubyte_t handle = self._handle
+            const uint8_t[::1] src
+            const uint8_t* data
+            vector[uint8_t] staged
+            size_t i, n = records.size()
+
+        if not n:
+            return
+
+        try:
+            src = values
+            data = &src[0]
+        except (BufferError, TypeError, ValueError):
+            # Conversion range checks each value against uint8_t
+            staged = values.tolist() if hasattr(values, "tolist") else list(values)
+            data = staged.data()
+
+        with nogil:
+            for i in range(n):
+                handle.write(records[i], data[i])
+
 cdef class MDSShortRecordField(MDSRecordFieldBase):
     cdef:
         h_rfield_short_t _handle
@@ -1508,6 +6126,57 @@ cdef class MDSShortRecordField(MDSRecordFieldBase):
     def get_reference_type() -> type:
         return MDSShortRecordFieldReference
 
+    @staticmethod
+    def get_array_type() -> type:
+        return ShortArray
+
+    cdef object _read(self, h_mrecord_t& record):
+        cdef int16_t retval = self._handle.frozen_read(record)
+        return retval
+
+    cdef object _peek(self, h_mrecord_t& record):
+        cdef int16_t retval = self._handle.free_read(record)
+        return retval
+
+    cdef _write(self, h_mrecord_t& record, value):
+        self._handle.write(record, <int16_t> value)
+
+    cdef MDSArrayBuffer _gather(self, vector[h_mrecord_t]& records):
+        cdef:
+            h_rfield_short_t handle = self._handle
+            size_t i, n = records.size()
+            MDSArrayBuffer retval = MDSArrayBuffer(n, sizeof(int16_t), b"h", mds.typing.primitives.short)
+            int16_t* data = <int16_t*> retval._data
+
+        with nogil:
+            for i in range(n):
+                data[i] = handle.frozen_read(records[i])
+
+        return retval
+
+    cdef _scatter(self, vector[h_mrecord_t]& records, values):
+        cdef:
+            h_rfield_short_t handle = self._handle
+            const int16_t[::1] src
+            const int16_t* data
+            vector[int16_t] staged
+            size_t i, n = records.size()
+
+        if not n:
+            return
+
+        try:
+            src = values
+            data = &src[0]
+        except (BufferError, TypeError, ValueError):
+            # Conversion range checks each value against int16_t
+            staged = values.tolist() if hasattr(values, "tolist") else list(values)
+            data = staged.data()
+
+        with nogil:
+            for i in range(n):
+                handle.write(records[i], data[i])
+
 cdef class MDSUShortRecordField(MDSRecordFieldBase):
     cdef:
         h_rfield_ushort_t _handle
@@ -1521,6 +6190,57 @@ cdef class MDSUShortRecordField(MDSRecordFieldBase):
     def get_reference_type() -> type:
         return MDSUShortRecordFieldReference
 
+    @staticmethod
+    def get_array_type() -> type:
+        return UShortArray
+
+    cdef object _read(self, h_mrecord_t& record):
+        cdef uint16_t retval = self._handle.frozen_read(record)
+        return retval
+
+    cdef object _peek(self, h_mrecord_t& record):
+        cdef uint16_t retval = self._handle.free_read(record)
+        return retval
+
+    cdef _write(self, h_mrecord_t& record, value):
+        self._handle.write(record, <uint16_t> value)
+
+    cdef MDSArrayBuffer _gather(self, vector[h_mrecord_t]& records):
+        cdef:
+            h_rfield_ushort_t handle = self._handle
+            size_t i, n = records.size()
+            MDSArrayBuffer retval = MDSArrayBuffer(n, sizeof(uint16_t), b"H", mds.typing.primitives.ushort)
+            uint16_t* data = <uint16_t*> retval._data
+
+        with nogil:
+            for i in range(n):
+                data[i] = handle.frozen_read(records[i])
+
+        return retval
+
+    cdef _scatter(self, vector[h_mrecord_t]& records, values):
+        cdef:
+            h_rfield_ushort_t handle = self._handle
+            const uint16_t[::1] src
+            const uint16_t* data
+            vector[uint16_t] staged
+            size_t i, n = records.size()
+
+        if not n:
+            return
+
+        try:
+            src = values
+            data = &src[0]
+        except (BufferError, TypeError, ValueError):
+            # Conversion range checks each value against uint16_t
+            staged = values.tolist() if hasattr(values, "tolist") else list(values)
+            data = staged.data()
+
+        with nogil:
+            for i in range(n):
+                handle.write(records[i], data[i])
+
 cdef class MDSIntRecordField(MDSRecordFieldBase):
     cdef:
         h_rfield_int_t _handle
@@ -1534,6 +6254,57 @@ cdef class MDSIntRecordField(MDSRecordFieldBase):
     def get_reference_type() -> type:
         return MDSIntRecordFieldReference
 
+    @staticmethod
+    def get_array_type() -> type:
+        return IntArray
+
+    cdef object _read(self, h_mrecord_t& record):
+        cdef int32_t retval = self._handle.frozen_read(record)
+        return retval
+
+    cdef object _peek(self, h_mrecord_t& record):
+        cdef int32_t retval = self._handle.free_read(record)
+        return retval
+
+    cdef _write(self, h_mrecord_t& record, value):
+        self._handle.write(record, <int32_t> value)
+
+    cdef MDSArrayBuffer _gather(self, vector[h_mrecord_t]& records):
+        cdef:
+            h_rfield_int_t handle = self._handle
+            size_t i, n = records.size()
+            MDSArrayBuffer retval = MDSArrayBuffer(n, sizeof(int32_t), b"i", mds.typing.primitives.int)
+            int32_t* data = <int32_t*> retval._data
+
+        with nogil:
+            for i in range(n):
+                data[i] = handle.frozen_read(records[i])
+
+        return retval
+
+    cdef _scatter(self, vector[h_mrecord_t]& records, values):
+        cdef:
+            h_rfield_int_t handle = self._handle
+            const int32_t[::1] src
+            const int32_t* data
+            vector[int32_t] staged
+            size_t i, n = records.size()
+
+        if not n:
+            return
+
+        try:
+            src = values
+            data = &src[0]
+        except (BufferError, TypeError, ValueError):
+            # Conversion range checks each value against int32_t
+            staged = values.tolist() if hasattr(values, "tolist") else list(values)
+            data = staged.data()
+
+        with nogil:
+            for i in range(n):
+                handle.write(records[i], data[i])
+
 cdef class MDSUIntRecordField(MDSRecordFieldBase):
     cdef:
         h_rfield_uint_t _handle
@@ -1547,6 +6318,57 @@ cdef class MDSUIntRecordField(MDSRecordFieldBase):
     def get_reference_type() -> type:
         return MDSUIntRecordFieldReference
 
+    @staticmethod
+    def get_array_type() -> type:
+        return UIntArray
+
+    cdef object _read(self, h_mrecord_t& record):
+        cdef uint32_t retval = self._handle.frozen_read(record)
+        return retval
+
+    cdef object _peek(self, h_mrecord_t& record):
+        cdef uint32_t retval = self._handle.free_read(record)
+        return retval
+
+    cdef _write(self, h_mrecord_t& record, value):
+        self._handle.write(record, <uint32_t> value)
+
+    cdef MDSArrayBuffer _gather(self, vector[h_mrecord_t]& records):
+        cdef:
+            h_rfield_uint_t handle = self._handle
+            size_t i, n = records.size()
+            MDSArrayBuffer retval = MDSArrayBuffer(n, sizeof(uint32_t), b"I", mds.typing.primitives.uint)
+            uint32_t* data = <uint32_t*> retval._data
+
+        with nogil:
+            for i in range(n):
+                data[i] = handle.frozen_read(records[i])
+
+        return retval
+
+    cdef _scatter(self, vector[h_mrecord_t]& records, values):
+        cdef:
+            h_rfield_uint_t handle = self._handle
+            const uint32_t[::1] src
+            const uint32_t* data
+            vector[uint32_t] staged
+            size_t i, n = records.size()
+
+        if not n:
+            return
+
+        try:
+            src = values
+            data = &src[0]
+        except (BufferError, TypeError, ValueError):
+            # Conversion range checks each value against uint32_t
+            staged = values.tolist() if hasattr(values, "tolist") else list(values)
+            data = staged.data()
+
+        with nogil:
+            for i in range(n):
+                handle.write(records[i], data[i])
+
 cdef class MDSLongRecordField(MDSRecordFieldBase):
     cdef:
         h_rfield_long_t _handle
@@ -1560,6 +6382,57 @@ cdef class MDSLongRecordField(MDSRecordFieldBase):
     def get_reference_type() -> type:
         return MDSLongRecordFieldReference
 
+    @staticmethod
+    def get_array_type() -> type:
+        return LongArray
+
+    cdef object _read(self, h_mrecord_t& record):
+        cdef int64_t retval = self._handle.frozen_read(record)
+        return retval
+
+    cdef object _peek(self, h_mrecord_t& record):
+        cdef int64_t retval = self._handle.free_read(record)
+        return retval
+
+    cdef _write(self, h_mrecord_t& record, value):
+        self._handle.write(record, <int64_t> value)
+
+    cdef MDSArrayBuffer _gather(self, vector[h_mrecord_t]& records):
+        cdef:
+            h_rfield_long_t handle = self._handle
+            size_t i, n = records.size()
+            MDSArrayBuffer retval = MDSArrayBuffer(n, sizeof(int64_t), b"q", mds.typing.primitives.long)
+            int64_t* data = <int64_t*> retval._data
+
+        with nogil:
+            for i in range(n):
+                data[i] = handle.frozen_read(records[i])
+
+        return retval
+
+    cdef _scatter(self, vector[h_mrecord_t]& records, values):
+        cdef:
+            h_rfield_long_t handle = self._handle
+            const int64_t[::1] src
+            const int64_t* data
+            vector[int64_t] staged
+            size_t i, n = records.size()
+
+        if not n:
+            return
+
+        try:
+            src = values
+            data = &src[0]
+        except (BufferError, TypeError, ValueError):
+            # Conversion range checks each value against int64_t
+            staged = values.tolist() if hasattr(values, "tolist") else list(values)
+            data = staged.data()
+
+        with nogil:
+            for i in range(n):
+                handle.write(records[i], data[i])
+
 cdef class MDSULongRecordField(MDSRecordFieldBase):
     cdef:
         h_rfield_ulong_t _handle
@@ -1569,9 +6442,60 @@ cdef class MDSULongRecordField(MDSRecordFieldBase):
         print("?> Attempting to get a handle from h_c_array_ulong_t.field_in")
         self._handle = h_rfield_ulong_t(h_c_mulong_t().field_in(rt._declared_type, name._ish, True))
 
-    @staticmethod
-    def get_reference_type() -> type:
-        return MDSULongRecordFieldReference
+    @staticmethod
+    def get_reference_type() -> type:
+        return MDSULongRecordFieldReference
+
+    @staticmethod
+    def get_array_type() -> type:
+        return ULongArray
+
+    cdef object _read(self, h_mrecord_t& record):
+        cdef uint64_t retval = self._handle.frozen_read(record)
+        return retval
+
+    cdef object _peek(self, h_mrecord_t& record):
+        cdef uint64_t retval = self._handle.free_read(record)
+        return retval
+
+    cdef _write(self, h_mrecord_t& record, value):
+        self._handle.write(record, <uint64_t> value)
+
+    cdef MDSArrayBuffer _gather(self, vector[h_mrecord_t]& records):
+        cdef:
+            h_rfield_ulong_t handle = self._handle
+            size_t i, n = records.size()
+            MDSArrayBuffer retval = MDSArrayBuffer(n, sizeof(uint64_t), b"Q", mds.typing.primitives.ulong)
+            uint64_t* data = <uint64_t*> retval._data
+
+        with nogil:
+            for i in range(n):
+                data[i] = handle.frozen_read(records[i])
+
+        return retval
+
+    cdef _scatter(self, vector[h_mrecord_t]& records, values):
+        cdef:
+            h_rfield_ulong_t handle = self._handle
+            const uint64_t[::1] src
+            const uint64_t* data
+            vector[uint64_t] staged
+            size_t i, n = records.size()
+
+        if not n:
+            return
+
+        try:
+            src = values
+            data = &src[0]
+        except (BufferError, TypeError, ValueError):
+            # Conversion range checks each value against uint64_t
+            staged = values.tolist() if hasattr(values, "tolist") else list(values)
+            data = staged.data()
+
+        with nogil:
+            for i in range(n):
+                handle.write(records[i], data[i])
 
 cdef class MDSFloatRecordField(MDSRecordFieldBase):
     cdef:
@@ -1586,6 +6510,57 @@ cdef class MDSFloatRecordField(MDSRecordFieldBase):
     def get_reference_type() -> type:
         return MDSFloatRecordFieldReference
 
+    @staticmethod
+    def get_array_type() -> type:
+        return FloatArray
+
+    cdef object _read(self, h_mrecord_t& record):
+        cdef float retval = self._handle.frozen_read(record)
+        return retval
+
+    cdef object _peek(self, h_mrecord_t& record):
+        cdef float retval = self._handle.free_read(record)
+        return retval
+
+    cdef _write(self, h_mrecord_t& record, value):
+        self._handle.write(record, <float> value)
+
+    cdef MDSArrayBuffer _gather(self, vector[h_mrecord_t]& records):
+        cdef:
+            h_rfield_float_t handle = self._handle
+            size_t i, n = records.size()
+            MDSArrayBuffer retval = MDSArrayBuffer(n, sizeof(float), b"f", mds.typing.primitives.float)
+            float* data = <float*> retval._data
+
+        with nogil:
+            for i in range(n):
+                data[i] = handle.frozen_read(records[i])
+
+        return retval
+
+    cdef _scatter(self, vector[h_mrecord_t]& records, values):
+        cdef:
+            h_rfield_float_t handle = self._handle
+            const float[::1] src
+            const float* data
+            vector[float] staged
+            size_t i, n = records.size()
+
+        if not n:
+            return
+
+        try:
+            src = values
+            data = &src[0]
+        except (BufferError, TypeError, ValueError):
+            # Conversion range checks each value against float
+            staged = values.tolist() if hasattr(values, "tolist") else list(values)
+            data = staged.data()
+
+        with nogil:
+            for i in range(n):
+                handle.write(records[i], data[i])
+
 cdef class MDSDoubleRecordField(MDSRecordFieldBase):
     cdef:
         h_rfield_double_t _handle
@@ -1598,6 +6573,57 @@ cdef class MDSDoubleRecordField(MDSRecordFieldBase):
     @staticmethod
     def get_reference_type() -> type:
         return MDSDoubleRecordFieldReference
+
+    @staticmethod
+    def get_array_type() -> type:
+        return DoubleArray
+
+    cdef object _read(self, h_mrecord_t& record):
+        cdef double retval = self._handle.frozen_read(record)
+        return retval
+
+    cdef object _peek(self, h_mrecord_t& record):
+        cdef double retval = self._handle.free_read(record)
+        return retval
+
+    cdef _write(self, h_mrecord_t& record, value):
+        self._handle.write(record, <double> value)
+
+    cdef MDSArrayBuffer _gather(self, vector[h_mrecord_t]& records):
+        cdef:
+            h_rfield_double_t handle = self._handle
+            size_t i, n = records.size()
+            MDSArrayBuffer retval = MDSArrayBuffer(n, sizeof(double), b"d", mds.typing.primitives.double)
+            double* data = <double*> retval._data
+
+        with nogil:
+            for i in range(n):
+                data[i] = handle.frozen_read(records[i])
+
+        return retval
+
+    cdef _scatter(self, vector[h_mrecord_t]& records, values):
+        cdef:
+            h_rfield_double_t handle = self._handle
+            const double[::1] src
+            const double* data
+            vector[double] staged
+            size_t i, n = records.size()
+
+        if not n:
+            return
+
+        try:
+            src = values
+            data = &src[0]
+        except (BufferError, TypeError, ValueError):
+            # Conversion range checks each value against double
+            staged = values.tolist() if hasattr(values, "tolist") else list(values)
+            data = staged.data()
+
+        with nogil:
+            for i in range(n):
+                handle.write(records[i], data[i])
 # END INJECTION
 
 # START INJECTION | tmpl_record_field_arrays(Arrays)
@@ -1615,6 +6641,20 @@ cdef class MDSBoolArrayRecordField(MDSRecordFieldBase):
     def get_reference_type() -> type:
         return MDSBoolArrayRecordFieldReference
 
+    cdef object _read(self, h_mrecord_t& record):
+        cdef BoolArray retval = BoolArray()
+        retval._handle = downcast_marray_bool(self._handle.frozen_read(record))
+        return retval
+
+    cdef object _peek(self, h_mrecord_t& record):
+        cdef BoolArray retval = BoolArray()
+        retval._handle = downcast_marray_bool(self._handle.free_read(record))
+        return retval
+
+    cdef _write(self, h_mrecord_t& record, value):
+        cdef BoolArray array = value
+        self._handle.write(record, array._handle)
+
 cdef class MDSByteArrayRecordField(MDSRecordFieldBase):
     cdef:
         h_rfield_array_byte_t _handle
@@ -1628,6 +6668,20 @@ cdef class MDSByteArrayRecordField(MDSRecordFieldBase):
     def get_reference_type() -> type:
         return MDSByteArrayRecordFieldReference
 
+    cdef object _read(self, h_mrecord_t& record):
+        cdef ByteArray retval = ByteArray()
+        retval._handle = downcast_marray_byte(self._handle.frozen_read(record))
+        return retval
+
+    cdef object _peek(self, h_mrecord_t& record):
+        cdef ByteArray retval = ByteArray()
+        retval._handle = downcast_marray_byte(self._handle.free_read(record))
+        return retval
+
+    cdef _write(self, h_mrecord_t& record, value):
+        cdef ByteArray array = value
+        self._handle.write(record, array._handle)
+
 cdef class MDSUByteArrayRecordField(MDSRecordFieldBase):
     cdef:
         h_rfield_array_ubyte_t _handle
@@ -1641,6 +6695,20 @@ cdef class MDSUByteArrayRecordField(MDSRecordFieldBase):
     def get_reference_type() -> type:
         return MDSUByteArrayRecordFieldReference
 
+    cdef object _read(self, h_mrecord_t& record):
+        cdef UByteArray retval = UByteArray()
+        retval._handle = downcast_marray_ubyte(self._handle.frozen_read(record))
+        return retval
+
+    cdef object _peek(self, h_mrecord_t& record):
+        cdef UByteArray retval = UByteArray()
+        retval._handle = downcast_marray_ubyte(self._handle.free_read(record))
+        return retval
+
+    cdef _write(self, h_mrecord_t& record, value):
+        cdef UByteArray array = value
+        self._handle.write(record, array._handle)
+
 cdef class MDSShortArrayRecordField(MDSRecordFieldBase):
     cdef:
         h_rfield_array_short_t _handle
@@ -1654,6 +6722,20 @@ cdef class MDSShortArrayRecordField(MDSRecordFieldBase):
     def get_reference_type() -> type:
         return MDSShortArrayRecordFieldReference
 
+    cdef object _read(self, h_mrecord_t& record):
+        cdef ShortArray retval = ShortArray()
+        retval._handle = downcast_marray_short(self._handle.frozen_read(record))
+        return retval
+
+    cdef object _peek(self, h_mrecord_t& record):
+        cdef ShortArray retval = ShortArray()
+        retval._handle = downcast_marray_short(self._handle.free_read(record))
+        return retval
+
+    cdef _write(self, h_mrecord_t& record, value):
+        cdef ShortArray array = value
+        self._handle.write(record, array._handle)
+
 cdef class MDSUShortArrayRecordField(MDSRecordFieldBase):
     cdef:
         h_rfield_array_ushort_t _handle
@@ -1667,6 +6749,20 @@ cdef class MDSUShortArrayRecordField(MDSRecordFieldBase):
     def get_reference_type() -> type:
         return MDSUShortArrayRecordFieldReference
 
+    cdef object _read(self, h_mrecord_t& record):
+        cdef UShortArray retval = UShortArray()
+        retval._handle = downcast_marray_ushort(self._handle.frozen_read(record))
+        return retval
+
+    cdef object _peek(self, h_mrecord_t& record):
+        cdef UShortArray retval = UShortArray()
+        retval._handle = downcast_marray_ushort(self._handle.free_read(record))
+        return retval
+
+    cdef _write(self, h_mrecord_t& record, value):
+        cdef UShortArray array = value
+        self._handle.write(record, array._handle)
+
 cdef class MDSIntArrayRecordField(MDSRecordFieldBase):
     cdef:
         h_rfield_array_int_t _handle
@@ -1680,6 +6776,20 @@ cdef class MDSIntArrayRecordField(MDSRecordFieldBase):
     def get_reference_type() -> type:
         return MDSIntArrayRecordFieldReference
 
+    cdef object _read(self, h_mrecord_t& record):
+        cdef IntArray retval = IntArray()
+        retval._handle = downcast_marray_int(self._handle.frozen_read(record))
+        return retval
+
+    cdef object _peek(self, h_mrecord_t& record):
+        cdef IntArray retval = IntArray()
+        retval._handle = downcast_marray_int(self._handle.free_read(record))
+        return retval
+
+    cdef _write(self, h_mrecord_t& record, value):
+        cdef IntArray array = value
+        self._handle.write(record, array._handle)
+
 cdef class MDSUIntArrayRecordField(MDSRecordFieldBase):
     cdef:
         h_rfield_array_uint_t _handle
@@ -1693,6 +6803,20 @@ cdef class MDSUIntArrayRecordField(MDSRecordFieldBase):
     def get_reference_type() -> type:
         return MDSUIntArrayRecordFieldReference
 
+    cdef object _read(self, h_mrecord_t& record):
+        cdef UIntArray retval = UIntArray()
+        retval._handle = downcast_marray_uint(self._handle.frozen_read(record))
+        return retval
+
+    cdef object _peek(self, h_mrecord_t& record):
+        cdef UIntArray retval = UIntArray()
+        retval._handle = downcast_marray_uint(self._handle.free_read(record))
+        return retval
+
+    cdef _write(self, h_mrecord_t& record, value):
+        cdef UIntArray array = value
+        self._handle.write(record, array._handle)
+
 cdef class MDSLongArrayRecordField(MDSRecordFieldBase):
     cdef:
         h_rfield_array_long_t _handle
@@ -1706,6 +6830,20 @@ cdef class MDSLongArrayRecordField(MDSRecordFieldBase):
     def get_reference_type() -> type:
         return MDSLongArrayRecordFieldReference
 
+    cdef object _read(self, h_mrecord_t& record):
+        cdef LongArray retval = LongArray()
+        retval._handle = downcast_marray_long(self._handle.frozen_read(record))
+        return retval
+
+    cdef object _peek(self, h_mrecord_t& record):
+        cdef LongArray retval = LongArray()
+        retval._handle = downcast_marray_long(self._handle.free_read(record))
+        return retval
+
+    cdef _write(self, h_mrecord_t& record, value):
+        cdef LongArray array = value
+        self._handle.write(record, array._handle)
+
 cdef class MDSULongArrayRecordField(MDSRecordFieldBase):
     cdef:
         h_rfield_array_ulong_t _handle
@@ -1719,6 +6857,20 @@ cdef class MDSULongArrayRecordField(MDSRecordFieldBase):
     def get_reference_type() -> type:
         return MDSULongArrayRecordFieldReference
 
+    cdef object _read(self, h_mrecord_t& record):
+        cdef ULongArray retval = ULongArray()
+        retval._handle = downcast_marray_ulong(self._handle.frozen_read(record))
+        return retval
+
+    cdef object _peek(self, h_mrecord_t& record):
+        cdef ULongArray retval = ULongArray()
+        retval._handle = downcast_marray_ulong(self._handle.free_read(record))
+        return retval
+
+    cdef _write(self, h_mrecord_t& record, value):
+        cdef ULongArray array = value
+        self._handle.write(record, array._handle)
+
 cdef class MDSFloatArrayRecordField(MDSRecordFieldBase):
     cdef:
         h_rfield_array_float_t _handle
@@ -1732,6 +6884,20 @@ cdef class MDSFloatArrayRecordField(MDSRecordFieldBase):
     def get_reference_type() -> type:
         return MDSFloatArrayRecordFieldReference
 
+    cdef object _read(self, h_mrecord_t& record):
+        cdef FloatArray retval = FloatArray()
+        retval._handle = downcast_marray_float(self._handle.frozen_read(record))
+        return retval
+
+    cdef object _peek(self, h_mrecord_t& record):
+        cdef FloatArray retval = FloatArray()
+        retval._handle = downcast_marray_float(self._handle.free_read(record))
+        return retval
+
+    cdef _write(self, h_mrecord_t& record, value):
+        cdef FloatArray array = value
+        self._handle.write(record, array._handle)
+
 cdef class MDSDoubleArrayRecordField(MDSRecordFieldBase):
     cdef:
         h_rfield_array_double_t _handle
@@ -1745,6 +6911,20 @@ cdef class MDSDoubleArrayRecordField(MDSRecordFieldBase):
     def get_reference_type() -> type:
         return MDSDoubleArrayRecordFieldReference
 
+    cdef object _read(self, h_mrecord_t& record):
+        cdef DoubleArray retval = DoubleArray()
+        retval._handle = downcast_marray_double(self._handle.frozen_read(record))
+        return retval
+
+    cdef object _peek(self, h_mrecord_t& record):
+        cdef DoubleArray retval = DoubleArray()
+        retval._handle = downcast_marray_double(self._handle.free_read(record))
+        return retval
+
+    cdef _write(self, h_mrecord_t& record, value):
+        cdef DoubleArray array = value
+        self._handle.write(record, array._handle)
+
 cdef class MDSStringArrayRecordField(MDSRecordFieldBase):
     cdef:
         h_rfield_array_string_t _handle
@@ -1758,9 +6938,27 @@ cdef class MDSStringArrayRecordField(MDSRecordFieldBase):
     def get_reference_type() -> type:
         return MDSStringArrayRecordFieldReference
 
+    cdef object _read(self, h_mrecord_t& record):
+        cdef StringArray retval = StringArray()
+        retval._handle = downcast_marray_string(self._handle.frozen_read(record))
+        return retval
+
+    cdef object _peek(self, h_mrecord_t& record):
+        cdef StringArray retval = StringArray()
+        retval._handle = downcast_marray_string(self._handle.free_read(record))
+        return retval
+
+    cdef _write(self, h_mrecord_t& record, value):
+        cdef StringArray array = value
+        self._handle.write(record, array._handle)
+
 cdef class MDSRecordArrayRecordField(MDSRecordFieldBase):
     cdef:
         h_rfield_array_record_t _handle
+        type _record_type
+
+    def __cinit__(self, type record_type=None):
+        self._record_type = record_type
 
     def declare(self, String name, MDSRecordTypeDeclaration rt):
         assert self._handle.is_null()
@@ -1770,13 +6968,130 @@ cdef class MDSRecordArrayRecordField(MDSRecordFieldBase):
     @staticmethod
     def get_reference_type() -> type:
         return MDSRecordArrayRecordFieldReference
+
+    cdef object _read(self, h_mrecord_t& record):
+        cdef RecordArray retval = RecordArray(record_type=self._record_type)
+        retval._handle = downcast_marray_record(self._handle.frozen_read(record))
+        return retval
+
+    cdef object _peek(self, h_mrecord_t& record):
+        cdef RecordArray retval = RecordArray(record_type=self._record_type)
+        retval._handle = downcast_marray_record(self._handle.free_read(record))
+        return retval
+
+    cdef _write(self, h_mrecord_t& record, value):
+        cdef RecordArray array = value
+        self._handle.write(record, array._handle)
 # END INJECTION
 
+cdef class MDSStringRecordField(MDSRecordFieldBase):
+    """
+    Holds the core string handle, so reading it back is a single call
+    """
+    cdef:
+        h_rfield_string_t _handle
+
+    def declare(self, String name, MDSRecordTypeDeclaration rt):
+        assert self._handle.is_null()
+        self._handle = h_rfield_string_t(h_string_type_t().field_in(rt._declared_type, name._ish, True))
+
+    @staticmethod
+    def get_reference_type() -> type:
+        return MDSStringRecordFieldReference
+
+    @staticmethod
+    def get_array_type() -> type:
+        return None  # Not until string fields can be gathered
+
+    cdef object _read(self, h_mrecord_t& record):
+        if not self._handle.has_value(record):
+            return None
+
+        return String_Adopt(self._handle.frozen_read(record))
+
+    cdef object _peek(self, h_mrecord_t& record):
+        if not self._handle.has_value(record):
+            return None
+
+        return String_Adopt(self._handle.free_read(record))
+
+    cdef _write(self, h_mrecord_t& record, value):
+        cdef String s
+
+        if value is None:
+            self._handle.write(record, h_mstring_t())
+        else:
+            s = __cast_to_mds_string(value)
+            self._handle.write(record, s._handle)
+
+cdef class MDSRecordRecordField(MDSRecordFieldBase):
+    """
+    Holds the core handle of another record, of the Record subclass given
+    when the field was declared
+    """
+    cdef:
+        h_rfield_record_t _handle
+        type _record_type
+
+    def __cinit__(self, type record_type=None):
+        self._record_type = record_type
+
+    def declare(self, String name, MDSRecordTypeDeclaration rt):
+        cdef MDSRecordHandleWrapper field_type = Record_TypeDecl(self._record_type).ensure_created()
+
+        assert self._handle.is_null()
+        self._handle = h_rfield_record_t(field_type._handle.field_in(rt._declared_type, name._ish, True))
+
+    def ensure_type(self):
+        Record_TypeDecl(self._record_type).ensure_created()
+
+    @staticmethod
+    def get_reference_type() -> type:
+        return MDSRecordRecordFieldReference
+
+    @staticmethod
+    def get_array_type() -> type:
+        return None  # Not until record fields can be gathered
+
+    cdef object _read(self, h_mrecord_t& record):
+        if not self._handle.has_value(record):
+            return None
+
+        return Record_Adopt(self._record_type, self._handle.frozen_read(record))
+
+    cdef object _peek(self, h_mrecord_t& record):
+        if not self._handle.has_value(record):
+            return None
+
+        return Record_Adopt(self._record_type, self._handle.free_read(record))
+
+    cdef _write(self, h_mrecord_t& record, value):
+        cdef Record r
+
+        if value is None:
+            self._handle.write(record, h_mrecord_t())
+            return
+
+        if not isinstance(value, self._record_type):
+            raise TypeError(f"Expected a {self._record_type.__name__}, got {type(value).__name__}")
+
+        r = value
+        self._handle.write(record, r._handle)
+
+    property record_type:
+        def __get__(self):
+            return self._record_type
+
 ######################################################################### REFERENCES
 
 cdef class MDSRecordFieldReferenceBase(MDSObject):
     cdef:
         h_mrecord_t _record_handle
+        bint _const
+
+    cdef _check_writable(self):
+        if self._const:
+            raise TypeError("Can't write to a const field")
 
     def read(self):
         pass
@@ -1829,6 +7144,7 @@ cdef class MDSBoolRecordFieldReference(MDSRecordFieldReferenceBase):
         return retval
 
     def write(self, value):
+        self._check_writable()
         self._field_handle.write(self._record_handle, <bool> (value))
 
 
@@ -1851,19 +7167,24 @@ cdef class MDSByteRecordFieldReference(MDSRecordFieldReferenceBase):
         return retval
 
     def write(self, value):
+        self._check_writable()
         self._field_handle.write(self._record_handle, <int8_t> (value))
 
 
     def __iadd__(self, other):
+        self._check_writable()
         self._field_handle.add(self._record_handle, <int8_t> (other))
 
     def __isub__(self, other):
+        self._check_writable()
         self._field_handle.sub(self._record_handle, <int8_t> (other))
 
     def __imul__(self, other):
+        self._check_writable()
         self._field_handle.mul(self._record_handle, <int8_t> (other))
 
     def __itruediv__(self, other):
+        self._check_writable()
         self._field_handle.div(self._record_handle, <int8_t> (other))
 
 
@@ -1886,19 +7207,24 @@ cdef class MDSUByteRecordFieldReference(MDSRecordFieldReferenceBase):
         return retval
 
     def write(self, value):
+        self._check_writable()
         self._field_handle.write(self._record_handle, <uint8_t> (value))
 
 
     def __iadd__(self, other):
+        self._check_writable()
         self._field_handle.add(self._record_handle, <uint8_t> (other))
 
     def __isub__(self, other):
+        self._check_writable()
         self._field_handle.sub(self._record_handle, <uint8_t> (other))
 
     def __imul__(self, other):
+        self._check_writable()
         self._field_handle.mul(self._record_handle, <uint8_t> (other))
 
     def __itruediv__(self, other):
+        self._check_writable()
         self._field_handle.div(self._record_handle, <uint8_t> (other))
 
 
@@ -1921,19 +7247,24 @@ cdef class MDSShortRecordFieldReference(MDSRecordFieldReferenceBase):
         return retval
 
     def write(self, value):
+        self._check_writable()
         self._field_handle.write(self._record_handle, <int16_t> (value))
 
 
     def __iadd__(self, other):
+        self._check_writable()
         self._field_handle.add(self._record_handle, <int16_t> (other))
 
     def __isub__(self, other):
+        self._check_writable()
         self._field_handle.sub(self._record_handle, <int16_t> (other))
 
     def __imul__(self, other):
+        self._check_writable()
         self._field_handle.mul(self._record_handle, <int16_t> (other))
 
     def __itruediv__(self, other):
+        self._check_writable()
         self._field_handle.div(self._record_handle, <int16_t> (other))
 
 
@@ -1956,19 +7287,24 @@ cdef class MDSUShortRecordFieldReference(MDSRecordFieldReferenceBase):
         return retval
 
     def write(self, value):
+        self._check_writable()
         self._field_handle.write(self._record_handle, <uint16_t> (value))
 
 
     def __iadd__(self, other):
+        self._check_writable()
         self._field_handle.add(self._record_handle, <uint16_t> (other))
 
     def __isub__(self, other):
+        self._check_writable()
         self._field_handle.sub(self._record_handle, <uint16_t> (other))
 
     def __imul__(self, other):
+        self._check_writable()
         self._field_handle.mul(self._record_handle, <uint16_t> (other))
 
     def __itruediv__(self, other):
+        self._check_writable()
         self._field_handle.div(self._record_handle, <uint16_t> (other))
 
 
@@ -1991,19 +7327,24 @@ cdef class MDSIntRecordFieldReference(MDSRecordFieldReferenceBase):
         return retval
 
     def write(self, value):
+        self._check_writable()
         self._field_handle.write(self._record_handle, <int32_t> (value))
 
 
     def __iadd__(self, other):
+        self._check_writable()
         self._field_handle.add(self._record_handle, <int32_t> (other))
 
     def __isub__(self, other):
+        self._check_writable()
         self._field_handle.sub(self._record_handle, <int32_t> (other))
 
     def __imul__(self, other):
+        self._check_writable()
         self._field_handle.mul(self._record_handle, <int32_t> (other))
 
     def __itruediv__(self, other):
+        self._check_writable()
         self._field_handle.div(self._record_handle, <int32_t> (other))
 
 
@@ -2026,19 +7367,24 @@ cdef class MDSUIntRecordFieldReference(MDSRecordFieldReferenceBase):
         return retval
 
     def write(self, value):
+        self._check_writable()
         self._field_handle.write(self._record_handle, <uint32_t> (value))
 
 
     def __iadd__(self, other):
+        self._check_writable()
         self._field_handle.add(self._record_handle, <uint32_t> (other))
 
     def __isub__(self, other):
+        self._check_writable()
         self._field_handle.sub(self._record_handle, <uint32_t> (other))
 
     def __imul__(self, other):
+        self._check_writable()
         self._field_handle.mul(self._record_handle, <uint32_t> (other))
 
     def __itruediv__(self, other):
+        self._check_writable()
         self._field_handle.div(self._record_handle, <uint32_t> (other))
 
 
@@ -2061,19 +7407,24 @@ cdef class MDSLongRecordFieldReference(MDSRecordFieldReferenceBase):
         return retval
 
     def write(self, value):
+        self._check_writable()
         self._field_handle.write(self._record_handle, <int64_t> (value))
 
 
     def __iadd__(self, other):
+        self._check_writable()
         self._field_handle.add(self._record_handle, <int64_t> (other))
 
     def __isub__(self, other):
+        self._check_writable()
         self._field_handle.sub(self._record_handle, <int64_t> (other))
 
     def __imul__(self, other):
+        self._check_writable()
         self._field_handle.mul(self._record_handle, <int64_t> (other))
 
     def __itruediv__(self, other):
+        self._check_writable()
         self._field_handle.div(self._record_handle, <int64_t> (other))
 
 
@@ -2096,19 +7447,24 @@ cdef class MDSULongRecordFieldReference(MDSRecordFieldReferenceBase):
         return retval
 
     def write(self, value):
+        self._check_writable()
         self._field_handle.write(self._record_handle, <uint64_t> (value))
 
 
     def __iadd__(self, other):
+        self._check_writable()
         self._field_handle.add(self._record_handle, <uint64_t> (other))
 
     def __isub__(self, other):
+        self._check_writable()
         self._field_handle.sub(self._record_handle, <uint64_t> (other))
 
     def __imul__(self, other):
+        self._check_writable()
         self._field_handle.mul(self._record_handle, <uint64_t> (other))
 
     def __itruediv__(self, other):
+        self._check_writable()
         self._field_handle.div(self._record_handle, <uint64_t> (other))
 
 
@@ -2131,19 +7487,24 @@ cdef class MDSFloatRecordFieldReference(MDSRecordFieldReferenceBase):
         return retval
 
     def write(self, value):
+        self._check_writable()
         self._field_handle.write(self._record_handle, <float> (value))
 
 
     def __iadd__(self, other):
+        self._check_writable()
         self._field_handle.add(self._record_handle, <float> (other))
 
     def __isub__(self, other):
+        self._check_writable()
         self._field_handle.sub(self._record_handle, <float> (other))
 
     def __imul__(self, other):
+        self._check_writable()
         self._field_handle.mul(self._record_handle, <float> (other))
 
     def __itruediv__(self, other):
+        self._check_writable()
         self._field_handle.div(self._record_handle, <float> (other))
 
 
@@ -2166,19 +7527,24 @@ cdef class MDSDoubleRecordFieldReference(MDSRecordFieldReferenceBase):
         return retval
 
     def write(self, value):
+        self._check_writable()
         self._field_handle.write(self._record_handle, <double> (value))
 
 
     def __iadd__(self, other):
+        self._check_writable()
         self._field_handle.add(self._record_handle, <double> (other))
 
     def __isub__(self, other):
+        self._check_writable()
         self._field_handle.sub(self._record_handle, <double> (other))
 
     def __imul__(self, other):
+        self._check_writable()
         self._field_handle.mul(self._record_handle, <double> (other))
 
     def __itruediv__(self, other):
+        self._check_writable()
         self._field_handle.div(self._record_handle, <double> (other))
 # END INJECTION
 
@@ -2187,431 +7553,364 @@ cdef class MDSDoubleRecordFieldReference(MDSRecordFieldReferenceBase):
 cdef class MDSBoolArrayRecordFieldReference(MDSRecordFieldReferenceBase):
     cdef:
         h_rfield_array_bool_t _field_handle
+        MDSBoolArrayRecordField _field
         Record _record
 
     def __cinit__(self, MDSBoolArrayRecordField field, Record record):
         self._record = record
+        self._field = field
         self._field_handle = h_rfield_array_bool_t(field._handle)
         self._record_handle = h_mrecord_t(record._handle)
 
     def read(self):
-        cdef:
-            h_marray_base_t mbah = self._field_handle.frozen_read(self._record_handle)
-            h_marray_bool_t handle = downcast_marray_bool(mbah)
-            BoolArray retval = BoolArray()
-
-        retval._handle = handle
-        return retval
+        return self._field._read(self._record_handle)
 
     def peek(self):
-        cdef:
-            h_marray_base_t mbah = self._field_handle.free_read(self._record_handle)
-            h_marray_bool_t handle = downcast_marray_bool(mbah)
-            BoolArray retval = BoolArray()
-
-        retval._handle = handle
-        return retval
+        return self._field._peek(self._record_handle)
 
     def write(self, BoolArray value):
         cdef h_marray_bool_t handle = value._handle
+        self._check_writable()
         self._field_handle.write(self._record_handle, handle)
 
 cdef class MDSByteArrayRecordFieldReference(MDSRecordFieldReferenceBase):
     cdef:
         h_rfield_array_byte_t _field_handle
+        MDSByteArrayRecordField _field
         Record _record
 
     def __cinit__(self, MDSByteArrayRecordField field, Record record):
         self._record = record
+        self._field = field
         self._field_handle = h_rfield_array_byte_t(field._handle)
         self._record_handle = h_mrecord_t(record._handle)
 
     def read(self):
-        cdef:
-            h_marray_base_t mbah = self._field_handle.frozen_read(self._record_handle)
-            h_marray_byte_t handle = downcast_marray_byte(mbah)
-            ByteArray retval = ByteArray()
-
-        retval._handle = handle
-        return retval
+        return self._field._read(self._record_handle)
 
     def peek(self):
-        cdef:
-            h_marray_base_t mbah = self._field_handle.free_read(self._record_handle)
-            h_marray_byte_t handle = downcast_marray_byte(mbah)
-            ByteArray retval = ByteArray()
-
-        retval._handle = handle
-        return retval
+        return self._field._peek(self._record_handle)
 
     def write(self, ByteArray value):
         cdef h_marray_byte_t handle = value._handle
+        self._check_writable()
         self._field_handle.write(self._record_handle, handle)
 
 cdef class MDSUByteArrayRecordFieldReference(MDSRecordFieldReferenceBase):
     cdef:
         h_rfield_array_ubyte_t _field_handle
+        MDSUByteArrayRecordField _field
         Record _record
 
     def __cinit__(self, MDSUByteArrayRecordField field, Record record):
         self._record = record
+        self._field = field
         self._field_handle = h_rfield_array_ubyte_t(field._handle)
         self._record_handle = h_mrecord_t(record._handle)
 
     def read(self):
-        cdef:
-            h_marray_base_t mbah = self._field_handle.frozen_read(self._record_handle)
-            h_marray_ubyte_t handle = downcast_marray_ubyte(mbah)
-            UByteArray retval = UByteArray()
-
-        retval._handle = handle
-        return retval
+        return self._field._read(self._record_handle)
 
     def peek(self):
-        cdef:
-            h_marray_base_t mbah = self._field_handle.free_read(self._record_handle)
-            h_marray_ubyte_t handle = downcast_marray_ubyte(mbah)
-            UByteArray retval = UByteArray()
-
-        retval._handle = handle
-        return retval
+        return self._field._peek(self._record_handle)
 
     def write(self, UByteArray value):
         cdef h_marray_ubyte_t handle = value._handle
+        self._check_writable()
         self._field_handle.write(self._record_handle, handle)
 
 cdef class MDSShortArrayRecordFieldReference(MDSRecordFieldReferenceBase):
     cdef:
         h_rfield_array_short_t _field_handle
+        MDSShortArrayRecordField _field
         Record _record
 
     def __cinit__(self, MDSShortArrayRecordField field, Record record):
         self._record = record
+        self._field = field
         self._field_handle = h_rfield_array_short_t(field._handle)
         self._record_handle = h_mrecord_t(record._handle)
 
     def read(self):
-        cdef:
-            h_marray_base_t mbah = self._field_handle.frozen_read(self._record_handle)
-            h_marray_short_t handle = downcast_marray_short(mbah)
-            ShortArray retval = ShortArray()
-
-        retval._handle = handle
-        return retval
+        return self._field._read(self._record_handle)
 
     def peek(self):
-        cdef:
-            h_marray_base_t mbah = self._field_handle.free_read(self._record_handle)
-            h_marray_short_t handle = downcast_marray_short(mbah)
-            ShortArray retval = ShortArray()
-
-        retval._handle = handle
-        return retval
+        return self._field._peek(self._record_handle)
 
     def write(self, ShortArray value):
         cdef h_marray_short_t handle = value._handle
+        self._check_writable()
         self._field_handle.write(self._record_handle, handle)
 
 cdef class MDSUShortArrayRecordFieldReference(MDSRecordFieldReferenceBase):
     cdef:
         h_rfield_array_ushort_t _field_handle
+        MDSUShortArrayRecordField _field
         Record _record
 
     def __cinit__(self, MDSUShortArrayRecordField field, Record record):
         self._record = record
+        self._field = field
         self._field_handle = h_rfield_array_ushort_t(field._handle)
         self._record_handle = h_mrecord_t(record._handle)
 
     def read(self):
-        cdef:
-            h_marray_base_t mbah = self._field_handle.frozen_read(self._record_handle)
-            h_marray_ushort_t handle = downcast_marray_ushort(mbah)
-            UShortArray retval = UShortArray()
-
-        retval._handle = handle
-        return retval
+        return self._field._read(self._record_handle)
 
     def peek(self):
-        cdef:
-            h_marray_base_t mbah = self._field_handle.free_read(self._record_handle)
-            h_marray_ushort_t handle = downcast_marray_ushort(mbah)
-            UShortArray retval = UShortArray()
-
-        retval._handle = handle
-        return retval
+        return self._field._peek(self._record_handle)
 
     def write(self, UShortArray value):
         cdef h_marray_ushort_t handle = value._handle
+        self._check_writable()
         self._field_handle.write(self._record_handle, handle)
 
 cdef class MDSIntArrayRecordFieldReference(MDSRecordFieldReferenceBase):
     cdef:
         h_rfield_array_int_t _field_handle
+        MDSIntArrayRecordField _field
         Record _record
 
     def __cinit__(self, MDSIntArrayRecordField field, Record record):
         self._record = record
+        self._field = field
         self._field_handle = h_rfield_array_int_t(field._handle)
         self._record_handle = h_mrecord_t(record._handle)
 
     def read(self):
-        cdef:
-            h_marray_base_t mbah = self._field_handle.frozen_read(self._record_handle)
-            h_marray_int_t handle = downcast_marray_int(mbah)
-            IntArray retval = IntArray()
-
-        retval._handle = handle
-        return retval
+        return self._field._read(self._record_handle)
 
     def peek(self):
-        cdef:
-            h_marray_base_t mbah = self._field_handle.free_read(self._record_handle)
-            h_marray_int_t handle = downcast_marray_int(mbah)
-            IntArray retval = IntArray()
-
-        retval._handle = handle
-        return retval
+        return self._field._peek(self._record_handle)
 
     def write(self, IntArray value):
         cdef h_marray_int_t handle = value._handle
+        self._check_writable()
         self._field_handle.write(self._record_handle, handle)
 
 cdef class MDSUIntArrayRecordFieldReference(MDSRecordFieldReferenceBase):
     cdef:
         h_rfield_array_uint_t _field_handle
+        MDSUIntArrayRecordField _field
         Record _record
 
     def __cinit__(self, MDSUIntArrayRecordField field, Record record):
         self._record = record
+        self._field = field
         self._field_handle = h_rfield_array_uint_t(field._handle)
         self._record_handle = h_mrecord_t(record._handle)
 
     def read(self):
-        cdef:
-            h_marray_base_t mbah = self._field_handle.frozen_read(self._record_handle)
-            h_marray_uint_t handle = downcast_marray_uint(mbah)
-            UIntArray retval = UIntArray()
-
-        retval._handle = handle
-        return retval
+        return self._field._read(self._record_handle)
 
     def peek(self):
-        cdef:
-            h_marray_base_t mbah = self._field_handle.free_read(self._record_handle)
-            h_marray_uint_t handle = downcast_marray_uint(mbah)
-            UIntArray retval = UIntArray()
-
-        retval._handle = handle
-        return retval
+        return self._field._peek(self._record_handle)
 
     def write(self, UIntArray value):
         cdef h_marray_uint_t handle = value._handle
+        self._check_writable()
         self._field_handle.write(self._record_handle, handle)
 
 cdef class MDSLongArrayRecordFieldReference(MDSRecordFieldReferenceBase):
     cdef:
         h_rfield_array_long_t _field_handle
+        MDSLongArrayRecordField _field
         Record _record
 
     def __cinit__(self, MDSLongArrayRecordField field, Record record):
         self._record = record
+        self._field = field
         self._field_handle = h_rfield_array_long_t(field._handle)
         self._record_handle = h_mrecord_t(record._handle)
 
     def read(self):
-        cdef:
-            h_marray_base_t mbah = self._field_handle.frozen_read(self._record_handle)
-            h_marray_long_t handle = downcast_marray_long(mbah)
-            LongArray retval = LongArray()
-
-        retval._handle = handle
-        return retval
+        return self._field._read(self._record_handle)
 
     def peek(self):
-        cdef:
-            h_marray_base_t mbah = self._field_handle.free_read(self._record_handle)
-            h_marray_long_t handle = downcast_marray_long(mbah)
-            LongArray retval = LongArray()
-
-        retval._handle = handle
-        return retval
+        return self._field._peek(self._record_handle)
 
     def write(self, LongArray value):
         cdef h_marray_long_t handle = value._handle
+        self._check_writable()
         self._field_handle.write(self._record_handle, handle)
 
 cdef class MDSULongArrayRecordFieldReference(MDSRecordFieldReferenceBase):
     cdef:
         h_rfield_array_ulong_t _field_handle
+        MDSULongArrayRecordField _field
         Record _record
 
     def __cinit__(self, MDSULongArrayRecordField field, Record record):
         self._record = record
+        self._field = field
         self._field_handle = h_rfield_array_ulong_t(field._handle)
         self._record_handle = h_mrecord_t(record._handle)
 
     def read(self):
-        cdef:
-            h_marray_base_t mbah = self._field_handle.frozen_read(self._record_handle)
-            h_marray_ulong_t handle = downcast_marray_ulong(mbah)
-            ULongArray retval = ULongArray()
-
-        retval._handle = handle
-        return retval
+        return self._field._read(self._record_handle)
 
     def peek(self):
-        cdef:
-            h_marray_base_t mbah = self._field_handle.free_read(self._record_handle)
-            h_marray_ulong_t handle = downcast_marray_ulong(mbah)
-            ULongArray retval = ULongArray()
-
-        retval._handle = handle
-        return retval
+        return self._field._peek(self._record_handle)
 
     def write(self, ULongArray value):
         cdef h_marray_ulong_t handle = value._handle
+        self._check_writable()
         self._field_handle.write(self._record_handle, handle)
 
 cdef class MDSFloatArrayRecordFieldReference(MDSRecordFieldReferenceBase):
     cdef:
         h_rfield_array_float_t _field_handle
+        MDSFloatArrayRecordField _field
         Record _record
 
     def __cinit__(self, MDSFloatArrayRecordField field, Record record):
         self._record = record
+        self._field = field
         self._field_handle = h_rfield_array_float_t(field._handle)
         self._record_handle = h_mrecord_t(record._handle)
 
     def read(self):
-        cdef:
-            h_marray_base_t mbah = self._field_handle.frozen_read(self._record_handle)
-            h_marray_float_t handle = downcast_marray_float(mbah)
-            FloatArray retval = FloatArray()
-
-        retval._handle = handle
-        return retval
+        return self._field._read(self._record_handle)
 
     def peek(self):
-        cdef:
-            h_marray_base_t mbah = self._field_handle.free_read(self._record_handle)
-            h_marray_float_t handle = downcast_marray_float(mbah)
-            FloatArray retval = FloatArray()
-
-        retval._handle = handle
-        return retval
+        return self._field._peek(self._record_handle)
 
     def write(self, FloatArray value):
         cdef h_marray_float_t handle = value._handle
+        self._check_writable()
         self._field_handle.write(self._record_handle, handle)
 
 cdef class MDSDoubleArrayRecordFieldReference(MDSRecordFieldReferenceBase):
     cdef:
         h_rfield_array_double_t _field_handle
+        MDSDoubleArrayRecordField _field
         Record _record
 
     def __cinit__(self, MDSDoubleArrayRecordField field, Record record):
         self._record = record
+        self._field = field
         self._field_handle = h_rfield_array_double_t(field._handle)
         self._record_handle = h_mrecord_t(record._handle)
 
     def read(self):
-        cdef:
-            h_marray_base_t mbah = self._field_handle.frozen_read(self._record_handle)
-            h_marray_double_t handle = downcast_marray_double(mbah)
-            DoubleArray retval = DoubleArray()
-
-        retval._handle = handle
-        return retval
+        return self._field._read(self._record_handle)
 
     def peek(self):
-        cdef:
-            h_marray_base_t mbah = self._field_handle.free_read(self._record_handle)
-            h_marray_double_t handle = downcast_marray_double(mbah)
-            DoubleArray retval = DoubleArray()
-
-        retval._handle = handle
-        return retval
+        return self._field._peek(self._record_handle)
 
     def write(self, DoubleArray value):
         cdef h_marray_double_t handle = value._handle
+        self._check_writable()
         self._field_handle.write(self._record_handle, handle)
 
 cdef class MDSStringArrayRecordFieldReference(MDSRecordFieldReferenceBase):
     cdef:
         h_rfield_array_string_t _field_handle
+        MDSStringArrayRecordField _field
         Record _record
 
     def __cinit__(self, MDSStringArrayRecordField field, Record record):
         self._record = record
+        self._field = field
         self._field_handle = h_rfield_array_string_t(field._handle)
         self._record_handle = h_mrecord_t(record._handle)
 
-    def read(self):
-        cdef:
-            h_marray_base_t mbah = self._field_handle.frozen_read(self._record_handle)
-            h_marray_string_t handle = downcast_marray_string(mbah)
-            StringArray retval = StringArray()
-
-        retval._handle = handle
-        return retval
-
-    def peek(self):
-        cdef:
-            h_marray_base_t mbah = self._field_handle.free_read(self._record_handle)
-            h_marray_string_t handle = downcast_marray_string(mbah)
-            StringArray retval = StringArray()
+    def read(self):
+        return self._field._read(self._record_handle)
 
-        retval._handle = handle
-        return retval
+    def peek(self):
+        return self._field._peek(self._record_handle)
 
     def write(self, StringArray value):
         cdef h_marray_string_t handle = value._handle
+        self._check_writable()
         self._field_handle.write(self._record_handle, handle)
 
 cdef class MDSRecordArrayRecordFieldReference(MDSRecordFieldReferenceBase):
     cdef:
         h_rfield_array_record_t _field_handle
+        MDSRecordArrayRecordField _field
         Record _record
 
     def __cinit__(self, MDSRecordArrayRecordField field, Record record):
         self._record = record
+        self._field = field
         self._field_handle = h_rfield_array_record_t(field._handle)
         self._record_handle = h_mrecord_t(record._handle)
 
     def read(self):
-        cdef:
-            h_marray_base_t mbah = self._field_handle.frozen_read(self._record_handle)
-            h_marray_record_t handle = downcast_marray_record(mbah)
-            RecordArray retval = RecordArray()
-
-        retval._handle = handle
-        return retval
+        return self._field._read(self._record_handle)
 
     def peek(self):
-        cdef:
-            h_marray_base_t mbah = self._field_handle.free_read(self._record_handle)
-            h_marray_record_t handle = downcast_marray_record(mbah)
-            RecordArray retval = RecordArray()
-
-        retval._handle = handle
-        return retval
+        return self._field._peek(self._record_handle)
 
     def write(self, RecordArray value):
         cdef h_marray_record_t handle = value._handle
+        self._check_writable()
         self._field_handle.write(self._record_handle, handle)
 # END INJECTION
 
+cdef class MDSStringRecordFieldReference(MDSRecordFieldReferenceBase):
+    cdef:
+        MDSStringRecordField _field
+        Record _record
+
+    def __cinit__(self, MDSStringRecordField field, Record record):
+        self._record = record
+        self._field = field
+        self._record_handle = h_mrecord_t(record._handle)
+
+    def read(self):
+        return self._field._read(self._record_handle)
+
+    def peek(self):
+        return self._field._peek(self._record_handle)
+
+    def write(self, value):
+        self._check_writable()
+        self._field._write(self._record_handle, value)
+
+cdef class MDSRecordRecordFieldReference(MDSRecordFieldReferenceBase):
+    cdef:
+        MDSRecordRecordField _field
+        Record _record
+
+    def __cinit__(self, MDSRecordRecordField field, Record record):
+        self._record = record
+        self._field = field
+        self._record_handle = h_mrecord_t(record._handle)
+
+    def read(self):
+        return self._field._read(self._record_handle)
+
+    def peek(self):
+        return self._field._peek(self._record_handle)
+
+    def write(self, value):
+        self._check_writable()
+        self._field._write(self._record_handle, value)
+
 ############################################################# RECORD MEMBERS
 
 cdef class MDSRecordMemberBase(MDSObject):
+    """
+    Binds a record field to one record. The field, and so its core handle,
+    is shared by every record of the type; the member only adds the record,
+    so reads and writes are a single call on the field handle.
+    """
     cdef:
         Record _enclosing
+        MDSRecordFieldBase _field
+        MDSRecordFieldReferenceBase _ref
+        bint _const
 
     # using value_type = typename record_field<R,T>::value_type;
 
-    def __cinit__(self, Record record, initial_value=None):
+    def __cinit__(self, Record record, MDSRecordFieldBase field, initial_value=None):
         self._enclosing = record
+        self._field = field
 
+    def __init__(self, Record record, MDSRecordFieldBase field, initial_value=None):
         if initial_value is not None:
             self.write(initial_value)
 
@@ -2621,18 +7920,26 @@ cdef class MDSRecordMemberBase(MDSObject):
         reference, so the return type of this function may look to restrictive.
         It isn't.
 
-        This is the actual RecordField, not Base... Need to think about this
+        The reference is only built on first use, then kept for this record.
         """
-        pass
+        if self._ref is None:
+            self._ref = self._field[self]
+
+        return self._ref
 
     def read(self):
-        pass
+        return self._field._read(self._enclosing._handle)
 
     def peek(self):
-        pass
+        return self._field._peek(self._enclosing._handle)
 
-    def write(self, value):
-        pass
+    cdef _check_writable(self):
+        if self._const:
+            raise TypeError("Can't write to a const field")
+
+    def write(self, value) -> None:
+        self._check_writable()
+        self._field._write(self._enclosing._handle, value)
 
     property record:
         def __get__(self):
@@ -2642,482 +7949,358 @@ cdef class MDSRecordMemberBase(MDSObject):
 # START INJECTION | tmpl_record_member_primitives(Primitives)
 
 cdef class MDSBoolRecordMember(MDSRecordMemberBase):
-
-    def _field_ref(self) -> MDSRecordFieldReferenceBase:
-        return MDSBoolRecordField()[self]
-
-    def read(self):
-        return self._field_ref().read()
-
-    def write(self, value) -> None:
-        self._field_ref().write(<bool> value);
+    pass
 
 cdef class MDSByteRecordMember(MDSRecordMemberBase):
 
-    def _field_ref(self) -> MDSRecordFieldReferenceBase:
-        return MDSByteRecordField()[self]
-
-    def read(self):
-        return self._field_ref().read()
-
-    def write(self, value) -> None:
-        self._field_ref().write(<int8_t> value);
-
     def __iadd__(self, other):
+        self._check_writable()
         ref = self._field_ref()
         ref += other
+        return self
 
     def __isub__(self, other):
+        self._check_writable()
         ref = self._field_ref()
         ref -= other
+        return self
 
     def __imul__(self, other):
+        self._check_writable()
         ref = self._field_ref()
         ref *= other
+        return self
 
     def __itruediv__(self, other):
+        self._check_writable()
         ref = self._field_ref()
         ref /= other
+        return self
 
 cdef class MDSUByteRecordMember(MDSRecordMemberBase):
 
-    def _field_ref(self) -> MDSRecordFieldReferenceBase:
-        return MDSUByteRecordField()[self]
-
-    def read(self):
-        return self._field_ref().read()
-
-    def write(self, value) -> None:
-        self._field_ref().write(<uint8_t> value);
-
     def __iadd__(self, other):
+        self._check_writable()
         ref = self._field_ref()
         ref += other
+        return self
 
     def __isub__(self, other):
+        self._check_writable()
         ref = self._field_ref()
         ref -= other
+        return self
 
     def __imul__(self, other):
+        self._check_writable()
         ref = self._field_ref()
         ref *= other
+        return self
 
     def __itruediv__(self, other):
+        self._check_writable()
         ref = self._field_ref()
         ref /= other
+        return self
 
 cdef class MDSShortRecordMember(MDSRecordMemberBase):
 
-    def _field_ref(self) -> MDSRecordFieldReferenceBase:
-        return MDSShortRecordField()[self]
-
-    def read(self):
-        return self._field_ref().read()
-
-    def write(self, value) -> None:
-        self._field_ref().write(<int16_t> value);
-
     def __iadd__(self, other):
+        self._check_writable()
         ref = self._field_ref()
         ref += other
+        return self
 
     def __isub__(self, other):
+        self._check_writable()
         ref = self._field_ref()
         ref -= other
+        return self
 
     def __imul__(self, other):
+        self._check_writable()
         ref = self._field_ref()
         ref *= other
+        return self
 
     def __itruediv__(self, other):
+        self._check_writable()
         ref = self._field_ref()
         ref /= other
+        return self
 
 cdef class MDSUShortRecordMember(MDSRecordMemberBase):
 
-    def _field_ref(self) -> MDSRecordFieldReferenceBase:
-        return MDSUShortRecordField()[self]
-
-    def read(self):
-        return self._field_ref().read()
-
-    def write(self, value) -> None:
-        self._field_ref().write(<uint16_t> value);
-
     def __iadd__(self, other):
+        self._check_writable()
         ref = self._field_ref()
         ref += other
+        return self
 
     def __isub__(self, other):
+        self._check_writable()
         ref = self._field_ref()
         ref -= other
+        return self
 
     def __imul__(self, other):
+        self._check_writable()
         ref = self._field_ref()
         ref *= other
+        return self
 
     def __itruediv__(self, other):
+        self._check_writable()
         ref = self._field_ref()
         ref /= other
+        return self
 
 cdef class MDSIntRecordMember(MDSRecordMemberBase):
 
-    def _field_ref(self) -> MDSRecordFieldReferenceBase:
-        return MDSIntRecordField()[self]
-
-    def read(self):
-        return self._field_ref().read()
-
-    def write(self, value) -> None:
-        self._field_ref().write(<int32_t> value);
-
     def __iadd__(self, other):
+        self._check_writable()
         ref = self._field_ref()
         ref += other
+        return self
 
     def __isub__(self, other):
+        self._check_writable()
         ref = self._field_ref()
         ref -= other
+        return self
 
     def __imul__(self, other):
+        self._check_writable()
         ref = self._field_ref()
         ref *= other
+        return self
 
     def __itruediv__(self, other):
+        self._check_writable()
         ref = self._field_ref()
         ref /= other
+        return self
 
 cdef class MDSUIntRecordMember(MDSRecordMemberBase):
 
-    def _field_ref(self) -> MDSRecordFieldReferenceBase:
-        return MDSUIntRecordField()[self]
-
-    def read(self):
-        return self._field_ref().read()
-
-    def write(self, value) -> None:
-        self._field_ref().write(<uint32_t> value);
-
     def __iadd__(self, other):
+        self._check_writable()
         ref = self._field_ref()
         ref += other
+        return self
 
     def __isub__(self, other):
+        self._check_writable()
         ref = self._field_ref()
         ref -= other
+        return self
 
     def __imul__(self, other):
+        self._check_writable()
         ref = self._field_ref()
         ref *= other
+        return self
 
     def __itruediv__(self, other):
+        self._check_writable()
         ref = self._field_ref()
         ref /= other
+        return self
 
 cdef class MDSLongRecordMember(MDSRecordMemberBase):
 
-    def _field_ref(self) -> MDSRecordFieldReferenceBase:
-        return MDSLongRecordField()[self]
-
-    def read(self):
-        return self._field_ref().read()
-
-    def write(self, value) -> None:
-        self._field_ref().write(<int64_t> value);
-
     def __iadd__(self, other):
+        self._check_writable()
         ref = self._field_ref()
         ref += other
+        return self
 
     def __isub__(self, other):
+        self._check_writable()
         ref = self._field_ref()
         ref -= other
+        return self
 
     def __imul__(self, other):
+        self._check_writable()
         ref = self._field_ref()
         ref *= other
+        return self
 
     def __itruediv__(self, other):
+        self._check_writable()
         ref = self._field_ref()
         ref /= other
+        return self
 
 cdef class MDSULongRecordMember(MDSRecordMemberBase):
 
-    def _field_ref(self) -> MDSRecordFieldReferenceBase:
-        return MDSULongRecordField()[self]
-
-    def read(self):
-        return self._field_ref().read()
-
-    def write(self, value) -> None:
-        self._field_ref().write(<uint64_t> value);
-
     def __iadd__(self, other):
+        self._check_writable()
         ref = self._field_ref()
         ref += other
+        return self
 
     def __isub__(self, other):
+        self._check_writable()
         ref = self._field_ref()
         ref -= other
+        return self
 
     def __imul__(self, other):
+        self._check_writable()
         ref = self._field_ref()
         ref *= other
+        return self
 
     def __itruediv__(self, other):
+        self._check_writable()
         ref = self._field_ref()
         ref /= other
+        return self
 
 cdef class MDSFloatRecordMember(MDSRecordMemberBase):
 
-    def _field_ref(self) -> MDSRecordFieldReferenceBase:
-        return MDSFloatRecordField()[self]
-
-    def read(self):
-        return self._field_ref().read()
-
-    def write(self, value) -> None:
-        self._field_ref().write(<float> value);
-
     def __iadd__(self, other):
+        self._check_writable()
         ref = self._field_ref()
         ref += other
+        return self
 
     def __isub__(self, other):
+        self._check_writable()
         ref = self._field_ref()
         ref -= other
+        return self
 
     def __imul__(self, other):
+        self._check_writable()
         ref = self._field_ref()
         ref *= other
+        return self
 
     def __itruediv__(self, other):
+        self._check_writable()
         ref = self._field_ref()
         ref /= other
+        return self
 
 cdef class MDSDoubleRecordMember(MDSRecordMemberBase):
 
-    def _field_ref(self) -> MDSRecordFieldReferenceBase:
-        return MDSDoubleRecordField()[self]
-
-    def read(self):
-        return self._field_ref().read()
-
-    def write(self, value) -> None:
-        self._field_ref().write(<double> value);
-
     def __iadd__(self, other):
+        self._check_writable()
         ref = self._field_ref()
         ref += other
+        return self
 
     def __isub__(self, other):
+        self._check_writable()
         ref = self._field_ref()
         ref -= other
+        return self
 
     def __imul__(self, other):
+        self._check_writable()
         ref = self._field_ref()
         ref *= other
+        return self
 
     def __itruediv__(self, other):
+        self._check_writable()
         ref = self._field_ref()
         ref /= other
-# END INJECTION
-
-# START INJECTION | tmpl_record_member_arrays(Arrays)
-
-cdef class MDSBoolArrayRecordMember(MDSRecordMemberBase):
-
-    def _field_ref(self) -> MDSRecordFieldReferenceBase:
-        return MDSBoolArrayRecordField()[self]
-
-    def read(self):
-        return self._field_ref().read()
-
-    def peek(self):
-        return self._field_ref().peek()
-
-    def write(self, value) -> None:
-        self._field_ref().write(value);
-
-cdef class MDSByteArrayRecordMember(MDSRecordMemberBase):
-
-    def _field_ref(self) -> MDSRecordFieldReferenceBase:
-        return MDSByteArrayRecordField()[self]
-
-    def read(self):
-        return self._field_ref().read()
-
-    def peek(self):
-        return self._field_ref().peek()
-
-    def write(self, value) -> None:
-        self._field_ref().write(value);
-
-cdef class MDSUByteArrayRecordMember(MDSRecordMemberBase):
-
-    def _field_ref(self) -> MDSRecordFieldReferenceBase:
-        return MDSUByteArrayRecordField()[self]
-
-    def read(self):
-        return self._field_ref().read()
-
-    def peek(self):
-        return self._field_ref().peek()
-
-    def write(self, value) -> None:
-        self._field_ref().write(value);
-
-cdef class MDSShortArrayRecordMember(MDSRecordMemberBase):
-
-    def _field_ref(self) -> MDSRecordFieldReferenceBase:
-        return MDSShortArrayRecordField()[self]
-
-    def read(self):
-        return self._field_ref().read()
-
-    def peek(self):
-        return self._field_ref().peek()
-
-    def write(self, value) -> None:
-        self._field_ref().write(value);
-
-cdef class MDSUShortArrayRecordMember(MDSRecordMemberBase):
-
-    def _field_ref(self) -> MDSRecordFieldReferenceBase:
-        return MDSUShortArrayRecordField()[self]
-
-    def read(self):
-        return self._field_ref().read()
-
-    def peek(self):
-        return self._field_ref().peek()
-
-    def write(self, value) -> None:
-        self._field_ref().write(value);
-
-cdef class MDSIntArrayRecordMember(MDSRecordMemberBase):
-
-    def _field_ref(self) -> MDSRecordFieldReferenceBase:
-        return MDSIntArrayRecordField()[self]
-
-    def read(self):
-        return self._field_ref().read()
-
-    def peek(self):
-        return self._field_ref().peek()
-
-    def write(self, value) -> None:
-        self._field_ref().write(value);
-
-cdef class MDSUIntArrayRecordMember(MDSRecordMemberBase):
-
-    def _field_ref(self) -> MDSRecordFieldReferenceBase:
-        return MDSUIntArrayRecordField()[self]
-
-    def read(self):
-        return self._field_ref().read()
-
-    def peek(self):
-        return self._field_ref().peek()
-
-    def write(self, value) -> None:
-        self._field_ref().write(value);
-
-cdef class MDSLongArrayRecordMember(MDSRecordMemberBase):
-
-    def _field_ref(self) -> MDSRecordFieldReferenceBase:
-        return MDSLongArrayRecordField()[self]
-
-    def read(self):
-        return self._field_ref().read()
-
-    def peek(self):
-        return self._field_ref().peek()
-
-    def write(self, value) -> None:
-        self._field_ref().write(value);
-
-cdef class MDSULongArrayRecordMember(MDSRecordMemberBase):
-
-    def _field_ref(self) -> MDSRecordFieldReferenceBase:
-        return MDSULongArrayRecordField()[self]
-
-    def read(self):
-        return self._field_ref().read()
-
-    def peek(self):
-        return self._field_ref().peek()
-
-    def write(self, value) -> None:
-        self._field_ref().write(value);
-
-cdef class MDSFloatArrayRecordMember(MDSRecordMemberBase):
-
-    def _field_ref(self) -> MDSRecordFieldReferenceBase:
-        return MDSFloatArrayRecordField()[self]
-
-    def read(self):
-        return self._field_ref().read()
-
-    def peek(self):
-        return self._field_ref().peek()
-
-    def write(self, value) -> None:
-        self._field_ref().write(value);
-
-cdef class MDSDoubleArrayRecordMember(MDSRecordMemberBase):
+        return self
+# END INJECTION
 
-    def _field_ref(self) -> MDSRecordFieldReferenceBase:
-        return MDSDoubleArrayRecordField()[self]
+# START INJECTION | tmpl_record_member_arrays(Arrays)
 
-    def read(self):
-        return self._field_ref().read()
+cdef class MDSBoolArrayRecordMember(MDSRecordMemberBase):
+    pass
 
-    def peek(self):
-        return self._field_ref().peek()
+cdef class MDSByteArrayRecordMember(MDSRecordMemberBase):
+    pass
 
-    def write(self, value) -> None:
-        self._field_ref().write(value);
+cdef class MDSUByteArrayRecordMember(MDSRecordMemberBase):
+    pass
 
-cdef class MDSStringArrayRecordMember(MDSRecordMemberBase):
+cdef class MDSShortArrayRecordMember(MDSRecordMemberBase):
+    pass
 
-    def _field_ref(self) -> MDSRecordFieldReferenceBase:
-        return MDSStringArrayRecordField()[self]
+cdef class MDSUShortArrayRecordMember(MDSRecordMemberBase):
+    pass
 
-    def read(self):
-        return self._field_ref().read()
+cdef class MDSIntArrayRecordMember(MDSRecordMemberBase):
+    pass
 
-    def peek(self):
-        return self._field_ref().peek()
+cdef class MDSUIntArrayRecordMember(MDSRecordMemberBase):
+    pass
 
-    def write(self, value) -> None:
-        self._field_ref().write(value);
+cdef class MDSLongArrayRecordMember(MDSRecordMemberBase):
+    pass
 
-cdef class MDSRecordArrayRecordMember(MDSRecordMemberBase):
+cdef class MDSULongArrayRecordMember(MDSRecordMemberBase):
+    pass
 
-    def _field_ref(self) -> MDSRecordFieldReferenceBase:
-        return MDSRecordArrayRecordField()[self]
+cdef class MDSFloatArrayRecordMember(MDSRecordMemberBase):
+    pass
 
-    def read(self):
-        return self._field_ref().read()
+cdef class MDSDoubleArrayRecordMember(MDSRecordMemberBase):
+    pass
 
-    def peek(self):
-        return self._field_ref().peek()
+cdef class MDSStringArrayRecordMember(MDSRecordMemberBase):
+    pass
 
-    def write(self, value) -> None:
-        self._field_ref().write(value);
+cdef class MDSRecordArrayRecordMember(MDSRecordMemberBase):
+    pass
 # END INJECTION
 
-######################################################### RECORD TYPE DECLARATIONS
+cdef class MDSStringRecordMember(MDSRecordMemberBase):
+    pass
 
-class MDSRecordFieldDeclaration(object):
-    """
-    This could probably be avoided, but it's copying CAPI
-    """
+cdef class MDSRecordRecordMember(MDSRecordMemberBase):
+
+    def __getattr__(self, name):
+        # Lets record.other.field follow the reference to the record held
+        record = self.read()
+
+        if record is None:
+            raise AttributeError(f"Can't get `{name}`, the record field is empty")
+
+        return getattr(record, name)
+
+# Which RecordField and RecordMember implement each `mds.typing` entry
+cdef dict __RECORD_FIELD_TYPES = {
+    # START INJECTION | tmpl_record_field_registry(Primitives,Composites,Arrays)
+    mds.typing.primitives.bool: (MDSBoolRecordField, MDSBoolRecordMember),
+    mds.typing.primitives.byte: (MDSByteRecordField, MDSByteRecordMember),
+    mds.typing.primitives.ubyte: (MDSUByteRecordField, MDSUByteRecordMember),
+    mds.typing.primitives.short: (MDSShortRecordField, MDSShortRecordMember),
+    mds.typing.primitives.ushort: (MDSUShortRecordField, MDSUShortRecordMember),
+    mds.typing.primitives.int: (MDSIntRecordField, MDSIntRecordMember),
+    mds.typing.primitives.uint: (MDSUIntRecordField, MDSUIntRecordMember),
+    mds.typing.primitives.long: (MDSLongRecordField, MDSLongRecordMember),
+    mds.typing.primitives.ulong: (MDSULongRecordField, MDSULongRecordMember),
+    mds.typing.primitives.float: (MDSFloatRecordField, MDSFloatRecordMember),
+    mds.typing.primitives.double: (MDSDoubleRecordField, MDSDoubleRecordMember),
+    mds.typing.composites.string: (MDSStringRecordField, MDSStringRecordMember),
+    mds.typing.composites.record: (MDSRecordRecordField, MDSRecordRecordMember),
+    mds.typing.arrays.bool: (MDSBoolArrayRecordField, MDSBoolArrayRecordMember),
+    mds.typing.arrays.byte: (MDSByteArrayRecordField, MDSByteArrayRecordMember),
+    mds.typing.arrays.ubyte: (MDSUByteArrayRecordField, MDSUByteArrayRecordMember),
+    mds.typing.arrays.short: (MDSShortArrayRecordField, MDSShortArrayRecordMember),
+    mds.typing.arrays.ushort: (MDSUShortArrayRecordField, MDSUShortArrayRecordMember),
+    mds.typing.arrays.int: (MDSIntArrayRecordField, MDSIntArrayRecordMember),
+    mds.typing.arrays.uint: (MDSUIntArrayRecordField, MDSUIntArrayRecordMember),
+    mds.typing.arrays.long: (MDSLongArrayRecordField, MDSLongArrayRecordMember),
+    mds.typing.arrays.ulong: (MDSULongArrayRecordField, MDSULongArrayRecordMember),
+    mds.typing.arrays.float: (MDSFloatArrayRecordField, MDSFloatArrayRecordMember),
+    mds.typing.arrays.double: (MDSDoubleArrayRecordField, MDSDoubleArrayRecordMember),
+    mds.typing.arrays.string: (MDSStringArrayRecordField, MDSStringArrayRecordMember),
+    mds.typing.arrays.record: (MDSRecordArrayRecordField, MDSRecordArrayRecordMember),
+    # END INJECTION
+}
 
-    def __init__(self, name: String, field: MDSRecordFieldBase):
-        self.name = name
-        self.field = field
+######################################################### RECORD TYPE DECLARATIONS
 
 
 cdef class MDSRecordHandleWrapper(object):
@@ -3148,13 +8331,14 @@ cdef MDSRecordHandleWrapper __declare_mds_record(h_istring_t ish, MDSRecordHandl
 
 cdef class MDSRecordTypeDeclaration(object):
     cdef:
-        list                _field_decls
-        dict                _field_member_pairs
+        MDSRecordFieldTable _fields
         h_record_type_t     _declared_type
         h_record_type_t     _created_type
         type                _cls
+        # Set once the type exists in MDS; ensure_created() hands this out
+        MDSRecordHandleWrapper _created
 
-    def __cinit__(self, cls: type, field_member_pairs: Dict[Text, MDSRecordFieldMemberPair]):
+    def __cinit__(self, cls: type, MDSRecordFieldTable fields not None):
         cdef MDSRecordHandleWrapper wrapper = self.declare(
             String(__RECORD_IDENTS[cls.__name__]),
             cls.__bases__[0]
@@ -3162,12 +8346,11 @@ cdef class MDSRecordTypeDeclaration(object):
 
         self._declared_type = h_record_type_t(wrapper._handle)
         self._cls = cls
-        self._field_decls = list()
-        self._field_member_pairs = field_member_pairs
-        self.note_fields(field_member_pairs)
+        self._fields = fields
 
-    def get_field_member_pairs(self) -> dict:
-        return self._field_member_pairs
+    property fields:
+        def __get__(self):
+            return self._fields
 
     @staticmethod
     def declare(name: String, parent: type) -> MDSRecordHandleWrapper:
@@ -3191,89 +8374,225 @@ cdef class MDSRecordTypeDeclaration(object):
         print(f" > Passed subclass assertion")
         # As soon as `s` came into scope, it should have registered its type,
         # so this is unnecessary, but left in for posterity.
-        sp = parent.type_decl.ensure_created()  # MDSRecordHandleWrapper
+        sp = Record_TypeDecl(parent).ensure_created()  # MDSRecordHandleWrapper
         print(f" > Ensure created run OK on parent, returned {sp}")
         return __declare_mds_record(ish, sp)
 
-    def note_fields(self, fields: Dict[Text, MDSRecordFieldMemberPair]) -> None:
-        for label, field_member_pair in fields.items():
-            self._field_decls.append(
-                MDSRecordFieldDeclaration(
-                    String(label),  # We want to grab the h_istring_t later
-                    field_member_pair.field
-                )
-            )
-
     def declare_fields(self) -> None:
-        for fd in self._field_decls:
-            fd.field.declare(fd.name, self)
+        for field, name in zip(self._fields._fields, self._fields._names):
+            field.declare(name, self)
 
     def ensure_field_types(self) -> None:
-        for fd in self._field_decls:
-            fd.field.ensure_type()
+        for field in self._fields._fields:
+            field.ensure_type()
 
-    def ensure_created(self) -> MDSRecordHandleWrapper:
+    cpdef MDSRecordHandleWrapper ensure_created(self):
+        # Once created, this is just a pointer check; the handle is immutable
+        # from then on, so it is safe to share between threads
+        if self._created is not None:
+            return self._created
+
+        with __RECORD_DECLARATION_MUTEX:
+            # Ensure no one else has beat us to the punch (call_once)
+            if self._created is None:
+                self._created = self._create()
+
+        return self._created
+
+    cdef MDSRecordHandleWrapper _create(self):
+        cdef MDSRecordTypeDeclaration existing
         ident = __RECORD_IDENTS[self._cls.__name__]
 
-        if not ident in __RECORD_DECLARED_TYPES:
-            with __RECORD_DECLARATION_MUTEX:
-                # Ensure no one else has beat us to the punch (call_once)
-                if not ident in __RECORD_DECLARED_TYPES:
-                    self.declare_fields()
-                    self._created_type = h_record_type_t(self._declared_type.ensure_created())
-                    self.ensure_field_types()
-                    __RECORD_DECLARED_TYPES[ident] = self
+        if ident in __RECORD_DECLARED_TYPES:
+            existing = __RECORD_DECLARED_TYPES[ident]
+            # Created under this lock, so its handle is already set
+            return existing._created
 
-        return emplace_const_handle_from_decl(__RECORD_DECLARED_TYPES[ident])
+        self.declare_fields()
+        self._created_type = h_record_type_t(self._declared_type.ensure_created())
+        self.ensure_field_types()
+        __RECORD_DECLARED_TYPES[ident] = self
+
+        return emplace_const_handle_from_decl(self)
 
 # =========================================================================
 #  Strings
 # =========================================================================
 
+# Passed through __new__ to get a String that is filled in by the caller
+cdef object __STRING_ADOPT = object()
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "size", "capacity"])
+
+
+cdef class MDSLRUCache(object):
+    """
+    A bounded, least-recently-used map from text to an immutable object made
+    from it, for the names, paths and field labels that repeat a lot.
+    Subclasses say how to make an entry. Safe to share between threads; a
+    capacity of 0 disables it.
+    """
+    cdef:
+        object _entries  # OrderedDict, oldest first
+        object _lock
+        size_t _capacity
+        size_t _hits
+        size_t _misses
+
+    def __cinit__(self, size_t capacity=4096):
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._capacity = capacity
+
+    cdef object get(self, key):
+        with self._lock:
+            retval = self._entries.get(key)
+
+            if retval is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return retval
+
+            self._misses += 1
+
+        # Made outside the lock; if two threads race, both make the same thing
+        retval = self._make(key)
+
+        with self._lock:
+            if self._capacity:
+                self._entries[key] = retval
+                self._evict()
+
+        return retval
+
+    cdef object _make(self, key):
+        raise NotImplementedError('Specialization of MDSLRUCache required')
+
+    cdef _evict(self):
+        while len(self._entries) > self._capacity:
+            self._entries.popitem(last=False)
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, len(self._entries), self._capacity)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = 0
+
+    property capacity:
+        def __get__(self):
+            return self._capacity
+
+        def __set__(self, size_t capacity):
+            with self._lock:
+                self._capacity = capacity
+                self._evict()
+
+
+cdef class MDSStringCache(MDSLRUCache):
+    """
+    Maps str (or bytes) to a String holding the interned core string, so
+    Strings made from the same value again skip encoding and interning
+    """
+
+    cdef object _make(self, value):
+        cdef String retval = String.__new__(String, __STRING_ADOPT)
+
+        retval._ish = convert_py_to_ish(value)
+        retval._handle = h_mstring_t(retval._ish)
+
+        if type(value) is str:
+            retval._decoded = value
+
+        return retval
+
+cdef MDSStringCache __STRING_CACHE = MDSStringCache()
+string_cache = __STRING_CACHE
+
+
 cdef class String(MDSIndexedObject):
     """
     This class provides the functionality expected from the native str type,
     but backed by MDS. As with str, Strings are immutable.
+
+    Strings made from str or bytes go through `string_cache`. Being
+    immutable, the decoded str and the length are kept once worked out.
     """
     cdef:
         h_mstring_t _handle
         h_istring_t _ish
+        str         _decoded  # None until first needed
+        Py_ssize_t  _length   # -1 until first needed
 
     def __cinit__(self, value=""):
-        self._ish = convert_py_to_ish(value) 
-        self._handle = h_mstring_t(self._ish)
-        self.__iter_idx = 0
+        cdef String cached
+
+        self._length = -1
+
+        if value is __STRING_ADOPT:
+            return  # The caller brings the handles, see String_Adopt
+
+        if type(value) is str or type(value) is bytes:
+            cached = <String> __STRING_CACHE.get(value)
+            self._ish = cached._ish
+            self._handle = cached._handle
+            self._decoded = cached._decoded
+        else:
+            self._ish = convert_py_to_ish(value)
+            self._handle = h_mstring_t(self._ish)
+
+        if type(value) is str:
+            self._decoded = value
 
     def __len__(self):
-        return self._handle.length()
+        if self._length < 0:
+            self._length = self._handle.length()
+
+        return self._length
+
+    cdef str _str(self):
+        cdef:
+            string utf8
+            const char* data
+            size_t i, n
+
+        if self._decoded is not None:
+            return self._decoded
+
+        utf8 = self._handle.utf8()
+        data, n = utf8.c_str(), utf8.size()
+
+        for i in range(n):
+            if <unsigned char> data[i] >= 0x80:
+                self._decoded = PyUnicode_DecodeUTF8(data, n, NULL)
+                break
+        else:
+            # Pure ASCII is the same bytes in Latin-1, which is a plain copy
+            self._decoded = PyUnicode_DecodeLatin1(data, n, NULL)
+
+        return self._decoded
 
     def __hash__(self):
-        return self._handle.hash1()
+        # Equal to a str means the same hash as it, so they mix in sets and dicts
+        return hash(self._str())
 
     def __str__(self):
-        return <str> self._handle.utf8().decode("utf-8")
+        return self._str()
 
     def __repr__(self):
-        return "'{}'".format(str(self))
+        return "'{}'".format(self._str())
 
     def __getitem__(self, item):
-        cdef:
-            string s
-            int i
-            char_t c
+        cdef char_t c
 
         if isinstance(item, int):
             c = self._handle.at(item)
             u = chr(c)
             return u
         elif isinstance(item, slice):
-            # TODO: Check this
-            s.reserve((item.stop - item.start) // item.step)
-
-            for i in range(start=item.start, stop=item.stop, step=item.step):
-                s.push_back(self._handle.at(i))
-
-            return String(s)
+            return MDSIndexedView(self, item)
 
         raise TypeError(
             "list indices must be integers or slices, not {}".format(
@@ -3281,50 +8600,51 @@ cdef class String(MDSIndexedObject):
             )
         )
 
-    def __add__(self, other):
-        """
-        Concatenates this string with another, returns this as a new String
-        """
-        # TODO: Could probably open this to [str, bytes] too.
-        cdef:
-            string s
-            str c
+    def _materialize(self, MDSIndexedView view):
+        # Decoded once and sliced natively, rather than read char by char
+        stop = view.stop
+
+        if stop < 0:
+            stop = None  # A reversed range running to the start
 
-        if isinstance(other, String):       
-            s.reserve(<size_t> (len(self) + len(other)))
+        return String_FromUTF8(self._str()[view.start:stop:view.step].encode("utf-8"))
 
-            # Chain the iterators to avoid any string copying
-            for c in chain(iter(self), iter(other)):
-                s.push_back(ord(c))  # Need as an int for char
+    def __add__(a, b):
+        """
+        Concatenates Strings and/or strs, returning a new String; the UTF-8
+        of each side is read once and joined in a single buffer
+        """
+        cdef string s
 
-            return String(s)
+        if not (isinstance(a, (String, str)) and isinstance(b, (String, str))):
+            return NotImplemented
 
-        raise TypeError("must be String")
+        s = __utf8_of(a)
+        s.append(__utf8_of(b))
+        return String_FromUTF8(s)
 
-    def __mul__(self, other):
+    def __mul__(a, b):
         """
-        Internal method to perform String multiplication without overhead
+        Repeats a String, in either operand order, into a single buffer
         """
         cdef:
-            string s
-            str c
-            int it, l = len(self)
+            string unit, s
+            Py_ssize_t i, n
 
-        if isinstance(other, int):
-            s.reserve(l * other)
-
-            for it in range(other):
-                for c in self:
-                    s.push_back(ord(c))
+        if isinstance(a, String) and isinstance(b, int):
+            unit, n = (<String> a)._handle.utf8(), b
+        elif isinstance(b, String) and isinstance(a, int):
+            unit, n = (<String> b)._handle.utf8(), a
+        else:
+            return NotImplemented
 
-            return String(<unicode> s.decode("utf-8"))
+        if n > 0:
+            s.reserve(unit.size() * n)
 
-        raise TypeError(
-            "can't multiply sequence by non-int of type 'String'"
-        )
+            for i in range(n):
+                s.append(unit)
 
-    def __rmul__(self, other):
-        pass
+        return String_FromUTF8(s)
 
     def __mod__(self, other):
         pass
@@ -3332,19 +8652,33 @@ cdef class String(MDSIndexedObject):
     def __rmod__(self, other):
         pass
 
-    # def __richcmp__(a, b, op):
-    #     if op == 0:    # <
-    #         return a._handle < b._handle
-    #     elif op == 1:  # <=
-    #         return a._handle <= b._handle
-    #     elif op == 2:  # ==
-    #         return a._handle == b._handle
-    #     elif op == 3:  # !=
-    #         return a._handle != b._handle
-    #     elif op == 4:  # >
-    #         return a._handle > b._handle
-    #     elif op == 5:  # >=
-    #         return a._handle >= b._handle
+    def __richcmp__(String self, other, int op):
+        """
+        Strings compare natively on the core handles; against a str, the
+        cached decoding is compared, so no temporary String is made
+        """
+        cdef String o
+
+        if isinstance(other, String):
+            o = other
+
+            if op == Py_EQ:
+                return self._handle == o._handle
+            elif op == Py_NE:
+                return self._handle != o._handle
+            elif op == Py_LT:
+                return self._handle < o._handle
+            elif op == Py_LE:
+                return self._handle <= o._handle
+            elif op == Py_GT:
+                return self._handle > o._handle
+            else:
+                return self._handle >= o._handle
+
+        if isinstance(other, str):
+            return PyObject_RichCompare(self._str(), other, op)
+
+        return NotImplemented
 
     def __sizeof__(self):
         return self._handle.size()
@@ -3352,129 +8686,148 @@ cdef class String(MDSIndexedObject):
     # TODO: Write equivalents that use the MDS-stored data
 
     def capitalize(self):
-        return String(str(self).capitalize())
+        return String(self._str().capitalize())
 
     def casefold(self):
-        return String(str(self).casefold())
+        return String(self._str().casefold())
 
     def center(self, *args, **kwargs):
-        return String(str(self).center(*args, **kwargs))
+        return String(self._str().center(*args, **kwargs))
 
     # TODO: encode(encoding="utf-8", errors="strict")
 
     def endswith(self, *args, **kwargs):
-        return str(self).endswith(*args, **kwargs)
+        return self._str().endswith(*args, **kwargs)
 
     def expandtabs(self, *args, **kwargs):
-        return String(str(self).expandtabs(*args, **kwargs))
+        return String(self._str().expandtabs(*args, **kwargs))
 
     def find(self, *args, **kwargs):
-        return str(self).find(*args, **kwargs)
+        return self._str().find(*args, **kwargs)
 
     def format(self, *args, **kwargs):
-        return String(str(self).format(*args, **kwargs))
+        return String(self._str().format(*args, **kwargs))
 
     def format_map(self, *args, **kwargs):
-        return String(str(self).format_map(*args, **kwargs))
+        return String(self._str().format_map(*args, **kwargs))
 
     def index(self, *args, **kwargs):
-        return str(self).index(*args, **kwargs)
+        return self._str().index(*args, **kwargs)
 
     def isalnum(self, *args, **kwargs):
-        return str(self).isalnum(*args, **kwargs)
+        return self._str().isalnum(*args, **kwargs)
 
     def isalpha(self, *args, **kwargs):
-        return str(self).isalpha(*args, **kwargs)
+        return self._str().isalpha(*args, **kwargs)
 
     def isdecimal(self, *args, **kwargs):
-        return str(self).isdecimal(*args, **kwargs)
+        return self._str().isdecimal(*args, **kwargs)
 
     def isdigit(self, *args, **kwargs):
-        return str(self).isdigit(*args, **kwargs)
+        return self._str().isdigit(*args, **kwargs)
     
     def isidentifier(self, *args, **kwargs):
-        return str(self).isidentifier(*args, **kwargs)
+        return self._str().isidentifier(*args, **kwargs)
     
     def islower(self, *args, **kwargs):
-        return str(self).islower(*args, **kwargs)
+        return self._str().islower(*args, **kwargs)
 
     def isnumeric(self, *args, **kwargs):
-        return str(self).isnumeric(*args, **kwargs)
+        return self._str().isnumeric(*args, **kwargs)
 
     def isprintable(self, *args, **kwargs):
-        return str(self).isprintable(*args, **kwargs)
+        return self._str().isprintable(*args, **kwargs)
 
     def isspace(self, *args, **kwargs):
-        return str(self).isspace(*args, **kwargs)
+        return self._str().isspace(*args, **kwargs)
 
     def istitle(self, *args, **kwargs):
-        return str(self).istitle(*args, **kwargs)
+        return self._str().istitle(*args, **kwargs)
 
     def isupper(self, *args, **kwargs):
-        return str(self).isupper(*args, **kwargs)
+        return self._str().isupper(*args, **kwargs)
 
     def join(self, *args, **kwargs):
-        return String(str(self).join(*args, **kwargs))
+        return String(self._str().join(*args, **kwargs))
 
     def ljust(self, *args, **kwargs):
-        return String(str(self).ljust(*args, **kwargs))
+        return String(self._str().ljust(*args, **kwargs))
 
     def lower(self, *args, **kwargs):
-        return String(str(self).lower(*args, **kwargs))
+        return String(self._str().lower(*args, **kwargs))
 
     def lstrip(self, *args, **kwargs):
-        return String(str(self).lstrip(*args, **kwargs))
+        return String(self._str().lstrip(*args, **kwargs))
 
     def partition(self, *args, **kwargs):
-        return tuple([String(x) for x in str(self).partition(*args, **kwargs)])
+        return tuple([String(x) for x in self._str().partition(*args, **kwargs)])
 
     def replace(self, *args, **kwargs):
-        return String(str(self).replace(*args, **kwargs))
+        return String(self._str().replace(*args, **kwargs))
 
     def rfind(self, *args, **kwargs):
-        return str(self).rfind(*args, **kwargs)
+        return self._str().rfind(*args, **kwargs)
 
     def rindex(self, *args, **kwargs):
-        return str(self).rindex(*args, **kwargs)
+        return self._str().rindex(*args, **kwargs)
 
     def rjust(self, *args, **kwargs):
-        return String(str(self).rjust(*args, **kwargs))
+        return String(self._str().rjust(*args, **kwargs))
 
     def rpartition(self, *args, **kwargs):
-        return tuple([String(x) for x in str(self).rpartition(*args, **kwargs)])
+        return tuple([String(x) for x in self._str().rpartition(*args, **kwargs)])
 
     def rsplit(self, *args, **kwargs):
-        return [String(x) for x in str(self).rsplit(*args, **kwargs)]
+        return [String(x) for x in self._str().rsplit(*args, **kwargs)]
 
     def rstrip(self, *args, **kwargs):
-        return String(str(self).rstrip(*args, **kwargs))
+        return String(self._str().rstrip(*args, **kwargs))
 
     def split(self, *args, **kwargs):
-        return [String(x) for x in str(self).split(*args, **kwargs)]
+        return [String(x) for x in self._str().split(*args, **kwargs)]
 
     def splitlines(self, *args, **kwargs):
-        return [String(x) for x in str(self).split(*args, **kwargs)]
+        return [String(x) for x in self._str().split(*args, **kwargs)]
 
     def startswith(self, *args, **kwargs):
-        return str(self).startswith(*args, **kwargs)
+        return self._str().startswith(*args, **kwargs)
 
     def strip(self, *args, **kwargs):
-        return String(str(self).strip(*args, **kwargs))
+        return String(self._str().strip(*args, **kwargs))
     
     def swapcase(self, *args, **kwargs):
-        return String(str(self).swapcase(*args, **kwargs))
+        return String(self._str().swapcase(*args, **kwargs))
 
     def title(self, *args, **kwargs):
-        return String(str(self).title(*args, **kwargs))
+        return String(self._str().title(*args, **kwargs))
 
     # TODO: translate
 
     def upper(self, *args, **kwargs):
-        return String(str(self).upper(*args, **kwargs))
+        return String(self._str().upper(*args, **kwargs))
 
     def zfill(self, *args, **kwargs):
-        return String(str(self).zfill(*args, **kwargs))
+        return String(self._str().zfill(*args, **kwargs))
+
+
+cdef String String_FromUTF8(const string& value):
+    # Results of String operations are rarely made again, so bypass the cache
+    cdef String retval = String.__new__(String, __STRING_ADOPT)
+    retval._ish = intern(value)
+    retval._handle = h_mstring_t(retval._ish)
+    return retval
+
+cdef string __utf8_of(value) except *:
+    if isinstance(value, String):
+        return (<String> value)._handle.utf8()
 
+    return (<str> value).encode("utf-8")
+
+cdef String String_Adopt(h_mstring_t handle):
+    cdef String retval = String.__new__(String, __STRING_ADOPT)
+    retval._handle = handle
+    retval._ish = intern(handle.utf8())
+    return retval
 
 cdef inline h_istring_t __extract_ish(String s):
     cdef h_istring_t retval = s._ish
@@ -3513,6 +8866,24 @@ class IllegalPathException(Exception):
         super().__init__(*args, **kwargs)
 
 
+# Strings are immutable, so the special path components can be shared
+cdef String __SELF_CPT = String(".")
+cdef String __UP_CPT = String("..")
+
+
+cdef class MDSPathCache(MDSLRUCache):
+    """
+    Maps path text (str or String, which hash alike) to the parsed Path,
+    whose components are Strings already holding their interned names
+    """
+
+    cdef object _make(self, text):
+        return Path(impl=Impl(text))
+
+cdef MDSPathCache __PATH_CACHE = MDSPathCache(1024)
+path_cache = __PATH_CACHE
+
+
 cdef class Path(object):
     cdef:
         Impl _ptr
@@ -3531,12 +8902,20 @@ cdef class Path(object):
 
     @staticmethod
     def of(cpts: List[Path]) -> Path:
+        # Paths never change once made, so parsed text can be shared
+        if isinstance(cpts, (str, String)):
+            return __PATH_CACHE.get(cpts)
+
         return Path(impl=Impl(cpts))
 
     property is_absolute:
         def __get__(self):
             return self._ptr.is_absolute
 
+    property names:
+        def __get__(self):
+            return tuple(self._ptr._names)
+
 
 cdef class Impl(object):
     cdef:
@@ -3544,29 +8923,31 @@ cdef class Impl(object):
         size_t  _initial_ups
         list    _names
 
-    def __cinit__(self, cpts: List[Path]):
+    def __cinit__(self, cpts: List[Path]=None):
         self._absolutep = False
         self._initial_ups = 0
         self._names = list()
 
         if isinstance(cpts, list):
             self.extend(cpts)
-        else:
+        elif cpts is not None:
             self.append_cpt(cpts)
 
     def __str__(self):
         delim = __NAMESPACE_SEPARATOR
         compiled = delim if self.absolutep else ""
-        compiled += "..{delim}" * self.initial_ups
-        compiled += "{delim}".join(self.names)
+        compiled += f"..{delim}" * self.initial_ups
+        compiled += delim.join([str(name) for name in self.names])
         return compiled
 
     def up_levels(self, size_t levels) -> None:
-        current = len(self._names)
+        cdef size_t current = len(self._names)
 
         if not self.is_absolute and (levels > current):
             self._initial_ups += levels - current
 
+        del self._names[current - min(levels, current):]
+
     def reset_to_root(self) -> None:
         self._names = list()
         self._initial_ups = 0
@@ -3574,16 +8955,16 @@ cdef class Impl(object):
 
     @staticmethod
     def self_cpt() -> String:
-        return String(".")
+        return __SELF_CPT
 
     @staticmethod
     def up_cpt() -> String:
-        return String("..")
+        return __UP_CPT
 
     def append(self, cpt: String) -> None:
-        if cpt == self.self_cpt():
+        if cpt == __SELF_CPT:
             return
-        elif cpt == self.up_cpt():
+        elif cpt == __UP_CPT:
             self.up_levels(1)
         else:
             self._names.append(cpt)
@@ -3621,21 +9002,20 @@ cdef class Impl(object):
                     self.up_levels(ups)
 
             self._names.extend(impl._names.copy())
-        else:  # TODO: Change this when String supports .split() and __contains__
+        else:
             delim = __NAMESPACE_SEPARATOR
             s = str(cpt)
 
-            if delim in s:
-                self.append(cpt)
+            if delim not in s:
+                self.append(__cast_to_mds_string(cpt))
                 return
 
             if s.startswith(delim):
                 self.reset_to_root()
 
-            parts = [String(x) for x in s.split(delim)]
-
-            for name in parts:
-                self.append(name)
+            for name in s.split(delim):
+                if name:  # Doubled or trailing separators name nothing
+                    self.append(String(name))
 
     property is_absolute:
         def __get__(self):
@@ -3655,10 +9035,17 @@ cdef class Impl(object):
 
 
 cdef class Namespace(MDSObject):
+    """
+    Child namespaces are kept once resolved, so walking the same path again
+    reuses the wrappers without calling into the core. Binding a name through
+    this module drops its entry; invalidate() does so for changes made
+    elsewhere.
+    """
     cdef:
         h_namespace_t   _handle
         Namespace       _parent
         String          _name
+        dict            _children  # String -> Namespace
 
     def __cinit__(self, Namespace parent, name):
         cdef:
@@ -3666,6 +9053,7 @@ cdef class Namespace(MDSObject):
 
         self._parent = parent
         self._name = definite
+        self._children = dict()
 
     def __setitem__(self, path: PathTypes, value: MDSObject):
         binding = self[path]
@@ -3713,11 +9101,116 @@ cdef class Namespace(MDSObject):
             n -= 1
 
         for i in range(n):
-            nb = MDSNameBinding(iptr, names[i])
-            iptr = nb.as_namespace()
+            iptr = iptr._child(names[i])
 
         return iptr
 
+    cdef Namespace _child(self, String name):
+        cdef:
+            Namespace retval = self._children.get(name)
+            h_namespace_t handle
+
+        if retval is None:
+            handle = self._handle.child_namespace(name._ish, True)
+            retval = Namespace_Init(handle=handle, parent=self, name=name)
+            self._children[name] = retval
+
+        return retval
+
+    cdef _forget_child(self, String name):
+        self._children.pop(name, None)
+
+    def invalidate(self, name: Union[str, String]=None) -> None:
+        """
+        Drops the cached child namespace for `name`, or all of them, for
+        when names are unbound or rebound behind this process's back
+        """
+        if name is None:
+            self._children.clear()
+        else:
+            self._children.pop(name, None)
+
+    def bind_many(self, bindings, dtype: MDSTypeInfo=None, context=None) -> None:
+        """
+        Binds each `path: value` pair in `bindings` (a mapping, or an iterable
+        of pairs). The paths are resolved up front and grouped by parent and
+        type, so each group is bound by a single typed binding in one native
+        loop. Without a `dtype`, it's taken from each value. Given a
+        `context`, the whole batch is bound inside that isolation context,
+        so it becomes visible at once when the context is published.
+
+        Every value is converted and checked before anything is bound, so a
+        bad value, or one of a type that can't be bound in bulk, raises
+        without binding any of the batch.
+        """
+        cdef:
+            dict groups = dict()
+            Namespace parent
+            String name
+
+        pairs = bindings.items() if hasattr(bindings, "items") else bindings
+
+        for path, value in pairs:
+            t = dtype if dtype is not None else __binding_dtype(value)
+
+            if t is None:
+                raise TypeError(f"Can't tell what to bind `{path}` as, pass a dtype")
+
+            parent, name = self._locate(path)
+            group = groups.get((parent, t))
+
+            if group is None:
+                group = groups[(parent, t)] = ([], [])
+
+            group[0].append(name)
+            group[1].append(value)
+
+        # Every group is checked before any of them is bound
+        prepared = __prepare_groups(groups)
+        __call_in_context(context, lambda: __bind_groups(prepared))
+
+    def lookup_many(self, paths: Iterable[PathTypes], dtype: MDSTypeInfo, context=None) -> list:
+        """
+        Looks up every path as `dtype`, returning the values in the same
+        order, with None for unbound names. Given a `context` (e.g. a
+        snapshot), all of the lookups are made inside it.
+        """
+        cdef:
+            dict groups = dict()
+            list retval
+            Namespace parent
+            String name
+            Py_ssize_t i = 0
+
+        for path in paths:
+            parent, name = self._locate(path)
+            group = groups.get(parent)
+
+            if group is None:
+                group = groups[parent] = ([], [])
+
+            group[0].append(name)
+            group[1].append(i)
+            i += 1
+
+        retval = [None] * i
+        __call_in_context(context, lambda: __lookup_groups(groups, dtype, retval))
+
+        return retval
+
+    cdef tuple _locate(self, path):
+        """
+        The parent namespace and last name of a relative path
+        """
+        cdef:
+            Path p = path if isinstance(path, Path) else Path.of(path)
+            list names = p._ptr.names
+
+        if p.is_absolute or not names:
+            raise IllegalPathException(p)
+
+        return self.resolve(p, include_last=False), names[-1]
+
     def resolve_to_binding(self, p: Path) -> MDSNameBinding:
         cdef:
             Namespace ip = self.resolve(p=p, include_last=False)
@@ -3805,6 +9298,49 @@ cdef inline Namespace_Init(h_namespace_t handle, Namespace parent, String name):
     result._handle = handle
     return result
 
+cdef __binding_dtype(value):
+    t = getattr(value, "dtype", None)
+
+    # Arrays report their element type
+    if t is not None and isinstance(value, MDSArrayBase):
+        t = getattr(mds.typing.arrays, t.api)
+
+    return t
+
+cdef __call_in_context(context, fn: Callable):
+    if context is None:
+        return fn()
+
+    return context.call(fn)
+
+cdef list __prepare_groups(dict groups):
+    cdef:
+        MDSTypedNameBinding binding
+        list retval = []
+
+    for (parent, t), (names, values) in groups.items():
+        binding = __name_binding_type(t)(parent, names[0])
+        retval.append((binding, names, binding._checked(values)))
+
+    return retval
+
+cdef __bind_groups(list prepared):
+    cdef MDSTypedNameBinding binding
+
+    for binding, names, values in prepared:
+        binding._bind_all(names, values)
+
+cdef __lookup_groups(dict groups, dtype, list into):
+    cdef:
+        MDSTypedNameBinding binding
+        type binding_t = __name_binding_type(dtype)
+
+    for parent, (names, indices) in groups.items():
+        binding = binding_t(parent, names[0])
+
+        for i, value in zip(indices, binding._lookup_all(names)):
+            into[i] = value
+
 cdef Impl __copy_Impl(Impl origin):
     cdef impl = Impl()
     impl._names = origin.names.copy()
@@ -3832,10 +9368,12 @@ cdef class MDSNameBindingBase(object):
 cdef class MDSNameBinding(MDSNameBindingBase):
     cdef:
         bint _root_binding
+        dict _typed  # binding type -> MDSTypedNameBinding
 
     def __cinit__(self, Namespace ns, String n):
         super().__init__(ns, n)
         self._root_binding = False
+        self._typed = dict()
 
         if not len(n):
             if ns.is_root():
@@ -3846,46 +9384,20 @@ cdef class MDSNameBinding(MDSNameBindingBase):
                 self._namespace = ns.parent()
 
     def as_type(self, t: MDSTypeInfo) -> MDSTypedNameBinding:
-        mappings = {
-            # START INJECTION | tmpl_namespace_mapping(Primitives,Arrays,Composites)
-            mds.typing.primitives.bool: MDSBoolNameBinding,
-            mds.typing.primitives.byte: MDSByteNameBinding,
-            mds.typing.primitives.ubyte: MDSUByteNameBinding,
-            mds.typing.primitives.short: MDSShortNameBinding,
-            mds.typing.primitives.ushort: MDSUShortNameBinding,
-            mds.typing.primitives.int: MDSIntNameBinding,
-            mds.typing.primitives.uint: MDSUIntNameBinding,
-            mds.typing.primitives.long: MDSLongNameBinding,
-            mds.typing.primitives.ulong: MDSULongNameBinding,
-            mds.typing.primitives.float: MDSFloatNameBinding,
-            mds.typing.primitives.double: MDSDoubleNameBinding,
-            mds.typing.arrays.bool: MDSBoolArrayNameBinding,
-            mds.typing.arrays.byte: MDSByteArrayNameBinding,
-            mds.typing.arrays.ubyte: MDSUByteArrayNameBinding,
-            mds.typing.arrays.short: MDSShortArrayNameBinding,
-            mds.typing.arrays.ushort: MDSUShortArrayNameBinding,
-            mds.typing.arrays.int: MDSIntArrayNameBinding,
-            mds.typing.arrays.uint: MDSUIntArrayNameBinding,
-            mds.typing.arrays.long: MDSLongArrayNameBinding,
-            mds.typing.arrays.ulong: MDSULongArrayNameBinding,
-            mds.typing.arrays.float: MDSFloatArrayNameBinding,
-            mds.typing.arrays.double: MDSDoubleArrayNameBinding,
-            mds.typing.arrays.string: MDSStringArrayNameBinding,
-            mds.typing.arrays.record: MDSRecordArrayNameBinding,
-            mds.typing.composites.string: MDSStringNameBinding,
-            mds.typing.composites.record: MDSRecordNameBinding,
-            # END INJECTION
-        }
-
-        if t not in mappings:
-            raise TypeError(f"No way to cast to type `{t}`")
-
-        return mappings[t](self._namespace, self._name)
-
-    def as_array(self, array_type: MDSArrayTypeInfo) -> MDSArrayBase:
-        # TODO deal with title_array => title in MDSArrayTypeInfo
-        klass = globals()[array_type.title_array]
-        return self.as_type(klass)
+        cdef type binding_t = __name_binding_type(t)
+        retval = self._typed.get(binding_t)
+
+        if retval is None:
+            retval = self._typed[binding_t] = binding_t(self._namespace, self._name)
+
+        return retval
+
+    def as_array(self, array_type: MDSArrayTypeInfo) -> MDSTypedNameBinding:
+        # Element types are accepted too, and mapped onto their array type
+        if not array_type.is_array:
+            array_type = getattr(mds.typing.arrays, array_type.api)
+
+        return self.as_type(array_type)
 
     def as_namespace(self) -> Namespace:
         cdef:
@@ -3896,8 +9408,7 @@ cdef class MDSNameBinding(MDSNameBindingBase):
         if self._root_binding:
             return Namespace.root()
 
-        ch = h.child_namespace(nhandle, True)
-        return Namespace_Init(handle=ch, parent=self._namespace, name=self._name)
+        return self._namespace._child(self._name)
 
     def bind(self, value: MDSPrimitiveBase):
         # TODO: What should be bind-able?
@@ -3910,6 +9421,7 @@ cdef class MDSNameBinding(MDSNameBindingBase):
         # delegate to it. I'll do the latter.
         # h.bind<managed_type<T>::kind>(nhandle, std::forward<T>(val));
         # h.bind(nhandle, value)
+        self._namespace._forget_child(self._name)
         value.bind_to_namespace(namespace=self._namespace, name=self._name)
         
 
@@ -3927,6 +9439,19 @@ cdef class MDSTypedNameBinding(MDSNameBindingBase):
     def check(self):
         return self.get() is not None
 
+    cdef list _checked(self, list values):
+        """
+        values, converted as needed, ready for _bind_all(). Raises before
+        anything is bound if any of them can't be.
+        """
+        raise TypeError(f"{type(self).__name__} can't bind in bulk")
+
+    cdef _bind_all(self, list names, list values):
+        raise TypeError(f"{type(self).__name__} can't bind in bulk")
+
+    cdef list _lookup_all(self, list names):
+        raise TypeError(f"{type(self).__name__} can't look up in bulk")
+
 
 cdef class MDSStringNameBinding(MDSTypedNameBinding):
     pass
@@ -3956,8 +9481,41 @@ cdef class MDSBoolNameBinding(MDSTypedNameBinding):
             h_istring_t nhandle = self._name._ish
             h_namespace_t ns = self._namespace._handle
 
+        self._namespace._forget_child(self._name)
         ns.bind_bool(nhandle, <bool> val.python_type)
 
+    cdef list _checked(self, list values):
+        # Converting goes through the usual bounds checks
+        return [v if isinstance(v, Bool) else Bool(v) for v in values]
+
+    cdef _bind_all(self, list names, list values):
+        cdef:
+            h_namespace_t ns = self._namespace._handle
+            Bool val
+            String name
+            Py_ssize_t i
+
+        for i in range(len(names)):
+            name = names[i]
+            val = values[i]
+            self._namespace._forget_child(name)
+            ns.bind_bool(name._ish, bool_to_core_val(val._type))
+
+    cdef list _lookup_all(self, list names):
+        cdef:
+            h_namespace_t ns = self._namespace._handle
+            h_mbool_t thandle = self._type
+            list retval = []
+            String name
+
+        for name in names:
+            try:
+                retval.append(Bool(ns.lookup_bool(name._ish, thandle)))
+            except:  # unbound_name_ex
+                retval.append(None)
+
+        return retval
+
 cdef class MDSByteNameBinding(MDSTypedNameBinding):
     cdef h_mbyte_t _type
 
@@ -3976,8 +9534,41 @@ cdef class MDSByteNameBinding(MDSTypedNameBinding):
             h_istring_t nhandle = self._name._ish
             h_namespace_t ns = self._namespace._handle
 
+        self._namespace._forget_child(self._name)
         ns.bind_byte(nhandle, <int8_t> val.python_type)
 
+    cdef list _checked(self, list values):
+        # Converting goes through the usual bounds checks
+        return [v if isinstance(v, Byte) else Byte(v) for v in values]
+
+    cdef _bind_all(self, list names, list values):
+        cdef:
+            h_namespace_t ns = self._namespace._handle
+            Byte val
+            String name
+            Py_ssize_t i
+
+        for i in range(len(names)):
+            name = names[i]
+            val = values[i]
+            self._namespace._forget_child(name)
+            ns.bind_byte(name._ish, byte_to_core_val(val._type))
+
+    cdef list _lookup_all(self, list names):
+        cdef:
+            h_namespace_t ns = self._namespace._handle
+            h_mbyte_t thandle = self._type
+            list retval = []
+            String name
+
+        for name in names:
+            try:
+                retval.append(Byte(ns.lookup_byte(name._ish, thandle)))
+            except:  # unbound_name_ex
+                retval.append(None)
+
+        return retval
+
 cdef class MDSUByteNameBinding(MDSTypedNameBinding):
     cdef h_mubyte_t _type
 
@@ -3996,8 +9587,41 @@ cdef class MDSUByteNameBinding(MDSTypedNameBinding):
             h_istring_t nhandle = self._name._ish
             h_namespace_t ns = self._namespace._handle
 
+        self._namespace._forget_child(self._name)
         ns.bind_ubyte(nhandle, <uint8_t> val.python_type)
 
+    cdef list _checked(self, list values):
+        # Converting goes through the usual bounds checks
+        return [v if isinstance(v, UByte) else UByte(v) for v in values]
+
+    cdef _bind_all(self, list names, list values):
+        cdef:
+            h_namespace_t ns = self._namespace._handle
+            UByte val
+            String name
+            Py_ssize_t i
+
+        for i in range(len(names)):
+            name = names[i]
+            val = values[i]
+            self._namespace._forget_child(name)
+            ns.bind_ubyte(name._ish, ubyte_to_core_val(val._type))
+
+    cdef list _lookup_all(self, list names):
+        cdef:
+            h_namespace_t ns = self._namespace._handle
+            h_mubyte_t thandle = self._type
+            list retval = []
+            String name
+
+        for name in names:
+            try:
+                retval.append(UByte(ns.lookup_ubyte(name._ish, thandle)))
+            except:  # unbound_name_ex
+                retval.append(None)
+
+        return retval
+
 cdef class MDSShortNameBinding(MDSTypedNameBinding):
     cdef h_mshort_t _type
 
@@ -4016,8 +9640,41 @@ cdef class MDSShortNameBinding(MDSTypedNameBinding):
             h_istring_t nhandle = self._name._ish
             h_namespace_t ns = self._namespace._handle
 
+        self._namespace._forget_child(self._name)
         ns.bind_short(nhandle, <int16_t> val.python_type)
 
+    cdef list _checked(self, list values):
+        # Converting goes through the usual bounds checks
+        return [v if isinstance(v, Short) else Short(v) for v in values]
+
+    cdef _bind_all(self, list names, list values):
+        cdef:
+            h_namespace_t ns = self._namespace._handle
+            Short val
+            String name
+            Py_ssize_t i
+
+        for i in range(len(names)):
+            name = names[i]
+            val = values[i]
+            self._namespace._forget_child(name)
+            ns.bind_short(name._ish, short_to_core_val(val._type))
+
+    cdef list _lookup_all(self, list names):
+        cdef:
+            h_namespace_t ns = self._namespace._handle
+            h_mshort_t thandle = self._type
+            list retval = []
+            String name
+
+        for name in names:
+            try:
+                retval.append(Short(ns.lookup_short(name._ish, thandle)))
+            except:  # unbound_name_ex
+                retval.append(None)
+
+        return retval
+
 cdef class MDSUShortNameBinding(MDSTypedNameBinding):
     cdef h_mushort_t _type
 
@@ -4036,8 +9693,41 @@ cdef class MDSUShortNameBinding(MDSTypedNameBinding):
             h_istring_t nhandle = self._name._ish
             h_namespace_t ns = self._namespace._handle
 
+        self._namespace._forget_child(self._name)
         ns.bind_ushort(nhandle, <uint16_t> val.python_type)
 
+    cdef list _checked(self, list values):
+        # Converting goes through the usual bounds checks
+        return [v if isinstance(v, UShort) else UShort(v) for v in values]
+
+    cdef _bind_all(self, list names, list values):
+        cdef:
+            h_namespace_t ns = self._namespace._handle
+            UShort val
+            String name
+            Py_ssize_t i
+
+        for i in range(len(names)):
+            name = names[i]
+            val = values[i]
+            self._namespace._forget_child(name)
+            ns.bind_ushort(name._ish, ushort_to_core_val(val._type))
+
+    cdef list _lookup_all(self, list names):
+        cdef:
+            h_namespace_t ns = self._namespace._handle
+            h_mushort_t thandle = self._type
+            list retval = []
+            String name
+
+        for name in names:
+            try:
+                retval.append(UShort(ns.lookup_ushort(name._ish, thandle)))
+            except:  # unbound_name_ex
+                retval.append(None)
+
+        return retval
+
 cdef class MDSIntNameBinding(MDSTypedNameBinding):
     cdef h_mint_t _type
 
@@ -4056,8 +9746,41 @@ cdef class MDSIntNameBinding(MDSTypedNameBinding):
             h_istring_t nhandle = self._name._ish
             h_namespace_t ns = self._namespace._handle
 
+        self._namespace._forget_child(self._name)
         ns.bind_int(nhandle, <int32_t> val.python_type)
 
+    cdef list _checked(self, list values):
+        # Converting goes through the usual bounds checks
+        return [v if isinstance(v, Int) else Int(v) for v in values]
+
+    cdef _bind_all(self, list names, list values):
+        cdef:
+            h_namespace_t ns = self._namespace._handle
+            Int val
+            String name
+            Py_ssize_t i
+
+        for i in range(len(names)):
+            name = names[i]
+            val = values[i]
+            self._namespace._forget_child(name)
+            ns.bind_int(name._ish, int_to_core_val(val._type))
+
+    cdef list _lookup_all(self, list names):
+        cdef:
+            h_namespace_t ns = self._namespace._handle
+            h_mint_t thandle = self._type
+            list retval = []
+            String name
+
+        for name in names:
+            try:
+                retval.append(Int(ns.lookup_int(name._ish, thandle)))
+            except:  # unbound_name_ex
+                retval.append(None)
+
+        return retval
+
 cdef class MDSUIntNameBinding(MDSTypedNameBinding):
     cdef h_muint_t _type
 
@@ -4076,8 +9799,41 @@ cdef class MDSUIntNameBinding(MDSTypedNameBinding):
             h_istring_t nhandle = self._name._ish
             h_namespace_t ns = self._namespace._handle
 
+        self._namespace._forget_child(self._name)
         ns.bind_uint(nhandle, <uint32_t> val.python_type)
 
+    cdef list _checked(self, list values):
+        # Converting goes through the usual bounds checks
+        return [v if isinstance(v, UInt) else UInt(v) for v in values]
+
+    cdef _bind_all(self, list names, list values):
+        cdef:
+            h_namespace_t ns = self._namespace._handle
+            UInt val
+            String name
+            Py_ssize_t i
+
+        for i in range(len(names)):
+            name = names[i]
+            val = values[i]
+            self._namespace._forget_child(name)
+            ns.bind_uint(name._ish, uint_to_core_val(val._type))
+
+    cdef list _lookup_all(self, list names):
+        cdef:
+            h_namespace_t ns = self._namespace._handle
+            h_muint_t thandle = self._type
+            list retval = []
+            String name
+
+        for name in names:
+            try:
+                retval.append(UInt(ns.lookup_uint(name._ish, thandle)))
+            except:  # unbound_name_ex
+                retval.append(None)
+
+        return retval
+
 cdef class MDSLongNameBinding(MDSTypedNameBinding):
     cdef h_mlong_t _type
 
@@ -4096,8 +9852,41 @@ cdef class MDSLongNameBinding(MDSTypedNameBinding):
             h_istring_t nhandle = self._name._ish
             h_namespace_t ns = self._namespace._handle
 
+        self._namespace._forget_child(self._name)
         ns.bind_long(nhandle, <int64_t> val.python_type)
 
+    cdef list _checked(self, list values):
+        # Converting goes through the usual bounds checks
+        return [v if isinstance(v, Long) else Long(v) for v in values]
+
+    cdef _bind_all(self, list names, list values):
+        cdef:
+            h_namespace_t ns = self._namespace._handle
+            Long val
+            String name
+            Py_ssize_t i
+
+        for i in range(len(names)):
+            name = names[i]
+            val = values[i]
+            self._namespace._forget_child(name)
+            ns.bind_long(name._ish, long_to_core_val(val._type))
+
+    cdef list _lookup_all(self, list names):
+        cdef:
+            h_namespace_t ns = self._namespace._handle
+            h_mlong_t thandle = self._type
+            list retval = []
+            String name
+
+        for name in names:
+            try:
+                retval.append(Long(ns.lookup_long(name._ish, thandle)))
+            except:  # unbound_name_ex
+                retval.append(None)
+
+        return retval
+
 cdef class MDSULongNameBinding(MDSTypedNameBinding):
     cdef h_mulong_t _type
 
@@ -4116,8 +9905,41 @@ cdef class MDSULongNameBinding(MDSTypedNameBinding):
             h_istring_t nhandle = self._name._ish
             h_namespace_t ns = self._namespace._handle
 
+        self._namespace._forget_child(self._name)
         ns.bind_ulong(nhandle, <uint64_t> val.python_type)
 
+    cdef list _checked(self, list values):
+        # Converting goes through the usual bounds checks
+        return [v if isinstance(v, ULong) else ULong(v) for v in values]
+
+    cdef _bind_all(self, list names, list values):
+        cdef:
+            h_namespace_t ns = self._namespace._handle
+            ULong val
+            String name
+            Py_ssize_t i
+
+        for i in range(len(names)):
+            name = names[i]
+            val = values[i]
+            self._namespace._forget_child(name)
+            ns.bind_ulong(name._ish, ulong_to_core_val(val._type))
+
+    cdef list _lookup_all(self, list names):
+        cdef:
+            h_namespace_t ns = self._namespace._handle
+            h_mulong_t thandle = self._type
+            list retval = []
+            String name
+
+        for name in names:
+            try:
+                retval.append(ULong(ns.lookup_ulong(name._ish, thandle)))
+            except:  # unbound_name_ex
+                retval.append(None)
+
+        return retval
+
 cdef class MDSFloatNameBinding(MDSTypedNameBinding):
     cdef h_mfloat_t _type
 
@@ -4136,8 +9958,41 @@ cdef class MDSFloatNameBinding(MDSTypedNameBinding):
             h_istring_t nhandle = self._name._ish
             h_namespace_t ns = self._namespace._handle
 
+        self._namespace._forget_child(self._name)
         ns.bind_float(nhandle, <float> val.python_type)
 
+    cdef list _checked(self, list values):
+        # Converting goes through the usual bounds checks
+        return [v if isinstance(v, Float) else Float(v) for v in values]
+
+    cdef _bind_all(self, list names, list values):
+        cdef:
+            h_namespace_t ns = self._namespace._handle
+            Float val
+            String name
+            Py_ssize_t i
+
+        for i in range(len(names)):
+            name = names[i]
+            val = values[i]
+            self._namespace._forget_child(name)
+            ns.bind_float(name._ish, float_to_core_val(val._type))
+
+    cdef list _lookup_all(self, list names):
+        cdef:
+            h_namespace_t ns = self._namespace._handle
+            h_mfloat_t thandle = self._type
+            list retval = []
+            String name
+
+        for name in names:
+            try:
+                retval.append(Float(ns.lookup_float(name._ish, thandle)))
+            except:  # unbound_name_ex
+                retval.append(None)
+
+        return retval
+
 cdef class MDSDoubleNameBinding(MDSTypedNameBinding):
     cdef h_mdouble_t _type
 
@@ -4156,7 +10011,40 @@ cdef class MDSDoubleNameBinding(MDSTypedNameBinding):
             h_istring_t nhandle = self._name._ish
             h_namespace_t ns = self._namespace._handle
 
+        self._namespace._forget_child(self._name)
         ns.bind_double(nhandle, <double> val.python_type)
+
+    cdef list _checked(self, list values):
+        # Converting goes through the usual bounds checks
+        return [v if isinstance(v, Double) else Double(v) for v in values]
+
+    cdef _bind_all(self, list names, list values):
+        cdef:
+            h_namespace_t ns = self._namespace._handle
+            Double val
+            String name
+            Py_ssize_t i
+
+        for i in range(len(names)):
+            name = names[i]
+            val = values[i]
+            self._namespace._forget_child(name)
+            ns.bind_double(name._ish, double_to_core_val(val._type))
+
+    cdef list _lookup_all(self, list names):
+        cdef:
+            h_namespace_t ns = self._namespace._handle
+            h_mdouble_t thandle = self._type
+            list retval = []
+            String name
+
+        for name in names:
+            try:
+                retval.append(Double(ns.lookup_double(name._ish, thandle)))
+            except:  # unbound_name_ex
+                retval.append(None)
+
+        return retval
 # END INJECTION
 
 # START INJECTION | tmpl_namespace_typed_array_bindings(Arrays)
@@ -4182,8 +10070,47 @@ cdef class MDSBoolArrayNameBinding(MDSTypedNameBinding):
             h_istring_t nhandle = self._name._ish
             h_namespace_t ns = self._namespace._handle
 
+        self._namespace._forget_child(self._name)
         ns.bind_bool_array(nhandle, val._handle)
 
+    cdef list _checked(self, list values):
+        for value in values:
+            if not isinstance(value, BoolArray):
+                raise TypeError(f"Can't bind `{type(value).__name__}` as BoolArray")
+
+        return values
+
+    cdef _bind_all(self, list names, list values):
+        cdef:
+            h_namespace_t ns = self._namespace._handle
+            BoolArray val
+            String name
+            Py_ssize_t i
+
+        for i in range(len(names)):
+            name = names[i]
+            val = values[i]
+            self._namespace._forget_child(name)
+            ns.bind_bool_array(name._ish, val._handle)
+
+    cdef list _lookup_all(self, list names):
+        cdef:
+            h_namespace_t ns = self._namespace._handle
+            h_array_bool_t thandle
+            BoolArray found
+            list retval = []
+            String name
+
+        for name in names:
+            try:
+                found = BoolArray()
+                found._handle = ns.lookup_bool_array(name._ish, thandle)
+                retval.append(found)
+            except:  # unbound_name_ex
+                retval.append(None)
+
+        return retval
+
 cdef class MDSByteArrayNameBinding(MDSTypedNameBinding):
 
     def get(self) -> Optional[ByteArray]:
@@ -4205,8 +10132,47 @@ cdef class MDSByteArrayNameBinding(MDSTypedNameBinding):
             h_istring_t nhandle = self._name._ish
             h_namespace_t ns = self._namespace._handle
 
+        self._namespace._forget_child(self._name)
         ns.bind_byte_array(nhandle, val._handle)
 
+    cdef list _checked(self, list values):
+        for value in values:
+            if not isinstance(value, ByteArray):
+                raise TypeError(f"Can't bind `{type(value).__name__}` as ByteArray")
+
+        return values
+
+    cdef _bind_all(self, list names, list values):
+        cdef:
+            h_namespace_t ns = self._namespace._handle
+            ByteArray val
+            String name
+            Py_ssize_t i
+
+        for i in range(len(names)):
+            name = names[i]
+            val = values[i]
+            self._namespace._forget_child(name)
+            ns.bind_byte_array(name._ish, val._handle)
+
+    cdef list _lookup_all(self, list names):
+        cdef:
+            h_namespace_t ns = self._namespace._handle
+            h_array_byte_t thandle
+            ByteArray found
+            list retval = []
+            String name
+
+        for name in names:
+            try:
+                found = ByteArray()
+                found._handle = ns.lookup_byte_array(name._ish, thandle)
+                retval.append(found)
+            except:  # unbound_name_ex
+                retval.append(None)
+
+        return retval
+
 cdef class MDSUByteArrayNameBinding(MDSTypedNameBinding):
 
     def get(self) -> Optional[UByteArray]:
@@ -4228,8 +10194,47 @@ cdef class MDSUByteArrayNameBinding(MDSTypedNameBinding):
             h_istring_t nhandle = self._name._ish
             h_namespace_t ns = self._namespace._handle
 
+        self._namespace._forget_child(self._name)
         ns.bind_ubyte_array(nhandle, val._handle)
 
+    cdef list _checked(self, list values):
+        for value in values:
+            if not isinstance(value, UByteArray):
+                raise TypeError(f"Can't bind `{type(value).__name__}` as UByteArray")
+
+        return values
+
+    cdef _bind_all(self, list names, list values):
+        cdef:
+            h_namespace_t ns = self._namespace._handle
+            UByteArray val
+            String name
+            Py_ssize_t i
+
+        for i in range(len(names)):
+            name = names[i]
+            val = values[i]
+            self._namespace._forget_child(name)
+            ns.bind_ubyte_array(name._ish, val._handle)
+
+    cdef list _lookup_all(self, list names):
+        cdef:
+            h_namespace_t ns = self._namespace._handle
+            h_array_ubyte_t thandle
+            UByteArray found
+            list retval = []
+            String name
+
+        for name in names:
+            try:
+                found = UByteArray()
+                found._handle = ns.lookup_ubyte_array(name._ish, thandle)
+                retval.append(found)
+            except:  # unbound_name_ex
+                retval.append(None)
+
+        return retval
+
 cdef class MDSShortArrayNameBinding(MDSTypedNameBinding):
 
     def get(self) -> Optional[ShortArray]:
@@ -4251,8 +10256,47 @@ cdef class MDSShortArrayNameBinding(MDSTypedNameBinding):
             h_istring_t nhandle = self._name._ish
             h_namespace_t ns = self._namespace._handle
 
+        self._namespace._forget_child(self._name)
         ns.bind_short_array(nhandle, val._handle)
 
+    cdef list _checked(self, list values):
+        for value in values:
+            if not isinstance(value, ShortArray):
+                raise TypeError(f"Can't bind `{type(value).__name__}` as ShortArray")
+
+        return values
+
+    cdef _bind_all(self, list names, list values):
+        cdef:
+            h_namespace_t ns = self._namespace._handle
+            ShortArray val
+            String name
+            Py_ssize_t i
+
+        for i in range(len(names)):
+            name = names[i]
+            val = values[i]
+            self._namespace._forget_child(name)
+            ns.bind_short_array(name._ish, val._handle)
+
+    cdef list _lookup_all(self, list names):
+        cdef:
+            h_namespace_t ns = self._namespace._handle
+            h_array_short_t thandle
+            ShortArray found
+            list retval = []
+            String name
+
+        for name in names:
+            try:
+                found = ShortArray()
+                found._handle = ns.lookup_short_array(name._ish, thandle)
+                retval.append(found)
+            except:  # unbound_name_ex
+                retval.append(None)
+
+        return retval
+
 cdef class MDSUShortArrayNameBinding(MDSTypedNameBinding):
 
     def get(self) -> Optional[UShortArray]:
@@ -4274,8 +10318,47 @@ cdef class MDSUShortArrayNameBinding(MDSTypedNameBinding):
             h_istring_t nhandle = self._name._ish
             h_namespace_t ns = self._namespace._handle
 
+        self._namespace._forget_child(self._name)
         ns.bind_ushort_array(nhandle, val._handle)
 
+    cdef list _checked(self, list values):
+        for value in values:
+            if not isinstance(value, UShortArray):
+                raise TypeError(f"Can't bind `{type(value).__name__}` as UShortArray")
+
+        return values
+
+    cdef _bind_all(self, list names, list values):
+        cdef:
+            h_namespace_t ns = self._namespace._handle
+            UShortArray val
+            String name
+            Py_ssize_t i
+
+        for i in range(len(names)):
+            name = names[i]
+            val = values[i]
+            self._namespace._forget_child(name)
+            ns.bind_ushort_array(name._ish, val._handle)
+
+    cdef list _lookup_all(self, list names):
+        cdef:
+            h_namespace_t ns = self._namespace._handle
+            h_array_ushort_t thandle
+            UShortArray found
+            list retval = []
+            String name
+
+        for name in names:
+            try:
+                found = UShortArray()
+                found._handle = ns.lookup_ushort_array(name._ish, thandle)
+                retval.append(found)
+            except:  # unbound_name_ex
+                retval.append(None)
+
+        return retval
+
 cdef class MDSIntArrayNameBinding(MDSTypedNameBinding):
 
     def get(self) -> Optional[IntArray]:
@@ -4297,8 +10380,47 @@ cdef class MDSIntArrayNameBinding(MDSTypedNameBinding):
             h_istring_t nhandle = self._name._ish
             h_namespace_t ns = self._namespace._handle
 
+        self._namespace._forget_child(self._name)
         ns.bind_int_array(nhandle, val._handle)
 
+    cdef list _checked(self, list values):
+        for value in values:
+            if not isinstance(value, IntArray):
+                raise TypeError(f"Can't bind `{type(value).__name__}` as IntArray")
+
+        return values
+
+    cdef _bind_all(self, list names, list values):
+        cdef:
+            h_namespace_t ns = self._namespace._handle
+            IntArray val
+            String name
+            Py_ssize_t i
+
+        for i in range(len(names)):
+            name = names[i]
+            val = values[i]
+            self._namespace._forget_child(name)
+            ns.bind_int_array(name._ish, val._handle)
+
+    cdef list _lookup_all(self, list names):
+        cdef:
+            h_namespace_t ns = self._namespace._handle
+            h_array_int_t thandle
+            IntArray found
+            list retval = []
+            String name
+
+        for name in names:
+            try:
+                found = IntArray()
+                found._handle = ns.lookup_int_array(name._ish, thandle)
+                retval.append(found)
+            except:  # unbound_name_ex
+                retval.append(None)
+
+        return retval
+
 cdef class MDSUIntArrayNameBinding(MDSTypedNameBinding):
 
     def get(self) -> Optional[UIntArray]:
@@ -4320,8 +10442,47 @@ cdef class MDSUIntArrayNameBinding(MDSTypedNameBinding):
             h_istring_t nhandle = self._name._ish
             h_namespace_t ns = self._namespace._handle
 
+        self._namespace._forget_child(self._name)
         ns.bind_uint_array(nhandle, val._handle)
 
+    cdef list _checked(self, list values):
+        for value in values:
+            if not isinstance(value, UIntArray):
+                raise TypeError(f"Can't bind `{type(value).__name__}` as UIntArray")
+
+        return values
+
+    cdef _bind_all(self, list names, list values):
+        cdef:
+            h_namespace_t ns = self._namespace._handle
+            UIntArray val
+            String name
+            Py_ssize_t i
+
+        for i in range(len(names)):
+            name = names[i]
+            val = values[i]
+            self._namespace._forget_child(name)
+            ns.bind_uint_array(name._ish, val._handle)
+
+    cdef list _lookup_all(self, list names):
+        cdef:
+            h_namespace_t ns = self._namespace._handle
+            h_array_uint_t thandle
+            UIntArray found
+            list retval = []
+            String name
+
+        for name in names:
+            try:
+                found = UIntArray()
+                found._handle = ns.lookup_uint_array(name._ish, thandle)
+                retval.append(found)
+            except:  # unbound_name_ex
+                retval.append(None)
+
+        return retval
+
 cdef class MDSLongArrayNameBinding(MDSTypedNameBinding):
 
     def get(self) -> Optional[LongArray]:
@@ -4343,8 +10504,47 @@ cdef class MDSLongArrayNameBinding(MDSTypedNameBinding):
             h_istring_t nhandle = self._name._ish
             h_namespace_t ns = self._namespace._handle
 
+        self._namespace._forget_child(self._name)
         ns.bind_long_array(nhandle, val._handle)
 
+    cdef list _checked(self, list values):
+        for value in values:
+            if not isinstance(value, LongArray):
+                raise TypeError(f"Can't bind `{type(value).__name__}` as LongArray")
+
+        return values
+
+    cdef _bind_all(self, list names, list values):
+        cdef:
+            h_namespace_t ns = self._namespace._handle
+            LongArray val
+            String name
+            Py_ssize_t i
+
+        for i in range(len(names)):
+            name = names[i]
+            val = values[i]
+            self._namespace._forget_child(name)
+            ns.bind_long_array(name._ish, val._handle)
+
+    cdef list _lookup_all(self, list names):
+        cdef:
+            h_namespace_t ns = self._namespace._handle
+            h_array_long_t thandle
+            LongArray found
+            list retval = []
+            String name
+
+        for name in names:
+            try:
+                found = LongArray()
+                found._handle = ns.lookup_long_array(name._ish, thandle)
+                retval.append(found)
+            except:  # unbound_name_ex
+                retval.append(None)
+
+        return retval
+
 cdef class MDSULongArrayNameBinding(MDSTypedNameBinding):
 
     def get(self) -> Optional[ULongArray]:
@@ -4366,8 +10566,47 @@ cdef class MDSULongArrayNameBinding(MDSTypedNameBinding):
             h_istring_t nhandle = self._name._ish
             h_namespace_t ns = self._namespace._handle
 
+        self._namespace._forget_child(self._name)
         ns.bind_ulong_array(nhandle, val._handle)
 
+    cdef list _checked(self, list values):
+        for value in values:
+            if not isinstance(value, ULongArray):
+                raise TypeError(f"Can't bind `{type(value).__name__}` as ULongArray")
+
+        return values
+
+    cdef _bind_all(self, list names, list values):
+        cdef:
+            h_namespace_t ns = self._namespace._handle
+            ULongArray val
+            String name
+            Py_ssize_t i
+
+        for i in range(len(names)):
+            name = names[i]
+            val = values[i]
+            self._namespace._forget_child(name)
+            ns.bind_ulong_array(name._ish, val._handle)
+
+    cdef list _lookup_all(self, list names):
+        cdef:
+            h_namespace_t ns = self._namespace._handle
+            h_array_ulong_t thandle
+            ULongArray found
+            list retval = []
+            String name
+
+        for name in names:
+            try:
+                found = ULongArray()
+                found._handle = ns.lookup_ulong_array(name._ish, thandle)
+                retval.append(found)
+            except:  # unbound_name_ex
+                retval.append(None)
+
+        return retval
+
 cdef class MDSFloatArrayNameBinding(MDSTypedNameBinding):
 
     def get(self) -> Optional[FloatArray]:
@@ -4389,8 +10628,47 @@ cdef class MDSFloatArrayNameBinding(MDSTypedNameBinding):
             h_istring_t nhandle = self._name._ish
             h_namespace_t ns = self._namespace._handle
 
+        self._namespace._forget_child(self._name)
         ns.bind_float_array(nhandle, val._handle)
 
+    cdef list _checked(self, list values):
+        for value in values:
+            if not isinstance(value, FloatArray):
+                raise TypeError(f"Can't bind `{type(value).__name__}` as FloatArray")
+
+        return values
+
+    cdef _bind_all(self, list names, list values):
+        cdef:
+            h_namespace_t ns = self._namespace._handle
+            FloatArray val
+            String name
+            Py_ssize_t i
+
+        for i in range(len(names)):
+            name = names[i]
+            val = values[i]
+            self._namespace._forget_child(name)
+            ns.bind_float_array(name._ish, val._handle)
+
+    cdef list _lookup_all(self, list names):
+        cdef:
+            h_namespace_t ns = self._namespace._handle
+            h_array_float_t thandle
+            FloatArray found
+            list retval = []
+            String name
+
+        for name in names:
+            try:
+                found = FloatArray()
+                found._handle = ns.lookup_float_array(name._ish, thandle)
+                retval.append(found)
+            except:  # unbound_name_ex
+                retval.append(None)
+
+        return retval
+
 cdef class MDSDoubleArrayNameBinding(MDSTypedNameBinding):
 
     def get(self) -> Optional[DoubleArray]:
@@ -4412,8 +10690,47 @@ cdef class MDSDoubleArrayNameBinding(MDSTypedNameBinding):
             h_istring_t nhandle = self._name._ish
             h_namespace_t ns = self._namespace._handle
 
+        self._namespace._forget_child(self._name)
         ns.bind_double_array(nhandle, val._handle)
 
+    cdef list _checked(self, list values):
+        for value in values:
+            if not isinstance(value, DoubleArray):
+                raise TypeError(f"Can't bind `{type(value).__name__}` as DoubleArray")
+
+        return values
+
+    cdef _bind_all(self, list names, list values):
+        cdef:
+            h_namespace_t ns = self._namespace._handle
+            DoubleArray val
+            String name
+            Py_ssize_t i
+
+        for i in range(len(names)):
+            name = names[i]
+            val = values[i]
+            self._namespace._forget_child(name)
+            ns.bind_double_array(name._ish, val._handle)
+
+    cdef list _lookup_all(self, list names):
+        cdef:
+            h_namespace_t ns = self._namespace._handle
+            h_array_double_t thandle
+            DoubleArray found
+            list retval = []
+            String name
+
+        for name in names:
+            try:
+                found = DoubleArray()
+                found._handle = ns.lookup_double_array(name._ish, thandle)
+                retval.append(found)
+            except:  # unbound_name_ex
+                retval.append(None)
+
+        return retval
+
 cdef class MDSStringArrayNameBinding(MDSTypedNameBinding):
 
     def get(self) -> Optional[StringArray]:
@@ -4435,8 +10752,47 @@ cdef class MDSStringArrayNameBinding(MDSTypedNameBinding):
             h_istring_t nhandle = self._name._ish
             h_namespace_t ns = self._namespace._handle
 
+        self._namespace._forget_child(self._name)
         ns.bind_string_array(nhandle, val._handle)
 
+    cdef list _checked(self, list values):
+        for value in values:
+            if not isinstance(value, StringArray):
+                raise TypeError(f"Can't bind `{type(value).__name__}` as StringArray")
+
+        return values
+
+    cdef _bind_all(self, list names, list values):
+        cdef:
+            h_namespace_t ns = self._namespace._handle
+            StringArray val
+            String name
+            Py_ssize_t i
+
+        for i in range(len(names)):
+            name = names[i]
+            val = values[i]
+            self._namespace._forget_child(name)
+            ns.bind_string_array(name._ish, val._handle)
+
+    cdef list _lookup_all(self, list names):
+        cdef:
+            h_namespace_t ns = self._namespace._handle
+            h_array_string_t thandle
+            StringArray found
+            list retval = []
+            String name
+
+        for name in names:
+            try:
+                found = StringArray()
+                found._handle = ns.lookup_string_array(name._ish, thandle)
+                retval.append(found)
+            except:  # unbound_name_ex
+                retval.append(None)
+
+        return retval
+
 cdef class MDSRecordArrayNameBinding(MDSTypedNameBinding):
 
     def get(self) -> Optional[RecordArray]:
@@ -4458,9 +10814,99 @@ cdef class MDSRecordArrayNameBinding(MDSTypedNameBinding):
             h_istring_t nhandle = self._name._ish
             h_namespace_t ns = self._namespace._handle
 
+        self._namespace._forget_child(self._name)
         ns.bind_record_array(nhandle, val._handle)
+
+    cdef list _checked(self, list values):
+        for value in values:
+            if not isinstance(value, RecordArray):
+                raise TypeError(f"Can't bind `{type(value).__name__}` as RecordArray")
+
+        return values
+
+    cdef _bind_all(self, list names, list values):
+        cdef:
+            h_namespace_t ns = self._namespace._handle
+            RecordArray val
+            String name
+            Py_ssize_t i
+
+        for i in range(len(names)):
+            name = names[i]
+            val = values[i]
+            self._namespace._forget_child(name)
+            ns.bind_record_array(name._ish, val._handle)
+
+    cdef list _lookup_all(self, list names):
+        cdef:
+            h_namespace_t ns = self._namespace._handle
+            h_array_record_t thandle
+            RecordArray found
+            list retval = []
+            String name
+
+        for name in names:
+            try:
+                found = RecordArray()
+                found._handle = ns.lookup_record_array(name._ish, thandle)
+                retval.append(found)
+            except:  # unbound_name_ex
+                retval.append(None)
+
+        return retval
 # END INJECTION
 
+cdef list __kind_table(dict entries):
+    cdef list table = [None] * mds.KIND_COUNT
+
+    for kind_id, value in entries.items():
+        table[kind_id] = value
+
+    return table
+
+# Typed name bindings, indexed by MDSTypeInfo.kind_id
+cdef list __NAME_BINDING_TYPES = __kind_table({
+    # START INJECTION | tmpl_namespace_mapping(Primitives,Arrays,Composites)
+    mds.typing.primitives.bool.kind_id: MDSBoolNameBinding,
+    mds.typing.primitives.byte.kind_id: MDSByteNameBinding,
+    mds.typing.primitives.ubyte.kind_id: MDSUByteNameBinding,
+    mds.typing.primitives.short.kind_id: MDSShortNameBinding,
+    mds.typing.primitives.ushort.kind_id: MDSUShortNameBinding,
+    mds.typing.primitives.int.kind_id: MDSIntNameBinding,
+    mds.typing.primitives.uint.kind_id: MDSUIntNameBinding,
+    mds.typing.primitives.long.kind_id: MDSLongNameBinding,
+    mds.typing.primitives.ulong.kind_id: MDSULongNameBinding,
+    mds.typing.primitives.float.kind_id: MDSFloatNameBinding,
+    mds.typing.primitives.double.kind_id: MDSDoubleNameBinding,
+    mds.typing.arrays.bool.kind_id: MDSBoolArrayNameBinding,
+    mds.typing.arrays.byte.kind_id: MDSByteArrayNameBinding,
+    mds.typing.arrays.ubyte.kind_id: MDSUByteArrayNameBinding,
+    mds.typing.arrays.short.kind_id: MDSShortArrayNameBinding,
+    mds.typing.arrays.ushort.kind_id: MDSUShortArrayNameBinding,
+    mds.typing.arrays.int.kind_id: MDSIntArrayNameBinding,
+    mds.typing.arrays.uint.kind_id: MDSUIntArrayNameBinding,
+    mds.typing.arrays.long.kind_id: MDSLongArrayNameBinding,
+    mds.typing.arrays.ulong.kind_id: MDSULongArrayNameBinding,
+    mds.typing.arrays.float.kind_id: MDSFloatArrayNameBinding,
+    mds.typing.arrays.double.kind_id: MDSDoubleArrayNameBinding,
+    mds.typing.arrays.string.kind_id: MDSStringArrayNameBinding,
+    mds.typing.arrays.record.kind_id: MDSRecordArrayNameBinding,
+    mds.typing.composites.string.kind_id: MDSStringNameBinding,
+    mds.typing.composites.record.kind_id: MDSRecordNameBinding,
+    # END INJECTION
+})
+
+cdef type __name_binding_type(t):
+    cdef object kind_id = getattr(t, "kind_id", None)
+
+    if kind_id is not None and 0 <= kind_id < mds.KIND_COUNT:
+        retval = __NAME_BINDING_TYPES[kind_id]
+
+        if retval is not None:
+            return retval
+
+    raise TypeError(f"No way to cast to type `{t}`")
+
 # =========================================================================
 #  Primitives
 # =========================================================================
@@ -26,6 +26,8 @@ provided you also meet the terms and conditions of the Application license.
 import sys
 import unittest
 
+from array import array
+from fractions import Fraction
 from functools import reduce
 from random import shuffle
 
@@ -74,5 +76,287 @@ class TestMDSArrays(unittest.TestCase):
     def test_numeric_underflow_behavior(self):
         pass
 
+    def test_buffer_protocol(self):
+        values = [x * 3 for x in range(100)]
+        x = LongArray.of(values)
+        view = memoryview(x)
+
+        self.assertTrue(view.readonly)
+        self.assertEqual(view.format, "q")
+        self.assertEqual(view.tolist(), values)
+
+    def test_buffer_is_a_snapshot(self):
+        x = DoubleArray.of([1.5, 2.5, 3.5])
+        snapshot = x.to_buffer()
+        x[0] = 10.0
+
+        self.assertEqual(len(snapshot), 3)
+        self.assertEqual(memoryview(snapshot).tolist(), [1.5, 2.5, 3.5])
+
+    def test_only_primitive_arrays_export_buffers(self):
+        for x in (StringArray(length=2), RecordArray(length=2)):
+            with self.assertRaises(BufferError):
+                memoryview(x)
+            with self.assertRaises(BufferError):
+                x.to_buffer()
+
+    def test_read_range(self):
+        values = list(range(50))
+        x = LongArray.of(values)
+
+        self.assertEqual(memoryview(x.read_range(10, 20)).tolist(), values[10:20])
+        self.assertEqual(memoryview(x.read_range(-5, 50)).tolist(), values[-5:])
+
+        out = array("q", [0] * 10)
+        self.assertIs(x.read_range(0, 10, out=out), out)
+        self.assertEqual(out.tolist(), values[:10])
+
+        with self.assertRaises(IndexError):
+            x.read_range(40, 60)
+
+    def test_bool_read_range(self):
+        x = BoolArray(length=4)
+        x.write_range(0, array("B", [1, 0, 2, 1]))
+
+        self.assertEqual(list(x), [True, False, True, True])
+        self.assertEqual(memoryview(x.read_range(1, 4)).tolist(), [False, True, True])
+
+        out = array("B", [9] * 4)
+        self.assertIs(x.read_range(0, 4, out=out), out)
+        self.assertEqual(out.tolist(), [1, 0, 1, 1])
+
+    def test_write_range(self):
+        x = LongArray(length=10)
+        x.write_range(2, array("q", [7, 8, 9]))
+
+        self.assertEqual([x[i] for i in range(2, 5)], [7, 8, 9])
+
+        # Anything that isn't an exactly-typed buffer takes the checked path
+        x.write_range(5, [1, 2, 3])
+        self.assertEqual([x[i] for i in range(5, 8)], [1, 2, 3])
+
+        with self.assertRaises(IndexError):
+            x.write_range(8, array("q", [1, 2, 3]))
+
+    def test_write_range_respects_bounds(self):
+        x = ByteArray(length=4)
+
+        with self.assertRaises(OverflowError):
+            x.write_range(0, [1, 2, 300])
+
+    def test_slice_is_lazy_view(self):
+        values = list(range(100))
+        x = IntArray.of(values)
+        view = x[10:60:5]
+
+        self.assertEqual(len(view), len(values[10:60:5]))
+        self.assertEqual(list(view), values[10:60:5])
+        self.assertEqual(view[-1], values[10:60:5][-1])
+        self.assertEqual(list(view[1:3]), values[10:60:5][1:3])
+
+        # Nothing was copied, so later writes are visible through the view
+        x[10] = -1
+        self.assertEqual(view[0], -1)
+
+    def test_view_as_bulk_source(self):
+        x = IntArray.of(list(range(20)))
+        y = IntArray(length=5)
+        y.write_range(0, x[5:10])
+
+        self.assertEqual([y[i] for i in range(5)], list(range(5, 10)))
+        self.assertEqual(list(x[5:10].copy()), list(range(5, 10)))
+
+    def test_concurrent_iteration(self):
+        values = list(range(10))
+        x = IntArray.of(values)
+        pairs = [(a, b) for a in x for b in x]
+
+        self.assertEqual(pairs, [(a, b) for a in values for b in values])
+
+    def test_chunked_iteration(self):
+        values = [x * 1.5 for x in range(37)]
+        x = DoubleArray.of(values)
+
+        for chunk in (0, 1, 8, 100):
+            self.assertEqual(list(x.iterate(chunk)), values)
+
+    def test_aggregates(self):
+        values = [5, -3, 12, 7, -3, 0, 12]
+        x = IntArray.of(values)
+
+        self.assertEqual(x.sum(), sum(values))
+        self.assertEqual(x.min(), min(values))
+        self.assertEqual(x.max(), max(values))
+        self.assertAlmostEqual(x.mean(), sum(values) / len(values))
+        self.assertEqual(x.argmin(), values.index(min(values)))
+        self.assertEqual(x.argmax(), values.index(max(values)))
+        self.assertEqual(x.count(12), values.count(12))
+        self.assertEqual(x.count(2 ** 40), 0)
+        self.assertEqual(x.index(-3), values.index(-3))
+        self.assertEqual(x.index(-3, 2), values.index(-3, 2))
+        self.assertEqual(memoryview(x.where(12)).tolist(), [2, 6])
+        self.assertEqual(x.sum(snapshot=True), sum(values))
+        self.assertEqual(x.max(snapshot=True), max(values))
+        self.assertEqual(x.argmin(snapshot=True), values.index(min(values)))
+
+        with self.assertRaises(ValueError):
+            x.index(99)
+
+    def test_index_clamps_like_list(self):
+        values = [3, 1, 4, 1, 5]
+        x = IntArray.of(values)
+
+        self.assertEqual(x.index(1, -100), values.index(1, -100))
+        self.assertEqual(x.index(1, -2), values.index(1, -2))
+        self.assertEqual(x.index(5, 2, 100), values.index(5, 2, 100))
+
+        with self.assertRaises(ValueError):
+            x.index(3, 10)
+
+    def test_search_compares_by_value(self):
+        x = IntArray.of([1, 2, 2, 3])
+
+        self.assertEqual(x.count(2.0), 2)
+        self.assertEqual(x.index(3.0), 3)
+        self.assertEqual(memoryview(x.where(2.0)).tolist(), [1, 2])
+        self.assertEqual(x.count(2.5), 0)
+        self.assertEqual(x.count(Fraction(5, 2)), 0)
+        self.assertEqual(x.count(Fraction(2)), 2)
+        self.assertEqual(x.index(Fraction(3)), 3)
+
+        y = FloatArray.of([0.5, 0.1])
+        self.assertEqual(y.count(0.1), list(y).count(0.1))
+        self.assertEqual(y.count(0.5), 1)
+
+    def test_aggregates_of_empty_array(self):
+        x = DoubleArray(length=0)
+
+        self.assertEqual(x.sum(), 0)
+        self.assertEqual(x.count(1.0), 0)
+
+        for fn in (x.min, x.max, x.argmin, x.argmax, x.mean):
+            with self.assertRaises(ValueError):
+                fn()
+
+    def test_sum_does_not_overflow(self):
+        x = LongArray.of([2 ** 62] * 8)
+        self.assertEqual(x.sum(), 2 ** 65)
+
+        x = ULongArray.of([2 ** 63] * 4)
+        self.assertEqual(x.sum(), 2 ** 65)
+
+    def test_elementwise_scalar(self):
+        x = IntArray.of([1, 2, 3, 4])
+
+        x.add(5)
+        self.assertEqual(list(x), [6, 7, 8, 9])
+        x.mul(2)
+        self.assertEqual(list(x), [12, 14, 16, 18])
+        x.sub(2)
+        self.assertEqual(list(x), [10, 12, 14, 16])
+        x.div(4)
+        self.assertEqual(list(x), [2, 3, 3, 4])
+        x.fill(-1)
+        self.assertEqual(list(x), [-1] * 4)
+
+    def test_elementwise_array(self):
+        x = DoubleArray.of([1.0, 2.0, 3.0])
+        y = DoubleArray.of([0.5, 0.5, 2.0])
+
+        x.mul(y)
+        self.assertEqual(list(x), [0.5, 1.0, 6.0])
+
+        with self.assertRaises(ValueError):
+            x.add(DoubleArray.of([1.0]))
+
+    def test_elementwise_overflow_leaves_array_unchanged(self):
+        x = ByteArray.of([1, 100, 2])
+
+        with self.assertRaises(OverflowError):
+            x.add(50)
+        with self.assertRaises(UnderflowError):
+            x.mul(-2)
+        with self.assertRaises(ZeroDivisionError):
+            x.div(0)
+
+        self.assertEqual(list(x), [1, 100, 2])
+
+    def test_clip(self):
+        x = LongArray.of([-5, 0, 5, 10])
+
+        x.clip(0, 6)
+        self.assertEqual(list(x), [0, 0, 5, 6])
+        x.clip(upper=1)
+        self.assertEqual(list(x), [0, 0, 1, 1])
+
+        with self.assertRaises(ValueError):
+            x.clip(3, 2)
+
+    def test_clip_to_bounds_beyond_the_type(self):
+        x = ByteArray.of([-128, 0, 127])
+
+        x.clip(lower=-1000, upper=1000)
+        self.assertEqual(list(x), [-128, 0, 127])
+        x.clip(lower=-1000, upper=5)
+        self.assertEqual(list(x), [-128, 0, 5])
+
+        with self.assertRaises(OverflowError):
+            x.clip(lower=1000)
+
+    def test_copy_is_independent(self):
+        x = ShortArray.of([1, 2, 3])
+        y = x.copy()
+        x[0] = 9
+
+        self.assertEqual(list(y), [1, 2, 3])
+
+    def test_of_sources(self):
+        values = list(range(10))
+
+        self.assertEqual(list(LongArray.of(array("q", values))), values)
+        self.assertEqual(list(LongArray.of(memoryview(array("q", values)))), values)
+        self.assertEqual(list(LongArray.of(array("b", values))), values)
+        self.assertEqual(list(LongArray.of(x for x in values)), values)
+        self.assertEqual(list(LongArray.of(iter(values), chunk=3)), values)
+        self.assertEqual(list(IntArray.of(x * 1.0 for x in values)), values)
+
+        with self.assertRaises(OverflowError):
+            ByteArray.of(x * 100 for x in values)
+
+    def test_validate(self):
+        x = UByteArray(length=4)
+
+        x.validate([0, 255, 3.7])
+        x.validate(array("B", [1, 2, 3]))
+
+        with self.assertRaisesRegex(OverflowError, "index 2"):
+            x.validate([1, 2, 256, -1])
+        with self.assertRaisesRegex(UnderflowError, "index 1"):
+            x.validate([1, -1, 256])
+        with self.assertRaises(TypeError):
+            x.validate(["1"])
+
+        # Wider buffers, as NumPy makes by default, are checked natively
+        x.validate(array("q", [0, 255]))
+        x.validate(array("d", [-0.5, 255.9]))
+
+        with self.assertRaisesRegex(OverflowError, "index 1"):
+            x.validate(array("q", [0, 256]))
+        with self.assertRaisesRegex(UnderflowError, "index 0"):
+            x.validate(array("d", [-1.0, 3.0]))
+        with self.assertRaisesRegex(OverflowError, "index 2"):
+            x.validate(array("i", [0, 1, 256]))
+
+    def test_bulk_write_is_validated_first(self):
+        x = ULongArray(length=3)
+
+        with self.assertRaises(OverflowError):
+            x.write_range(0, [1, 2, 2 ** 64])
+
+        self.assertEqual(list(x), [0, 0, 0])
+
+        x[0] = 2 ** 64 - 1
+        self.assertEqual(x[0], 2 ** 64 - 1)
+
 if __name__ == '__main__':
     unittest.main()
@@ -25,7 +25,8 @@ provided you also meet the terms and conditions of the Application license.
 
 import unittest
 
-from mds.managed import Namespace, String
+import mds
+from mds.managed import Int, Long, Namespace, Path, String, path_cache
 
 class TestNamespaces(unittest.TestCase):
 
@@ -44,6 +45,84 @@ class TestNamespaces(unittest.TestCase):
     def test_can_update(self):
         pass
 
+    def test_resolved_children_are_reused(self):
+        root = Namespace.root()
+        child = root.resolve(Path.of("cache/test/ns"))
+
+        self.assertIs(root.resolve(Path.of("cache/test/ns")), child)
+
+        root.resolve(Path.of("cache/test")).invalidate("ns")
+        self.assertIsNot(root.resolve(Path.of("cache/test/ns")), child)
+
+        child = root.resolve(Path.of("cache/test/ns"))
+        root.invalidate()
+        self.assertIsNot(root.resolve(Path.of("cache/test/ns")), child)
+
+    def test_bind_and_lookup_many(self):
+        root = Namespace.root()
+        paths = ["bulk/a", "bulk/b", "bulk/nested/c"]
+
+        root.bind_many(dict(zip(paths, [1, 2, 3])), dtype=mds.typing.primitives.int)
+        found = root.lookup_many(paths + ["bulk/missing"], dtype=mds.typing.primitives.int)
+
+        self.assertEqual([x.python_value for x in found[:3]], [1, 2, 3])
+        self.assertIsNone(found[3])
+
+        # Without a dtype, each value's own type is used
+        root.bind_many([("bulk/d", Long(4)), ("bulk/e", Int(5))])
+        self.assertEqual(root.lookup_many(["bulk/d"], dtype=mds.typing.primitives.long)[0].python_value, 4)
+
+        with self.assertRaises(TypeError):
+            root.bind_many({"bulk/f": 6})
+
+    def test_bind_many_checks_everything_first(self):
+        root = Namespace.root()
+        int_t = mds.typing.primitives.int
+
+        with self.assertRaises(OverflowError):
+            root.bind_many({"checked/a": 1, "checked/nested/b": 2 ** 40}, dtype=int_t)
+        with self.assertRaises(TypeError):
+            root.bind_many([("checked/a", Int(1)), ("checked/other/s", String("s"))])
+
+        self.assertEqual(root.lookup_many(["checked/a"], dtype=int_t), [None])
+
+    def test_typed_bindings_are_reused(self):
+        binding = Namespace.root()["typed/x"]
+        int_t = mds.typing.primitives.int
+        typed = binding.as_type(int_t)
+
+        self.assertIs(binding.as_type(int_t), typed)
+        self.assertIs(binding.as_array(int_t), binding.as_type(mds.typing.arrays.int))
+        self.assertIsNot(binding.as_type(mds.typing.primitives.long), typed)
+
+        with self.assertRaises(TypeError):
+            binding.as_type(int)
+
+
+class TestPaths(unittest.TestCase):
+
+    def test_parse(self):
+        p = Path.of("/a/b//c/")
+        self.assertTrue(p.is_absolute)
+        self.assertEqual([str(x) for x in p.names], ["a", "b", "c"])
+
+        p = Path.of("a/./b/..")
+        self.assertFalse(p.is_absolute)
+        self.assertEqual([str(x) for x in p.names], ["a"])
+
+    def test_str(self):
+        self.assertEqual(str(Path.of("/a/b//c/")), "/a/b/c")
+        self.assertEqual(str(Path.of("../../a/b")), "../../a/b")
+
+    def test_parsed_paths_are_cached(self):
+        path_cache.clear()
+
+        first = Path.of("cache/test/path")
+        self.assertIs(Path.of("cache/test/path"), first)
+        self.assertIs(Path.of(String("cache/test/path")), first)
+        self.assertEqual(path_cache.info().hits, 2)
+        self.assertEqual(path_cache.info().misses, 1)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -25,8 +25,11 @@ provided you also meet the terms and conditions of the Application license.
 
 import unittest
 
+from array import array
+from threading import Thread
+
 import mds
-from mds.managed import Record, declare_field
+from mds.managed import BoolArray, IntArray, Record, RecordArray, StringArray, declare_field
 
 class ExampleRecord(Record, ident="PythonTest::ExampleRecord"):
     """
@@ -88,6 +91,39 @@ class ComplexRecord(Record, ident="schema_ComplexRecord"):
         }
 
 
+class ProductRecord(Record, ident="schema_ProductRecord"):
+
+    @staticmethod
+    def schema() -> dict:
+        return {
+            "sku": declare_field(mds.typing.primitives.long),
+            "price": declare_field(mds.typing.primitives.double),
+            "stock": declare_field(mds.typing.primitives.int)
+        }
+
+
+class DepartmentRecord(Record, ident="schema_DepartmentRecord"):
+
+    @staticmethod
+    def schema() -> dict:
+        return {
+            "name": declare_field(mds.typing.composites.string),
+            "code": declare_field(mds.typing.primitives.int, make_const=True)
+        }
+
+
+class StockedProductRecord(Record, ident="schema_StockedProductRecord"):
+
+    @staticmethod
+    def schema() -> dict:
+        return {
+            "sku": declare_field(mds.typing.primitives.long),
+            "dept": declare_field(mds.typing.composites.record[DepartmentRecord]),
+            "aliases": declare_field(mds.typing.arrays.string),
+            "variants": declare_field(mds.typing.arrays.record[ProductRecord])
+        }
+
+
 class TestRecords(unittest.TestCase):
 
     RECORDS = [SimpleRecord, LessSimpleRecord, ComplexRecord]
@@ -112,6 +148,232 @@ class TestRecords(unittest.TestCase):
     def test_can_make_complex(self):
         self.__create_and_test(ComplexRecord)
 
+    def __make_products(self, n):
+        products = RecordArray(length=n, record_type=ProductRecord)
+
+        for i in range(n):
+            record = ProductRecord()
+            record.sku.write(1000 + i)
+            record.price.write(i * 0.5)
+            record.stock.write(i % 7)
+            products[i] = record
+
+        return products
+
+    def test_member_read_write(self):
+        record = ProductRecord()
+        member = record.stock
+
+        member.write(5)
+        self.assertEqual(member.read(), 5)
+
+        record.stock += 3
+        self.assertIs(record.stock, member)
+        self.assertEqual(record.stock.read(), 8)
+
+    def test_members_share_the_declared_field(self):
+        a, b = ProductRecord(), ProductRecord()
+        a.sku.write(1)
+        b.sku.write(2)
+
+        self.assertEqual((a.sku.read(), b.sku.read()), (1, 2))
+
+    def test_members_are_bound_lazily(self):
+        record = ProductRecord()
+        self.assertNotIn("price", record.__dict__)
+
+        member = record.price
+        self.assertIs(record.__dict__["price"], member)
+        self.assertIs(record.price, member)
+
+    def test_record_array_elements(self):
+        products = self.__make_products(3)
+
+        self.assertIsInstance(products[1], ProductRecord)
+        self.assertEqual(products[1].sku.read(), 1001)
+
+    def test_column(self):
+        n = 50
+        products = self.__make_products(n)
+        stock = products.column("stock")
+
+        self.assertIsInstance(stock, IntArray)
+        self.assertEqual(list(stock), [i % 7 for i in range(n)])
+
+        with self.assertRaises(KeyError):
+            products.column("colour")
+
+    def test_to_columns(self):
+        n = 10
+        columns = self.__make_products(n).to_columns(["sku", "price"])
+
+        self.assertEqual(list(columns["sku"]), [1000 + i for i in range(n)])
+        self.assertEqual(list(columns["price"]), [i * 0.5 for i in range(n)])
+
+    def test_bool_column(self):
+        flags = [i % 3 == 0 for i in range(7)]
+        records = RecordArray(length=len(flags), record_type=ExampleRecord)
+
+        for i, flag in enumerate(flags):
+            record = ExampleRecord()
+            record.is_active.write(flag)
+            records[i] = record
+
+        column = records.to_columns(["is_active"])["is_active"]
+
+        self.assertIsInstance(column, BoolArray)
+        self.assertEqual(list(column), flags)
+        self.assertEqual(list(records.column("is_active")), flags)
+
+    def test_create_many(self):
+        n = 20
+        products = ProductRecord.create_many(
+            n,
+            sku=array("q", range(n)),
+            price=[i * 2.5 for i in range(n)]
+        )
+
+        self.assertIsInstance(products, RecordArray)
+        self.assertEqual(len(products), n)
+        self.assertIs(products.record_type, ProductRecord)
+        self.assertEqual(products[3].sku.read(), 3)
+        self.assertEqual(list(products.column("price")), [i * 2.5 for i in range(n)])
+
+    def test_create_many_checks_columns(self):
+        with self.assertRaises(ValueError):
+            ProductRecord.create_many(3, sku=[1, 2])
+        with self.assertRaises(TypeError):
+            ProductRecord.create_many(2, colour=[1, 2])
+        with self.assertRaises(OverflowError):
+            ProductRecord.create_many(1, stock=[2 ** 40])
+
+    def test_type_is_created_once(self):
+        decl = SimpleRecord().type_decl
+        handles = set()
+
+        def create():
+            for _ in range(100):
+                SimpleRecord()
+                handles.add(id(decl.ensure_created()))
+
+        threads = [Thread(target=create) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(len(handles), 1)
+
+    def test_field_table(self):
+        fields = ProductRecord().type_decl.fields
+
+        self.assertEqual(fields.labels, ("sku", "price", "stock"))
+        self.assertEqual(fields.kinds[1], mds.typing.primitives.double)
+        self.assertIs(fields["price"], fields[1])
+        self.assertIs(fields[-1], ProductRecord.stock.field)
+        self.assertEqual(fields.index("stock"), 2)
+
+        with self.assertRaises(KeyError):
+            fields["colour"]
+        with self.assertRaises(IndexError):
+            fields[3]
+
+    def test_access_by_label_and_index(self):
+        product = ProductRecord()
+        product["sku"] = 42
+        product[1] = 9.5
+
+        self.assertEqual(product.sku.read(), 42)
+        self.assertEqual(product[0], 42)
+        self.assertEqual(product["price"], 9.5)
+
+    def test_read_and_write_fields(self):
+        product = ProductRecord()
+        product.write_fields({"sku": 7, 1: 2.5}, stock=3)
+
+        self.assertEqual(product.read_fields(), (7, 2.5, 3))
+        self.assertEqual(product.read_fields(["stock", "sku"]), (3, 7))
+        self.assertEqual(product.read_fields([-1], snapshot=True), (3,))
+
+        # Nothing is written if any of the labels is unknown
+        with self.assertRaises(KeyError):
+            product.write_fields(sku=8, colour=1)
+        with self.assertRaises(TypeError):
+            product.read_fields("sku")
+
+        self.assertEqual(product.sku.read(), 7)
+
+    def test_string_and_record_fields(self):
+        dept = DepartmentRecord()
+        dept.name.write("Hardware")
+
+        product = StockedProductRecord()
+        self.assertIsNone(product.dept.read())
+
+        product.dept.write(dept)
+        self.assertEqual(str(product.dept.name.read()), "Hardware")
+        self.assertIsInstance(product["dept"], DepartmentRecord)
+
+        with self.assertRaises(TypeError):
+            product.dept.write(ProductRecord())
+
+    def test_string_and_record_field_references(self):
+        dept = DepartmentRecord()
+        name = dept.name._field_ref()
+        name.write("Tools")
+        self.assertEqual(str(name.read()), "Tools")
+
+        product = StockedProductRecord()
+        ref = product.dept._field_ref()
+        ref.write(dept)
+        self.assertIsInstance(ref.read(), DepartmentRecord)
+        self.assertEqual(str(ref.read().name.read()), "Tools")
+
+    def test_string_and_record_fields_are_not_gathered(self):
+        self.assertIsNone(DepartmentRecord.name.field.get_array_type())
+        self.assertIsNone(StockedProductRecord.dept.field.get_array_type())
+
+        depts = RecordArray(length=1, record_type=DepartmentRecord)
+        depts[0] = DepartmentRecord()
+
+        with self.assertRaises(TypeError):
+            depts.column("name")
+
+    def test_array_fields(self):
+        product = StockedProductRecord()
+        product.aliases.write(StringArray(length=2))
+        product.variants.write(RecordArray(length=3, record_type=ProductRecord))
+
+        self.assertEqual(len(product.aliases.read()), 2)
+        self.assertIs(product.variants.read().record_type, ProductRecord)
+
+    def test_const_fields(self):
+        dept = DepartmentRecord()
+
+        with self.assertRaises(TypeError):
+            dept.code.write(3)
+        with self.assertRaises(TypeError):
+            dept["code"] = 3
+        with self.assertRaises(TypeError):
+            dept.code += 1
+        with self.assertRaises(TypeError):
+            dept.code._field_ref().write(3)
+
+        self.assertEqual(dept.code._field_ref().read(), dept.code.read())
+
+        dept = DepartmentRecord.create_many(1, code=[3])[0]
+        self.assertEqual(dept.code.read(), 3)
+
+    def test_schema_is_checked(self):
+        with self.assertRaises(TypeError):
+            declare_field(mds.typing.composites.record)
+
+        with self.assertRaises(TypeError):
+            class BadRecord(Record, ident="schema_BadRecord"):
+                @staticmethod
+                def schema():
+                    return {"sku": mds.typing.primitives.long}
+
     def test_can_bind_to_namespace(self):
         pass
 
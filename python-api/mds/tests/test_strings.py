@@ -72,6 +72,14 @@ class TestString(unittest.TestCase):
         for i in indexes:
             self.assertEqual(self.unicode[i], self.mdsstring[i])
 
+    def test_slice(self):
+        for item in (slice(2, 9), slice(None, None, -1), slice(1, -1, 3)):
+            view = self.mdsstring[item]
+
+            self.assertEqual(len(view), len(self.unicode[item]))
+            self.assertEqual("".join(view), self.unicode[item])
+            self.assertEqual(str(view.copy()), self.unicode[item])
+
     def test_consistent_hashes(self):
         S = [String(self.unicode) for x in range(50)]
         H = [hash(s) for s in S]
@@ -100,6 +108,29 @@ class TestString(unittest.TestCase):
         with self.assertRaises(TypeError):
             self.mdsstring * 5.7
 
+    def test_cache(self):
+        capacity = string_cache.capacity
+        string_cache.clear()
+
+        try:
+            string_cache.capacity = 2
+
+            for value in ("a", "b", "a", "c", "b"):
+                self.assertEqual(str(String(value)), value)
+
+            # "b" was evicted by "c", being the least recently used
+            self.assertEqual(string_cache.info(), CacheInfo(hits=1, misses=4, size=2, capacity=2))
+        finally:
+            string_cache.capacity = capacity
+
+    def test_decoded_once(self):
+        s = String(self.bytes)
+
+        self.assertIs(str(s), str(s))
+        self.assertEqual(str(s.upper()), self.unicode.upper())
+        self.assertEqual(s.find("test"), self.unicode.find("test"))
+        self.assertEqual(str(String("naïve".encode("utf-8"))), "naïve")
+
     def test_subtract(self):
         with self.assertRaises(TypeError):
             self.mdsstring - "test"
@@ -107,17 +138,46 @@ class TestString(unittest.TestCase):
         with self.assertRaises(TypeError):
             self.mdsstring - 240
 
-    @unittest.skip("Not Implemented")
     def test_rmul(self):
-        pass
+        self.assertEqual(str(3 * self.mdsstring), 3 * self.unicode)
+        self.assertEqual(str(-1 * self.mdsstring), "")
+
+    def test_add_str(self):
+        self.assertEqual(str(self.mdsstring + "!"), self.unicode + "!")
+        self.assertEqual(str("> " + self.mdsstring), "> " + self.unicode)
+        self.assertIsInstance("> " + self.mdsstring, String)
+
+    def test_non_ascii(self):
+        s = String("naïve café")
+
+        self.assertEqual(str(s + s), "naïve café" * 2)
+        self.assertEqual(str(s * 2), "naïve café" * 2)
+        self.assertEqual(str(s[6:].copy()), "café")
 
     @unittest.skip("Not Implemented")
     def test_mod(self):
         pass
 
-    @unittest.skip("Not Implemented")
     def test_richcmp(self):
-        pass
+        a, b = String("apple"), String("banana")
+
+        self.assertTrue(a < b)
+        self.assertTrue(a <= String("apple"))
+        self.assertTrue(b > a)
+        self.assertTrue(a != b)
+        self.assertEqual(a, String("apple"))
+        self.assertEqual(a, "apple")
+        self.assertEqual("apple", a)
+        self.assertNotEqual(a, "pear")
+        self.assertNotEqual(a, 5)
+        self.assertEqual(sorted([b, a, String("cherry")]), [a, b, String("cherry")])
+
+        with self.assertRaises(TypeError):
+            a < 5
+
+    def test_hash_matches_str(self):
+        self.assertEqual(hash(self.mdsstring), hash(self.unicode))
+        self.assertEqual(len({String("x"), String("x"), "x"}), 1)
 
     @unittest.skip("Not Implemented")
     def test_sizeof(self):